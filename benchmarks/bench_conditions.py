@@ -0,0 +1,93 @@
+"""검색 조건 벤치마크: 기관명·금액 조건을 받은 뒤에만 거를 때와 API 요청에 넣을 때의 트래픽 비교
+
+    python benchmarks/bench_conditions.py [--days 21] [--per-day 1000] [--categories 입찰공고 사전규격 통합]
+                                          [--query 공사]
+
+가짜 data.go.kr 서버를 띄우고, 같은 검색어·기간을 조건 몇 가지로 검색한다.
+  - 로컬만: 조건을 요청에 넣지 않고 검색어로 받은 공고를 모두 받아 로컬에서 거른다 (이전 방식).
+  - 요청에 넣기: API가 받는 조건(SearchConditions.query_params)을 요청 파라미터로 보낸다.
+응답 캐시는 쓰지 않는다. 서버가 받은 요청 수·보낸 바이트와 결과 건수를 출력하고,
+두 방식의 결과 공고가 다르면 종료 코드 1.
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import narasearch_engine as engine
+from narasearch_engine import CATEGORY_FIELD, SearchConditions, SearchError, notice_key, search
+from fake_data_go_kr import fetch_stats, spawn_server
+
+CATEGORIES = ['입찰공고', '사전규격', '통합']
+CONDITIONS = [
+    dict(institution='의왕'),
+    dict(demand_institution='서울'),
+    dict(min_amount=300000000),
+    dict(institution='의왕|서울', min_amount=100000000),
+    dict(demand_institution='서울', max_amount=50000000),
+]
+
+
+class LocalOnlyConditions(SearchConditions):
+    """비교용: 이전처럼 조건을 요청에 넣지 않고 받은 뒤에만 거른다"""
+
+    def query_params(self, category):
+        return ''
+
+
+def run(category, query, conditions, start_dt, end_dt, url):
+    before = fetch_stats(url)
+    started = time.perf_counter()
+    try:
+        items = search(category, query, start_dt, end_dt, 'bench-key', conditions=conditions)['items']
+    except SearchError:
+        items = []
+    elapsed = time.perf_counter() - started
+    after = fetch_stats(url)
+    keys = {(item.get(CATEGORY_FIELD, category), notice_key(item.get(CATEGORY_FIELD, category), item))
+            for item in items}
+    return after['requests'] - before['requests'], after['bytes'] - before['bytes'], keys, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--days', type=int, default=21, help='검색 기간(일)')
+    parser.add_argument('--per-day', type=int, default=1000, help='가짜 서버의 하루 입찰공고 수')
+    parser.add_argument('--categories', nargs='+', default=CATEGORIES, choices=CATEGORIES)
+    parser.add_argument('--query', default='공사', help='검색어')
+    args = parser.parse_args()
+
+    end_dt = datetime.now().replace(second=0, microsecond=0)
+    start_dt = end_dt - timedelta(days=args.days)
+    print(f"{start_dt:%Y-%m-%d} ~ {end_dt:%Y-%m-%d} '{args.query}', 하루 입찰공고 {args.per_day:,}건")
+
+    failed = False
+    with spawn_server('--per-day', str(args.per_day)) as url:
+        engine.set_api_base(url)
+        for category in args.categories:
+            print(f"[{category}]")
+            totals = {'로컬만': [0, 0], '요청에 넣기': [0, 0]}
+            for condition in CONDITIONS:
+                print(f"  {', '.join(SearchConditions(**condition).labels)}")
+                results = {}
+                for label, make in (('로컬만', LocalOnlyConditions), ('요청에 넣기', SearchConditions)):
+                    requests, sent, keys, elapsed = run(category, args.query, make(**condition), start_dt, end_dt, url)
+                    results[label] = keys
+                    totals[label][0] += requests
+                    totals[label][1] += sent
+                    print(f"    {label:<8} 요청 {requests:4,}회  {sent / 2 ** 20:7.2f} MB  결과 {len(keys):6,}건  "
+                          f"({elapsed:.2f}초)")
+                if results['로컬만'] != results['요청에 넣기']:
+                    print("    결과 공고가 다릅니다")
+                    failed = True
+            before, after = totals['로컬만'], totals['요청에 넣기']
+            print(f"  줄어든 양: 요청 {1 - after[0] / max(before[0], 1):.1%}, 바이트 {1 - after[1] / max(before[1], 1):.1%}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""응답 해석 벤치마크: 이전(본문 str → 공고 원본 dict 전체 보관)과 필드 줄이기(bytes → 필요한 필드만) 비교
+
+    python benchmarks/bench_decode.py [--rows 20000] [--categories 입찰공고 사전규격] [--memory]
+
+fake_data_go_kr.py와 같은 공고로 999행짜리 응답 페이지를 미리 만들어 두고, 검색처럼 페이지마다
+해석해서 공고를 모은 뒤 결과 표(build_result)까지 만든다. 네트워크는 빼고 해석·보관만 잰다.
+--memory를 주면 tracemalloc으로 최대 메모리 사용량과 끝났을 때 남아 있는 메모리도 잰다 (그만큼 느려진다).
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import narasearch_engine as engine
+from narasearch_engine import CATEGORY_API, ROWS_PER_PAGE, build_result, loads_json, project_items
+from fake_data_go_kr import RESPONSE_HEAD, NoticeGenerator
+
+SERVICE = {'입찰공고': 'getBidPblancListInfoServcPPSSrch', '사전규격': 'getPublicPrcureThngInfoServcPPSSrch'}
+
+
+def make_pages(category, rows):
+    """가짜 서버와 같은 형식의 응답 본문(bytes) 목록 (ROWS_PER_PAGE행씩)"""
+    generator = NoticeGenerator(per_day=400)
+    blobs = []
+    day = datetime(2026, 1, 1)
+    while len(blobs) < rows:
+        blobs += [blob for *_, blob in generator.day_items(SERVICE[category], day)]
+        day += timedelta(days=1)
+    blobs = blobs[:rows]
+    pages = []
+    for start in range(0, rows, ROWS_PER_PAGE):
+        page = blobs[start:start + ROWS_PER_PAGE]
+        pages.append(RESPONSE_HEAD + b','.join(page)
+                     + f'],"numOfRows":{ROWS_PER_PAGE},"totalCount":{rows}'.encode('ascii') + b'}}}')
+    return pages
+
+
+def legacy_items(content, category):
+    """비교용: 이전 request_json(res.json())과 fetch_page — 본문을 str로 풀고 원본 dict를 그대로 둔다"""
+    data = json.loads(content.decode('utf-8'))
+    return data['response']['body']['items']
+
+
+def projected_items(content, category):
+    """지금 request_json·fetch_page — bytes를 바로 해석하고 필요한 필드만 남긴다"""
+    data = loads_json(content)
+    return project_items(data['response']['body']['items'], CATEGORY_API[category]['fields'])
+
+
+def run(decode, pages, category):
+    items = []
+    for content in pages:
+        items.extend(decode(content, category))
+    return items, build_result(items, category)
+
+
+def measure(decode, pages, category, memory):
+    if memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    result = run(decode, pages, category)
+    elapsed = time.perf_counter() - started
+    current, peak = tracemalloc.get_traced_memory() if memory else (None, None)
+    if memory:
+        tracemalloc.stop()
+    del result
+    return elapsed, current, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[20000])
+    parser.add_argument('--categories', nargs='+', default=list(SERVICE), choices=list(SERVICE))
+    parser.add_argument('--memory', action='store_true', help='최대 메모리 사용량도 측정')
+    args = parser.parse_args()
+
+    loads_json(b'{}')
+    engine.pd.DataFrame()       # pandas 로드 시간·메모리가 첫 측정에 섞이지 않게
+    print(f"JSON 해석기: {engine._json_loads.__module__}")
+    for category in args.categories:
+        for rows in args.rows:
+            pages = make_pages(category, rows)
+            size = sum(len(content) for content in pages)
+            print(f"[{category}] {rows:,}행  응답 {len(pages)}쪽 {size / 2 ** 20:.1f} MB  "
+                  f"(필드 {len(CATEGORY_API[category]['fields'])}개만 남김)")
+            for label, decode in (('이전 (원본 전체)', legacy_items), ('필드 줄이기', projected_items)):
+                elapsed, current, peak = measure(decode, pages, category, args.memory)
+                line = f"  {label:<12} {elapsed:7.2f} 초"
+                if peak is not None:
+                    line += f"   최대 메모리 {peak / 2 ** 20:7.1f} MB   보관 {current / 2 ** 20:7.1f} MB"
+                print(line)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""결과 저장 벤치마크: 이전 to_excel(통합문서 전체를 메모리에)과 스트리밍 저장 비교
+
+    python benchmarks/bench_export.py [--rows 20000 100000] [--memory]
+
+--memory를 주면 tracemalloc으로 최대 메모리 사용량도 잰다 (그만큼 느려진다).
+먼저 JSON Lines 저장이 여러 덩어리(EXPORT_CHUNK_ROWS)에 걸쳐도 줄마다 json.loads로 읽히고
+행 수가 맞는지 확인하며, 맞지 않으면 종료 코드 1.
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+
+from narasearch_engine import EXCEL_DATETIME_FORMAT, EXPORT_CHUNK_ROWS, export_frame, parquet_supported
+from bench_table_model import make_frame
+
+
+def legacy_xlsx(df, stream):
+    """비교용: 이전 search_save의 pandas.to_excel"""
+    with pd.ExcelWriter(stream, engine='openpyxl', datetime_format=EXCEL_DATETIME_FORMAT) as writer:
+        df.to_excel(writer, index=False)
+
+
+def check_jsonl(rows=EXPORT_CHUNK_ROWS * 2 + 1):
+    """JSON Lines로 저장한 뒤 줄마다 다시 읽어 행 수·값이 그대로인지 확인한다 (덩어리 경계의 빈 줄 등)"""
+    df = make_frame(rows)
+    stream = io.BytesIO()
+    export_frame(df, stream, 'jsonl')
+    lines = stream.getvalue().decode('utf-8').split('\n')
+    if lines[-1] == '':
+        lines.pop()
+    try:
+        records = [json.loads(line) for line in lines]
+    except ValueError as e:
+        return f"읽을 수 없는 줄이 있습니다: {e}"
+    if len(records) != rows:
+        return f"행 수가 다릅니다: {rows:,}행을 저장했는데 {len(records):,}줄"
+    if [r['입찰공고번호'] for r in records] != df['입찰공고번호'].tolist():
+        return "공고번호 순서가 다릅니다"
+    return None
+
+
+def measure(func, df, memory):
+    with tempfile.TemporaryFile() as f:
+        if memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        func(df, f)
+        elapsed = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1] if memory else None
+        if memory:
+            tracemalloc.stop()
+        size = f.tell()
+    return elapsed, peak, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[20000, 100000])
+    parser.add_argument('--memory', action='store_true', help='최대 메모리 사용량도 측정')
+    args = parser.parse_args()
+
+    problem = check_jsonl()
+    print(f"JSON Lines 다시 읽기: {problem or '이상 없음'}")
+    if problem:
+        return 1
+
+    cases = [('이전 to_excel', legacy_xlsx)]
+    for fmt in ('xlsx', 'csv', 'jsonl') + (('parquet',) if parquet_supported() else ()):
+        cases.append((f"스트리밍 {fmt}", lambda df, f, fmt=fmt: export_frame(df, f, fmt)))
+
+    for rows in args.rows:
+        df = make_frame(rows)
+        print(f"{rows:,}행")
+        for label, func in cases:
+            elapsed, peak, size = measure(func, df, args.memory)
+            line = f"  {label:<14} {elapsed:7.2f} 초   {size / 2 ** 20:6.1f} MB"
+            if peak is not None:
+                line += f"   최대 메모리 {peak / 2 ** 20:7.1f} MB"
+            print(line)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
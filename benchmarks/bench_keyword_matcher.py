@@ -0,0 +1,76 @@
+"""검색어 필터 벤치마크: 이전 중첩 루프와 KeywordMatcher 비교
+
+    python benchmarks/bench_keyword_matcher.py [--rows 20000] [--repeat 5]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from narasearch_engine import KeywordMatcher
+
+TITLE_FIELD = 'bidNtceNm'
+QUERIES = ["철도 도로", "철도 도로 의왕", "철도|도로 -유지보수"]
+
+
+def legacy_filter(items, keywords):
+    """비교용: 이전 SearchWorker.run의 중첩 루프 (AND만 지원)"""
+    final_items = []
+    for item in items:
+        title = item.get(TITLE_FIELD, '')
+        title_clean = title.replace(" ", "").lower()
+        is_match = True
+        for k in keywords:
+            k_clean = k.replace(" ", "").lower()
+            if k_clean not in title_clean:
+                is_match = False
+                break
+        if is_match:
+            final_items.append(item)
+    return final_items
+
+
+def make_items(rows):
+    rnd = random.Random(rows)
+    words = ["철도", "도로", "용역", "유지보수", "어린이", "축제", "의왕", "시스템", "구축", "건설",
+             "2026년", "정비", "Smart", "ICT", "설계"]
+    return [{TITLE_FIELD: " ".join(rnd.sample(words, 6))} for _ in range(rows)]
+
+
+def best_of(repeat, func):
+    best = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    items = make_items(args.rows)
+    print(f"제목 {args.rows:,}건, {args.repeat}회 중 최소 시간")
+    for query in QUERIES:
+        matcher = KeywordMatcher(query)
+        new_time, new_result = best_of(args.repeat, lambda: matcher.filter(items, TITLE_FIELD))
+        line = f"  {query:<20} 매처 {new_time * 1000:7.1f} ms ({len(new_result):,}건)"
+        if '|' not in query and '-' not in query:
+            keywords = query.split()
+            old_time, old_result = best_of(args.repeat, lambda: legacy_filter(items, keywords))
+            assert len(old_result) == len(new_result)
+            line += f"   이전 루프 {old_time * 1000:7.1f} ms   ({old_time / new_time:4.1f}배)"
+        print(line)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""검색 결과 메모리 벤치마크: 이전 df1(화면)·df2(저장) 복사본과 ResultFrame 하나 + 컬럼 보기 비교
+
+    python benchmarks/bench_result_frame.py [--rows 20000] [--categories 입찰공고 사전규격 통합]
+
+프로그램처럼 999행 페이지마다 결과 표를 만들어 표 모델에 붙이고, 검색이 끝나면 저장용 데이터를
+준비한 뒤 남아 있는 메모리(tracemalloc)와 걸린 시간을 잰다. 공고(items)는 두 방식이 똑같이
+가지고 있으므로 측정 전에 만들어 둔다. 화면이 없는 환경에서는 QT_QPA_PLATFORM=offscreen.
+"""
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+if not os.environ.get('DISPLAY') and sys.platform.startswith('linux'):
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+from PyQt5.QtWidgets import QApplication
+
+import narasearch_v1 as app_module
+from narasearch_engine import (BATCH_LABEL_FIELD, CATEGORY_API, CATEGORY_FIELD, COMBINED_CATEGORY, ROWS_PER_PAGE,
+                               UNIFIED_COLUMNS, UNIFIED_FILE_COLUMNS, apply_column_types, build_result)
+from bench_decode import make_pages, projected_items
+
+CATEGORIES = ['입찰공고', '사전규격', COMBINED_CATEGORY]
+
+
+def legacy_build_frames(items, category, with_export=True):
+    """비교용: 이전 build_frames (화면용 df1과 저장용 df2를 각각 타입 변환해 따로 만든다)"""
+    df = pd.DataFrame(items)
+    if category == COMBINED_CATEGORY:
+        parts = []
+        for each, part in df.groupby(CATEGORY_FIELD, sort=False):
+            api = CATEGORY_API[each]
+            columns = dict(api['unified_fields'])
+            columns.update(zip(api['file_fields'], UNIFIED_FILE_COLUMNS))
+            part = apply_column_types(part.reindex(columns=list(columns), fill_value=''))
+            part = part.rename(columns=columns).reindex(columns=UNIFIED_COLUMNS, fill_value='')
+            part['구분'] = each
+            parts.append(part)
+        df1 = pd.concat(parts).sort_index().reset_index(drop=True)
+        hidden_cols = ['상세링크'] + UNIFIED_FILE_COLUMNS
+        df2 = None
+        if with_export:
+            df2 = df1[[c for c in UNIFIED_COLUMNS if c not in hidden_cols] + ['상세링크']].copy()
+        return df1, df2, hidden_cols
+
+    api = CATEGORY_API[category]
+    file_cols = api['file_fields']
+    df1 = apply_column_types(df.reindex(columns=list(api['display_columns']) + file_cols, fill_value=''))
+    df1 = df1.rename(columns=api['display_columns'])
+    df2 = None
+    if with_export:
+        save_cols = [c for c in api['export_columns'] if c in df.columns]
+        df2 = apply_column_types(df[save_cols].copy())
+        df2 = df2.rename(columns=api['export_columns'])
+    if '상세링크' not in df1.columns:
+        df1['상세링크'] = ''
+    if BATCH_LABEL_FIELD in df.columns:
+        df1.insert(0, '검색어', df[BATCH_LABEL_FIELD].to_numpy())
+        if df2 is not None:
+            df2.insert(0, '검색어', df[BATCH_LABEL_FIELD].to_numpy())
+    return df1, df2, ['상세링크'] + file_cols
+
+
+def legacy_search(pages, items, category):
+    """이전 handle_page · handle_success: 페이지별 df1을 모델에 붙이고, 끝나면 전체로 df2를 다시 만든다"""
+    model = frames = None
+    for page in pages:
+        df1, _, _ = legacy_build_frames(page, category, with_export=False)
+        if model is None:
+            model, frames = app_module.PandasModel(df1), [df1]
+        else:
+            model.append_frame(df1)
+            frames.append(df1)
+    display_df = pd.concat(frames, ignore_index=True)     # 이전 PandasModel.dataframe()
+    _, df2, _ = legacy_build_frames(items, category)
+    return model, display_df, df2
+
+
+def current_search(pages, items, category):
+    """지금 handle_page · handle_success: 페이지마다 ResultFrame에 이어 붙이고 보기만 만든다"""
+    result = model = None
+    for page in pages:
+        part = build_result(page, category)
+        if model is None:
+            result, model = part, app_module.PandasModel(part.display())
+        else:
+            result.extend(part)
+            model.append_frame(part.display())
+    result.frame    # 정렬·저장·우클릭 때처럼 페이지들을 한 번 합친다
+    return model, result, result.export()
+
+
+def make_items(category, rows):
+    if category != COMBINED_CATEGORY:
+        return [item for content in make_pages(category, rows) for item in projected_items(content, category)]
+    items = []
+    for each in CATEGORY_API:
+        for content in make_pages(each, rows // 2):
+            for item in projected_items(content, each):
+                item[CATEGORY_FIELD] = each
+                items.append(item)
+    items.sort(key=lambda item: item.get('bidNtceDt') or item.get('rcptDt'))
+    return items
+
+
+def measure(search, pages, items, category):
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    kept = search(pages, items, category)
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return elapsed, current, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[20000])
+    parser.add_argument('--categories', nargs='+', default=CATEGORIES, choices=CATEGORIES)
+    args = parser.parse_args()
+
+    _qt_app = QApplication.instance() or QApplication(sys.argv)
+    build_result(make_items('입찰공고', 10), '입찰공고').display()    # pandas·모델 준비가 측정에 섞이지 않게
+    for category in args.categories:
+        for rows in args.rows:
+            items = make_items(category, rows)
+            pages = [items[i:i + ROWS_PER_PAGE] for i in range(0, len(items), ROWS_PER_PAGE)]
+            print(f"[{category}] {len(items):,}행 ({len(pages)}쪽)")
+            for label, search in (('이전 df1·df2', legacy_search), ('ResultFrame', current_search)):
+                elapsed, current, peak = measure(search, pages, items, category)
+                print(f"  {label:<12} {elapsed:7.2f} 초   남은 메모리 {current / 2 ** 20:7.1f} MB   "
+                      f"최대 {peak / 2 ** 20:7.1f} MB")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,198 @@
+"""검색 벤치마크: 가짜 data.go.kr 서버로 검색 전체(요청 → 해석 → 필터 → 표)를 측정
+
+    python benchmarks/bench_search.py [--days 90] [--per-day 120] [--latency 0.3] [--fail-rate 0.05]
+                                      [--queries 도로 "철도|교량" "공사 -설계"] [--worker] [--api-base URL]
+
+검색유형(입찰공고·사전규격·통합)과 검색어마다 빈 캐시로 한 번(cold), 같은 캐시로 한 번 더(warm)
+검색해 전체 시간·받은 건수·단계별 시간(SearchTimings)·서버가 받은 요청 수를 출력한다.
+--worker를 주면 엔진 함수 대신 프로그램과 같은 SearchWorker(QThread)로 검색하고 페이지마다
+PandasModel에 붙여 넣어, 첫 페이지가 표에 보이기까지의 시간도 잰다 (화면이 없는 환경에서는
+QT_QPA_PLATFORM=offscreen). --api-base를 주면 서버를 띄우지 않고 그 주소(예: --replay로 띄운
+fake_data_go_kr.py)를 쓴다. 실제 API 주소를 주면 인증키가 필요하다 (--service-key).
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+if not os.environ.get('DISPLAY') and sys.platform.startswith('linux'):
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import narasearch_engine as engine
+from narasearch_engine import (COMBINED_CATEGORY, KeywordMatcher, NoticeStore, ResponseCache, SearchError,
+                               SearchTimings, search, search_params)
+from fake_data_go_kr import fetch_stats, spawn_server
+
+CATEGORIES = ['입찰공고', '사전규격', COMBINED_CATEGORY]
+DEFAULT_QUERIES = ['도로', '철도|교량', '공사 -설계']
+_app = None     # --worker일 때 한 번만 만드는 QApplication
+
+
+def prepare_worker():
+    """QApplication과 프로그램 모듈을 미리 만들어 둔다 (첫 검색 시간에 import·pandas 로드가 섞이지 않게)"""
+    global _app
+    from PyQt5.QtWidgets import QApplication
+    import narasearch_v1 as app_module
+
+    _app = QApplication.instance() or QApplication(sys.argv)
+    engine.pd.DataFrame()
+    return app_module
+
+
+def search_with_engine(category, query, start_dt, end_dt, service_key, cache, store, timings):
+    """엔진 search()로 검색 (헤드리스 수집기·명령줄과 같은 경로)"""
+    result = search(category, query, start_dt, end_dt, service_key, cache=cache, store=store, timings=timings)
+    return len(result['items']), None
+
+
+def search_with_worker(category, query, start_dt, end_dt, service_key, cache, store, timings):
+    """프로그램과 같은 SearchWorker로 검색하고 페이지마다 표 모델에 붙인다. (건수, 첫 표시 시간)"""
+    from PyQt5.QtCore import QEventLoop
+
+    app_module = prepare_worker()
+    params_base = search_params(service_key)
+    matcher = KeywordMatcher(query)
+    if category == COMBINED_CATEGORY:
+        worker = app_module.CombinedSearchWorker(params_base, matcher, start_dt, end_dt, cache=cache, store=store,
+                                                 timings=timings)
+    else:
+        worker = app_module.SearchWorker(category, params_base, matcher, start_dt, end_dt, cache=cache,
+                                         store=store, timings=timings)
+    state = {'result': None, 'model': None, 'first_ms': None, 'items': None, 'error': None}
+    loop = QEventLoop()
+
+    def on_page(data):
+        if not data['items']:
+            return
+        with timings.measure('frame'):
+            page = engine.build_result(data['items'], data['category'])
+        with timings.measure('model'):
+            if state['model'] is None:
+                state['result'] = page
+                state['model'] = app_module.PandasModel(page.display())
+                state['first_ms'] = timings.total * 1000
+            else:
+                state['result'].extend(page)
+                state['model'].append_frame(page.display())
+
+    def on_result(data):
+        state['items'] = data['items']
+        loop.quit()
+
+    def on_error(message):
+        state['error'] = message
+        loop.quit()
+
+    worker.page_signal.connect(on_page)
+    worker.result_signal.connect(on_result)
+    worker.error_signal.connect(on_error)
+    worker.start()
+    loop.exec_()
+    worker.wait()
+    _app.processEvents()
+    if state['error']:
+        raise SearchError(state['error'])
+    return len(state['items']), state['first_ms']
+
+
+def stats_delta(before, after):
+    if before is None or after is None:
+        return ''
+    errors = {kind: count - before['errors'].get(kind, 0) for kind, count in after['errors'].items()}
+    errors = {kind: count for kind, count in errors.items() if count}
+    line = f"요청 {after['requests'] - before['requests']}회"
+    if errors:
+        line += ' (실패 ' + ', '.join(f"{kind} {count}" for kind, count in errors.items()) + ')'
+    return line
+
+
+def run_cases(args, api_base, run_search, warm_up=False):
+    engine.set_api_base(api_base)
+    end_dt = datetime.now().replace(hour=23, minute=59, second=0, microsecond=0)
+    start_dt = (end_dt - timedelta(days=args.days - 1)).replace(hour=0, minute=0)
+    print(f"{api_base}  {start_dt:%Y-%m-%d} ~ {end_dt:%Y-%m-%d} ({args.days}일)")
+    if warm_up:
+        # 가짜 서버가 날짜별 공고를 처음 만드는 시간과 첫 연결·정규식 준비를 측정에서 뺀다
+        for category in args.categories:
+            try:
+                search(category, args.queries[0], start_dt, end_dt, args.service_key)
+            except SearchError:
+                pass
+
+    def server_stats():
+        try:
+            return fetch_stats(api_base)
+        except OSError:
+            return None     # 실제 API·다른 서버에는 /stats가 없다
+
+    failed = False
+    for category in args.categories:
+        for query in args.queries:
+            folder = tempfile.mkdtemp(prefix='bench_search_')
+            try:
+                cache = ResponseCache(os.path.join(folder, 'cache.db'))
+                store = NoticeStore(os.path.join(folder, 'cache.db'))
+                print(f"[{category}] {query}")
+                for label in ('cold', 'warm'):
+                    timings = SearchTimings()
+                    before = server_stats()
+                    try:
+                        count, first_ms = run_search(category, query, start_dt, end_dt, args.service_key,
+                                                     cache, store, timings)
+                    except SearchError as e:
+                        print(f"  {label}  실패: {str(e).splitlines()[0]}")
+                        failed = True
+                        break
+                    timings.finish()
+                    line = f"  {label}  {timings.total:7.2f} 초  {count:7,}건"
+                    if first_ms is not None:
+                        line += f"  첫 표시 {first_ms:7.1f} ms"
+                    delta = stats_delta(before, server_stats())
+                    if delta:
+                        line += f"  {delta}"
+                    print(line)
+                    if args.verbose:
+                        print(f"        {timings.summary()}")
+            finally:
+                shutil.rmtree(folder, ignore_errors=True)
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--days', type=int, default=90, help='검색 기간 (오늘까지 며칠)')
+    parser.add_argument('--per-day', type=int, default=120, help='가짜 서버의 날짜·검색유형별 공고 수')
+    parser.add_argument('--latency', type=float, default=0.3, help='가짜 서버의 요청마다 지연(초)')
+    parser.add_argument('--fail-rate', type=float, default=0.0, help='가짜 서버가 실패를 낼 비율 (재시도 경로 측정)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--categories', nargs='+', default=CATEGORIES, choices=CATEGORIES)
+    parser.add_argument('--queries', nargs='+', default=DEFAULT_QUERIES)
+    parser.add_argument('--worker', action='store_true', help='SearchWorker(QThread)와 표 모델까지 포함해 측정')
+    parser.add_argument('--api-base', default=None, help='가짜 서버를 띄우지 않고 이 주소로 검색')
+    parser.add_argument('--service-key', default='bench-key')
+    parser.add_argument('-v', '--verbose', action='store_true', help='단계별 시간 요약도 출력')
+    args = parser.parse_args()
+
+    # 실패를 흉내 낼 때 재시도 대기로 시간이 늘지 않게 (재시도 횟수는 그대로)
+    engine.BACKOFF_BASE = min(engine.BACKOFF_BASE, 0.05)
+    run_search = search_with_engine
+    if args.worker:
+        prepare_worker()
+        run_search = search_with_worker
+    if args.api_base:
+        return run_cases(args, args.api_base, run_search)
+
+    server_args = ['--per-day', str(args.per_day), '--latency', str(args.latency), '--seed', str(args.seed)]
+    if args.fail_rate:
+        server_args += ['--fail-rate', str(args.fail_rate)]
+    with spawn_server(*server_args) as url:
+        return run_cases(args, url, run_search, warm_up=True)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
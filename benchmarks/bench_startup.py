@@ -0,0 +1,79 @@
+"""시작 시간 벤치마크: 프로그램을 여러 번 띄워 창이 보이기까지의 단계별 시간 측정
+
+    python benchmarks/bench_startup.py [--runs 5] [--budget 1000] [--exe dist/narasearch_v1/narasearch_v1.exe]
+
+매 실행마다 `narasearch_v1.py --startup-report=json`을 새 프로세스로 띄워, 창이 뜬 시점과
+단계별 시간(import · 화면 불러오기 · DB 초기화 · 화면 구성 …)을 받아 중앙값을 출력한다.
+'프로세스 시작부터'는 인터프리터 기동까지 포함한 시간이다. --budget(ms)을 넘으면
+종료 코드 1을 돌려주므로 회귀 확인용으로 쓸 수 있다. 화면이 없는 환경에서는
+QT_QPA_PLATFORM=offscreen으로 실행된다. 설정 DB(ui/narasearchdata.db)는 임시 폴더에 복사해
+NARASEARCH_DB · NARASEARCH_CACHE_DB로 넘기므로 원본이 migration되거나 바뀌지 않는다.
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SETTINGS_DB = os.path.join(ROOT, 'ui', 'narasearchdata.db')
+
+
+def run_once(command, env):
+    started = time.time()
+    output = subprocess.run(command, cwd=ROOT, env=env, capture_output=True, text=True,
+                            encoding='utf-8', timeout=120).stdout
+    for line in output.splitlines():
+        if line.startswith('{'):
+            report = json.loads(line)
+            report['launch_ms'] = (report['window_shown_at'] - started) * 1000
+            return report
+    raise RuntimeError(f"시작 시간 보고를 받지 못했습니다:\n{output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget', type=float, default=None, help='프로세스 시작부터 창 표시까지 허용 시간(ms)')
+    parser.add_argument('--exe', default=None, help='빌드한 실행 파일로 측정 (기본: 현재 파이썬으로 소스 실행)')
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    if not env.get('DISPLAY') and sys.platform.startswith('linux'):
+        env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    env.pop('PYTHONDONTWRITEBYTECODE', None)   # 배포본처럼 .pyc를 쓰도록
+    command = [args.exe] if args.exe else [sys.executable, os.path.join(ROOT, 'narasearch_v1.py')]
+    command.append('--startup-report=json')
+
+    folder = tempfile.mkdtemp(prefix='bench_startup_')
+    try:
+        env['NARASEARCH_DB'] = os.path.join(folder, 'narasearchdata.db')
+        env['NARASEARCH_CACHE_DB'] = os.path.join(folder, 'narasearchcache.db')
+        if os.path.exists(SETTINGS_DB):
+            shutil.copy(SETTINGS_DB, env['NARASEARCH_DB'])
+        run_once(command, env)   # 첫 실행은 .pyc 생성·디스크 캐시·복사본 migration 때문에 버린다
+        reports = [run_once(command, env) for _ in range(args.runs)]
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+    print(f"{args.runs}회 실행 중앙값")
+    for stage in reports[0]['stages_ms']:
+        print(f"  {stage:<14} {statistics.median(r['stages_ms'][stage] for r in reports):8.1f} ms")
+    window = statistics.median(r['window_ms'] for r in reports)
+    launch = statistics.median(r['launch_ms'] for r in reports)
+    preload = statistics.median(r['preload_ms'] for r in reports)
+    print(f"  창 표시까지      {window:8.1f} ms (프로세스 시작부터 {launch:.1f} ms)")
+    print(f"  백그라운드 로드   {preload:8.1f} ms (pandas·numpy·requests, 창이 뜬 뒤)")
+
+    if args.budget is not None and launch > args.budget:
+        print(f"기준 {args.budget:.0f} ms 초과")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
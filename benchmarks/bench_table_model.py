@@ -0,0 +1,161 @@
+"""결과 테이블 모델 벤치마크: 첫 화면 표시 시간, 스크롤 처리량, 정렬·결과 내 필터 시간
+
+    python benchmarks/bench_table_model.py [--rows 20000 100000] [--legacy]
+
+--legacy를 주면 예전 방식(셀마다 iloc·str()·QFont 생성, 전체 행
+resizeRowsToContents)과 함께 측정해 비교한다. 화면이 없는 환경에서는
+QT_QPA_PLATFORM=offscreen으로 실행된다.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+if not os.environ.get('DISPLAY') and sys.platform.startswith('linux'):
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+import numpy as np
+from PyQt5.QtCore import Qt, QAbstractTableModel
+from PyQt5.QtGui import QFont
+from PyQt5.QtWidgets import QApplication, QTableView
+
+import narasearch_v1 as app_module
+
+SCROLL_STEPS = 200
+SORT_COLUMNS = ['배정예산금액', '입찰마감일시', '공고기관명']
+FILTERS = [('배정예산금액', '>= 50억'), ('입찰마감일시', '< 2026-11-10'), ('공고기관명', '의왕|철도'),
+           ('입찰공고명', '철도 -유지보수')]
+
+
+class LegacyPandasModel(QAbstractTableModel):
+    """비교용: 이전 버전의 셀 단위 iloc 모델"""
+
+    def __init__(self, data):
+        QAbstractTableModel.__init__(self)
+        self._data = data
+
+    def rowCount(self, parent=None):
+        return self._data.shape[0]
+
+    def columnCount(self, parent=None):
+        return self._data.shape[1]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return str(self._data.iloc[index.row(), index.column()])
+        elif role == Qt.FontRole:
+            font = QFont()
+            font.setPointSize(14)
+            col_name = self._data.columns[index.column()]
+            if col_name in ['입찰공고명', '입찰개시일시', '품명(사업명)', '접수일시']:
+                font.setBold(True)
+            return font
+        elif role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    def headerData(self, col, orientation, role):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._data.columns[col]
+        return None
+
+
+def make_frame(rows):
+    rnd = random.Random(rows)
+    words = ["철도", "도로", "용역", "유지보수", "어린이", "축제", "의왕", "시스템", "구축", "건설"]
+    return pd.DataFrame({
+        '입찰공고번호': [f"R26BK{i:08d}" for i in range(rows)],
+        '입찰공고일시': pd.to_datetime([f"2026-10-{1 + i % 28:02d} 10:{i % 60:02d}:00" for i in range(rows)]),
+        '입찰공고명': [" ".join(rnd.sample(words, 4)) for _ in range(rows)],
+        '공고기관명': [rnd.choice(["서울특별시", "의왕시", "국토교통부", "한국철도공사"]) for _ in range(rows)],
+        '계약체결방법명': [rnd.choice(["제한경쟁", "일반경쟁", "수의계약"]) for _ in range(rows)],
+        '입찰개시일시': pd.to_datetime([f"2026-10-{1 + i % 28:02d} 09:00:00" for i in range(rows)]),
+        '입찰마감일시': pd.to_datetime([f"2026-11-{1 + i % 28:02d} 18:00:00" for i in range(rows)]),
+        '배정예산금액': np.array([rnd.randint(1, 10 ** 10) for _ in range(rows)], dtype=float),
+    })
+
+
+def bench(label, model_factory, frame, legacy):
+    view = QTableView()
+    view.setStyleSheet("QTableView::item { padding: 18px; }")
+    view.resize(1600, 900)
+    view.show()
+    QApplication.processEvents()
+
+    started = time.perf_counter()
+    model = model_factory(frame)
+    view.setModel(model)
+    if legacy:
+        view.resizeColumnsToContents()
+        view.resizeRowsToContents()
+    else:
+        view.horizontalHeader().setResizeContentsPrecision(app_module.RESIZE_SAMPLE_ROWS)
+        view.resizeColumnsToContents()
+        view.resizeRowToContents(0)
+        view.verticalHeader().setDefaultSectionSize(view.rowHeight(0))
+    view.viewport().repaint()
+    first_paint = time.perf_counter() - started
+
+    bar = view.verticalScrollBar()
+    step = max(1, bar.maximum() // SCROLL_STEPS)
+    started = time.perf_counter()
+    for i in range(SCROLL_STEPS):
+        bar.setValue(i * step)
+        view.viewport().repaint()
+    scroll = time.perf_counter() - started
+
+    print(f"{label:<10} {len(frame):>7,}행  첫 표시 {first_paint * 1000:8.1f} ms   "
+          f"스크롤 {SCROLL_STEPS / scroll:7.1f} 화면/초")
+    if not legacy:
+        bench_sort_filter(view, model)
+    view.close()
+    view.deleteLater()
+    QApplication.processEvents()
+
+
+def timed(func):
+    started = time.perf_counter()
+    func()
+    QApplication.processEvents()
+    return (time.perf_counter() - started) * 1000
+
+
+def bench_sort_filter(view, model):
+    """헤더 정렬(첫 번째·두 번째 클릭)과 결과 내 필터 적용 시간"""
+    columns = model.column_names()
+    for name in SORT_COLUMNS:
+        col = columns.index(name)
+        first = timed(lambda: view.sortByColumn(col, Qt.AscendingOrder))
+        again = timed(lambda: view.sortByColumn(col, Qt.DescendingOrder))
+        print(f"    정렬 {name:<10} 첫 정렬 {first:6.1f} ms   반대 방향 {again:6.1f} ms")
+    view.sortByColumn(-1, Qt.AscendingOrder)
+    for name, text in FILTERS:
+        view.scrollToTop()
+        elapsed = timed(lambda: model.set_filter(columns.index(name), text))
+        print(f"    필터 {name} '{text}' {elapsed:6.1f} ms ({model.rowCount():,}행)")
+        model.set_filter(-1, '')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[20000, 100000])
+    parser.add_argument('--legacy', action='store_true', help='이전 모델과 함께 측정')
+    args = parser.parse_args()
+
+    _qt_app = QApplication.instance() or QApplication(sys.argv)
+    for rows in args.rows:
+        frame = make_frame(rows)
+        bench('현재 모델', app_module.PandasModel, frame, legacy=False)
+        if args.legacy:
+            bench('이전 모델', LegacyPandasModel, frame, legacy=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
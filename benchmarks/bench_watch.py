@@ -0,0 +1,130 @@
+"""저장단어 감시 벤치마크: 같은 저장단어를 하루 동안 여러 번 확인할 때 API 트래픽 비교
+
+    python benchmarks/bench_watch.py [--interval 30] [--begin 09:00] [--end 18:00] [--per-day 1000]
+                                     [--categories 입찰공고 사전규격] [--queries 도로 "철도|교량" ...]
+
+가짜 data.go.kr 서버를 띄우고, 오늘 --begin부터 --end까지 --interval분마다 저장단어를 확인하는
+하루를 흉내 낸다 (시각은 흉내만 내므로 바로 끝난다).
+  - 3주 재검색: 이전처럼 매번 [저장단어 전체 검색]을 3주 기간으로 다시 돌린다. 응답 캐시를 쓰되,
+    확인 간격이 최근 날짜 캐시 유지 시간(10분)보다 길므로 오늘·어제는 매번 다시 받는다.
+  - 감시: poll_watchlist로 마지막 확인 이후 기간만 받는다.
+서버가 받은 요청 수·보낸 바이트, 검색마다 다룬 공고 수(캐시에서 꺼낸 것 포함)와 알린 새 공고 수를
+출력한다. 두 방식이 알린 새 공고 수가 다르면 종료 코드 1.
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import narasearch_engine as engine
+from narasearch_engine import (KeywordMatcher, NoticeStore, ResponseCache, SettingsStore, notice_key, poll_watchlist,
+                               search_params, search_shortcuts)
+from fake_data_go_kr import fetch_stats, spawn_server
+
+CATEGORIES = ['입찰공고', '사전규격']
+DEFAULT_QUERIES = ['도로', '철도|교량', '공사 -설계', '정보시스템', '스마트시티', '하수관로', '데이터센터', '의왕',
+                   'CCTV', '학교 -임차']
+
+
+def poll_times(args):
+    today = datetime.now().replace(second=0, microsecond=0)
+    begin = datetime.combine(today.date(), datetime.strptime(args.begin, '%H:%M').time())
+    end = datetime.combine(today.date(), datetime.strptime(args.end, '%H:%M').time())
+    times = []
+    while begin <= end:
+        times.append(begin)
+        begin += timedelta(minutes=args.interval)
+    return times
+
+
+def rerun_3weeks(category, params_base, queries, times, folder):
+    """이전 방식: 확인할 때마다 3주 기간으로 저장단어 전체 검색, 이전 결과에 없던 공고를 새 공고로 본다"""
+    cache = ResponseCache(os.path.join(folder, 'cache.db'))
+    store = NoticeStore(os.path.join(folder, 'cache.db'))
+    known = None
+    fetched = alerted = 0
+    for now in times:
+        result = search_shortcuts(category, params_base, queries, now - timedelta(days=21), now,
+                                  cache=cache, store=store, allow_empty=True)
+        fetched += result['fetched_count']
+        keys = {notice_key(category, item) for item in result['items']}
+        if known is not None:
+            alerted += len(keys - known)
+        known = keys if known is None else known | keys
+    return fetched, alerted
+
+
+def watch(category, params_base, queries, times, folder):
+    """감시: 마지막 확인 이후 기간만 받는다 (처음 확인은 기준만 잡는다)"""
+    settings = SettingsStore(os.path.join(folder, 'settings.db'))
+    store = NoticeStore(os.path.join(folder, 'cache.db'))
+    fetched = alerted = 0
+    try:
+        for now in times:
+            result = poll_watchlist(settings, category, params_base, queries, now=now, store=store)
+            fetched += result['fetched_count']
+            alerted += len(result['items'])
+    finally:
+        settings.close()
+    return fetched, alerted
+
+
+def measure(run, url, *run_args):
+    folder = tempfile.mkdtemp(prefix='bench_watch_')
+    try:
+        before = fetch_stats(url)
+        started = time.perf_counter()
+        fetched, alerted = run(*run_args, folder)
+        elapsed = time.perf_counter() - started
+        after = fetch_stats(url)
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+    return after['requests'] - before['requests'], after['bytes'] - before['bytes'], fetched, alerted, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--interval', type=int, default=30, help='확인 간격(분)')
+    parser.add_argument('--begin', default='09:00', help='오늘 첫 확인 시각')
+    parser.add_argument('--end', default='18:00', help='오늘 마지막 확인 시각')
+    parser.add_argument('--per-day', type=int, default=1000, help='가짜 서버의 하루 입찰공고 수')
+    parser.add_argument('--categories', nargs='+', default=CATEGORIES, choices=CATEGORIES)
+    parser.add_argument('--queries', nargs='+', default=DEFAULT_QUERIES)
+    args = parser.parse_args()
+
+    # 실제로는 확인 간격이 최근 날짜 캐시 유지 시간보다 길다 (흉내 낸 하루는 몇 초 만에 끝나므로 맞춰 준다)
+    engine.CACHE_OPEN_TTL_SECONDS = 0
+    times = poll_times(args)
+    queries = [(query, KeywordMatcher(query)) for query in args.queries]
+    params_base = search_params('bench-key')
+    print(f"{times[0]:%Y-%m-%d %H:%M} ~ {times[-1]:%H:%M} {args.interval}분마다 {len(times)}번 확인, "
+          f"저장단어 {len(queries)}개")
+
+    failed = False
+    with spawn_server('--per-day', str(args.per_day)) as url:
+        engine.set_api_base(url)
+        for category in args.categories:
+            print(f"[{category}]")
+            results = {}
+            for label, run in (('3주 재검색', rerun_3weeks), ('감시', watch)):
+                requests, sent, fetched, alerted, elapsed = measure(run, url, category, params_base, queries, times)
+                results[label] = (requests, sent, fetched, alerted)
+                print(f"  {label:<8} 요청 {requests:5,}회  {sent / 2 ** 20:8.2f} MB  다룬 공고 {fetched:7,}건  "
+                      f"새 공고 {alerted:4,}건  ({elapsed:.1f}초)")
+            before, after = results['3주 재검색'], results['감시']
+            print(f"  줄어든 양: 요청 {1 - after[0] / max(before[0], 1):.1%}, 바이트 {1 - after[1] / max(before[1], 1):.1%}, "
+                  f"다룬 공고 {1 - after[2] / max(before[2], 1):.1%}")
+            if before[3] != after[3]:
+                print(f"  새 공고 수가 다릅니다: 3주 재검색 {before[3]}건, 감시 {after[3]}건")
+                failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,472 @@
+"""공공데이터포털(data.go.kr) 나라장터 API 가짜 서버: 인증키·네트워크 없이 성능을 재기 위한 로컬 서버
+
+    python benchmarks/fake_data_go_kr.py [--port 8765] [--per-day 300] [--latency 0.3 --jitter 0.2]
+                                         [--fail-rate 0.05 --fail-kinds 500,reset,html] [--daily-limit 1000]
+    python benchmarks/fake_data_go_kr.py --record recordings --upstream http://apis.data.go.kr
+    python benchmarks/fake_data_go_kr.py --replay recordings
+
+    NARASEARCH_API_BASE=http://127.0.0.1:8765 python narasearch_v1.py
+
+입찰공고(getBidPblancListInfoServcPPSSrch)·사전규격(getPublicPrcureThngInfoServcPPSSrch)을 흉내 낸다.
+날짜마다 같은 공고가 나오도록 날짜·서비스로 시드를 정해 실제와 같은 필드 이름의 공고를 만들고,
+pageNo · numOfRows · totalCount 페이지 나누기, 검색어(bidNtceNm / prdctClsfcNoNm) 부분 일치,
+기관명 조건(ntceInsttNm · dminsttNm / rlDminsttNm) 부분 일치와 추정가격 범위(presmptPrceBgn · presmptPrceEnd),
+조회 기간이 한 달을 넘으면 "07" 오류(nkoneps.com.response.ResponseError 형태)를 돌려준다.
+인증키가 없거나 --daily-limit을 넘으면 게이트웨이의 XML 오류(SERVICE_KEY_IS_NOT_REGISTERED_ERROR,
+LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR)를 낸다.
+
+--record는 요청을 --upstream(실제 API)에 그대로 보내고 응답을 폴더에 저장하며, --replay는 저장된
+응답만 돌려준다 (없으면 404). 저장 파일 이름과 내용에는 serviceKey를 남기지 않는다.
+GET /stats는 지금까지의 요청 수·오류 수·보낸 바이트를 JSON으로 돌려준다.
+
+벤치마크에서는 spawn_server()로 별도 프로세스에 띄워 쓴다 (같은 프로세스면 GIL을 나눠 써서 측정이 흔들린다).
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+MAX_RANGE_DAYS = 31          # 이보다 긴 조회 기간은 "07" 오류
+MAX_ROWS = 999               # numOfRows 상한
+FAIL_KINDS = ('500', '503', 'reset', 'html', 'slow')
+RESPONSE_HEAD = '{"response":{"header":{"resultCode":"00","resultMsg":"정상"},"body":{"items":['.encode('utf-8')
+
+YEARS = ["2026년", "2026년도", ""]
+REGIONS = ["서울특별시", "부산광역시", "경기도", "의왕시", "수원시", "세종특별자치시", "강원특별자치도",
+           "제주특별자치도", "충청남도", "전라남도", "경상북도", "인천광역시"]
+INSTITUTIONS = ["국토교통부", "조달청", "한국철도공사", "국가철도공단", "한국도로공사", "서울특별시",
+                "경기도 의왕시", "부산광역시 해운대구", "한국수자원공사", "교육부", "행정안전부", "한국전력공사"]
+OBJECTS = ["철도", "도로", "교량", "하수관로", "어린이공원", "스마트시티", "정보시스템", "축제", "청사",
+           "학교", "상수도", "터널", "자전거도로", "CCTV", "ICT 인프라", "데이터센터"]
+WORKS = ["유지보수 용역", "건설공사", "실시설계 용역", "구축 사업", "운영 대행 용역", "물품 구매",
+         "보수공사", "정비공사", "감리 용역", "기본계획 수립 용역", "고도화 사업", "임차"]
+CONTRACT_METHODS = ["제한경쟁", "일반경쟁", "수의계약", "협상에 의한 계약", "지명경쟁"]
+BID_METHODS = ["전자입찰", "전자시담", "직찰"]
+AWARD_METHODS = ["적격심사제", "최저가낙찰제", "협상에의한계약", "종합심사낙찰제"]
+
+
+def make_title(rnd):
+    parts = [rnd.choice(YEARS), rnd.choice(REGIONS), rnd.choice(OBJECTS), rnd.choice(WORKS)]
+    return " ".join(p for p in parts if p)
+
+
+def stamp(dt):
+    return dt.strftime('%Y-%m-%d %H:%M:%S')
+
+
+def bid_notice(rnd, day, index, dt):
+    """입찰공고 항목 (getBidPblancListInfoServcPPSSrch 응답 필드)"""
+    no = f"R{day:%y}BK{int(day.strftime('%j')) * 10000 + index:08d}"
+    close = dt + timedelta(days=rnd.randint(7, 21), hours=rnd.randint(0, 8))
+    amount = rnd.choice([rnd.randint(10, 99999) * 10000, rnd.randint(1, 500) * 10 ** 7, ""])
+    files = {}
+    for i in range(1, 11):
+        present = i <= rnd.randint(1, 4)
+        files[f'ntceSpecDocUrl{i}'] = (f"https://www.g2b.go.kr/link/FileDownload?fileId={no}{i:02d}"
+                                       if present else "")
+        files[f'ntceSpecFileNm{i}'] = f"{'공고문' if i == 1 else '과업지시서'}_{no}_{i}.hwp" if present else ""
+    institution = rnd.choice(INSTITUTIONS)
+    item = {
+        'bidNtceNo': no, 'bidNtceOrd': rnd.choice(["000", "000", "000", "001"]), 'reNtceYn': "N",
+        'rgstTyNm': "조달청 또는 나라장터 자체 공고건", 'ntceKindNm': rnd.choice(["등록공고", "등록공고", "변경공고"]),
+        'intrbidYn': "N", 'bidNtceDt': stamp(dt), 'refNo': f"제{day:%Y}-{index:04d}호",
+        'bidNtceNm': make_title(rnd), 'ntceInsttCd': f"{rnd.randint(1000000, 9999999)}", 'ntceInsttNm': institution,
+        'dminsttCd': f"{rnd.randint(1000000, 9999999)}", 'dminsttNm': rnd.choice([institution, rnd.choice(INSTITUTIONS)]),
+        'bidMethdNm': rnd.choice(BID_METHODS), 'cntrctCnclsMthdNm': rnd.choice(CONTRACT_METHODS),
+        'ntceInsttOfclNm': "홍길동", 'ntceInsttOfclTelNo': f"02-{rnd.randint(100, 999)}-{rnd.randint(1000, 9999)}",
+        'ntceInsttOfclEmailAdrs': "", 'exctvNm': "", 'bidQlfctRgstDt': stamp(close - timedelta(days=1)),
+        'cmmnSpldmdAgrmntRcptdocMethd': "", 'cmmnSpldmdAgrmntClseDt': "", 'cmmnSpldmdCorpRgnLmtYn': "N",
+        'bidBeginDt': stamp(dt + timedelta(days=1)), 'bidClseDt': stamp(close),
+        'opengDt': stamp(close + timedelta(hours=1)), **files,
+        'rbidPermsnYn': "Y", 'pqApplDocRcptMthdNm': "", 'pqApplDocRcptDt': "", 'arsltApplDocRcptMthdNm': "",
+        'arsltApplDocRcptDt': "", 'jntcontrctDutyRgnNm1': "", 'jntcontrctDutyRgnNm2': "", 'jntcontrctDutyRgnNm3': "",
+        'rgnDutyJntcontrctRt': "", 'dtlsBidYn': "N", 'bidPrtcptLmtYn': rnd.choice(["N", "Y"]),
+        'prearngPrceDcsnMthdNm': "복수예가", 'totPrdprcNum': "15", 'drwtPrdprcNum': "4",
+        'asignBdgtAmt': str(amount), 'presmptPrce': str(int(amount / 1.1)) if amount else "",
+        'opengPlce': "국가종합전자조달시스템(나라장터)", 'dcmtgOprtnDt': "", 'dcmtgOprtnPlce': "",
+        'bidNtceDtlUrl': f"https://www.g2b.go.kr/link/PNPE027_01/single/?bidPbancNo={no}&bidPbancOrd=000",
+        'bidNtceUrl': "", 'bidPrtcptFeePaymntYn': "N", 'bidPrtcptFee': "", 'bidGrntymnyPaymntYn': "Y",
+        'crdtrNm': "", 'ppswGnrlSrvceYn': "N", 'srvceDivNm': rnd.choice(["일반용역", "기술용역", ""]),
+        'prdctClsfcLmtYn': "N", 'mnfctYn': "N", 'purchsObjPrdctList': "", 'untyNtceNo': "",
+        'cmmnSpldmdMethdCd': "", 'cmmnSpldmdMethdNm': "", 'stdNtceDocUrl': "", 'brffcBidprcPermsnYn': "N",
+        'dsgntCmptYn': "N", 'arsltCmptYn': "N", 'pqEvalYn': "N", 'tpEvalYn': "N", 'ntceDscrptYn': "N",
+        'rsrvtnPrceReMkngMthdNm': "", 'orderPlanUntyNo': "", 'sucsfbidLwltRate': rnd.choice(["87.745", "88", ""]),
+        'rgstDt': stamp(dt), 'bfSpecRgstNo': "", 'infoBizYn': "N", 'sucsfbidMthdCd': "",
+        'sucsfbidMthdNm': rnd.choice(AWARD_METHODS), 'chgDt': "", 'dminsttOfclEmailAdrs': "",
+        'indstrytyLmtYn': "Y", 'chgNtceRsn': "", 'rbidOpengDt': "", 'VAT': "", 'indutyVAT': "",
+        'rgnLmtBidLocplcJdgmBssCd': "", 'rgnLmtBidLocplcJdgmBssNm': "",
+        'pubPrcrmntLrgClsfcNm': "", 'pubPrcrmntMidClsfcNm': "", 'pubPrcrmntClsfcNo': "", 'pubPrcrmntClsfcNm': "",
+    }
+    return item
+
+
+def spec_notice(rnd, day, index, dt):
+    """사전규격 항목 (getPublicPrcureThngInfoServcPPSSrch 응답 필드)"""
+    no = f"{day:%y%m%d}{index:05d}"
+    files = {f'specDocFileUrl{i}': (f"https://www.g2b.go.kr/link/SpecDownload?specNo={no}&fileSeq={i}"
+                                    if i <= rnd.randint(1, 3) else "") for i in range(1, 6)}
+    amount = rnd.choice([rnd.randint(10, 99999) * 10000, rnd.randint(1, 500) * 10 ** 7, ""])
+    return {
+        'bfSpecRgstNo': no, 'bsnsDivNm': rnd.choice(["용역", "물품", "공사"]), 'refNo': f"사전-{index:04d}",
+        'prdctClsfcNoNm': make_title(rnd), 'orderInsttNm': rnd.choice(INSTITUTIONS),
+        'rlDminsttNm': rnd.choice(INSTITUTIONS), 'asignBdgtAmt': str(amount), 'rcptDt': stamp(dt),
+        'opninRgstClseDt': stamp(dt + timedelta(days=rnd.randint(3, 10))), 'ofclTelNo': "042-000-0000",
+        'ofclNm': "김담당", 'swBizObjYn': rnd.choice(["N", "Y"]), 'dlvrTmlmtDt': "", 'dlvrDaynum': "",
+        'bidNtceNoList': "", 'rgstDt': stamp(dt), 'chgDt': "", **files,
+        'prdctDtlList': "", 'orderInsttCd': f"{rnd.randint(1000000, 9999999)}", 'rlDminsttCd': "",
+    }
+
+
+# 서비스 이름 → (검색어 파라미터, 조회 기준 필드, 항목 생성기, 하루 공고 수 비율)
+SERVICES = {
+    'getBidPblancListInfoServcPPSSrch': ('bidNtceNm', 'bidNtceDt', bid_notice, 1.0),
+    'getPublicPrcureThngInfoServcPPSSrch': ('prdctClsfcNoNm', 'rcptDt', spec_notice, 0.5),
+}
+
+# 서비스 이름 → ([부분 일치로 거르는 파라미터(= 필드 이름)], (금액 하한 파라미터, 상한 파라미터, 금액 필드))
+CONDITIONS = {
+    'getBidPblancListInfoServcPPSSrch': (['ntceInsttNm', 'dminsttNm'], ('presmptPrceBgn', 'presmptPrceEnd', 'presmptPrce')),
+    'getPublicPrcureThngInfoServcPPSSrch': (['rlDminsttNm'], None),
+}
+
+
+class NoticeGenerator:
+    """날짜·서비스마다 항상 같은 공고를 만든다 (JSON은 미리 인코딩해 두고 페이지마다 이어 붙인다)"""
+
+    def __init__(self, per_day, seed=0):
+        self.per_day = per_day
+        self.seed = seed
+        self.day_items = lru_cache(maxsize=2048)(self._day_items)
+
+    def _day_items(self, service, day):
+        """[(YYYYMMDDHHMM, 검색어 대상 필드, {조건 필드: 값}, JSON 바이트)] (공고 일시 순)"""
+        keyword_param, date_field, make, ratio = SERVICES[service]
+        text_params, amount = CONDITIONS[service]
+        condition_fields = text_params + ([amount[2]] if amount else [])
+        rnd = random.Random(f"{self.seed}:{service}:{day:%Y%m%d}")
+        count = int(self.per_day * ratio * (0.3 if day.weekday() >= 5 else 1.0))
+        rows = []
+        for index in range(count):
+            dt = day + timedelta(hours=rnd.choice([9, 10, 11, 13, 14, 15, 16, 17, 18, 21]),
+                                 minutes=rnd.randrange(60), seconds=rnd.randrange(60))
+            item = make(rnd, day, index, dt)
+            rows.append((dt.strftime('%Y%m%d%H%M'), item[keyword_param],
+                         {field: item[field] for field in condition_fields},
+                         json.dumps(item, ensure_ascii=False).encode('utf-8')))
+        rows.sort(key=lambda row: row[0])
+        return rows
+
+    def search(self, service, begin, end, keyword, params=None):
+        """기간(YYYYMMDDHHMM, 양끝 포함)·검색어(부분 일치)·조건 파라미터에 맞는 항목 JSON 바이트 목록"""
+        begin_key, end_key = begin.strftime('%Y%m%d%H%M'), end.strftime('%Y%m%d%H%M')
+        match = self.condition_matcher(service, params or {})
+        found = []
+        day = datetime(begin.year, begin.month, begin.day)
+        while day <= end:
+            for key, text, fields, blob in self.day_items(service, day):
+                if begin_key <= key <= end_key and keyword in text and match(fields):
+                    found.append(blob)
+            day += timedelta(days=1)
+        return found
+
+    @staticmethod
+    def condition_matcher(service, params):
+        """요청 파라미터 중 이 서비스가 받는 조건으로 항목({조건 필드: 값})을 고르는 함수 (금액이 빈 항목은 뺀다)"""
+        text_params, amount = CONDITIONS[service]
+        texts = [(param, params[param]) for param in text_params if params.get(param)]
+        low = high = None
+        if amount:
+            low = int(params[amount[0]]) if params.get(amount[0]) else None
+            high = int(params[amount[1]]) if params.get(amount[1]) else None
+
+        def match(fields):
+            if any(value not in fields[param] for param, value in texts):
+                return False
+            if low is None and high is None:
+                return True
+            if not fields[amount[2]]:
+                return False
+            value = int(fields[amount[2]])
+            return (low is None or value >= low) and (high is None or value <= high)
+        return match
+
+
+def gateway_error(code, message):
+    """공공데이터포털 게이트웨이 오류 (JSON을 요청해도 XML로 온다)"""
+    return ('<OpenAPI_ServiceResponse><cmmMsgHeader><errMsg>SERVICE ERROR</errMsg>'
+            f'<returnAuthMsg>{message}</returnAuthMsg><returnReasonCode>{code}</returnReasonCode>'
+            '</cmmMsgHeader></OpenAPI_ServiceResponse>').encode('utf-8')
+
+
+def response_error(code, message):
+    """조달청 API의 오류 응답 (nkoneps.com.response.ResponseError 형태)"""
+    return json.dumps({'nkoneps.com.response.ResponseError': {
+        'header': {'resultCode': code, 'resultMsg': message}}}, ensure_ascii=False).encode('utf-8')
+
+
+def recording_key(path, query):
+    """녹화 파일 이름: serviceKey를 뺀 경로 + 정렬한 쿼리의 sha1"""
+    params = sorted((k, v) for k, v in query if k != 'serviceKey')
+    return hashlib.sha1(json.dumps([path, params], ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+class FakeDataGoKr(ThreadingHTTPServer):
+    """가짜 API 서버 (options는 build_parser()로 만든 argparse.Namespace)"""
+    daemon_threads = True
+
+    def __init__(self, options):
+        super().__init__((options.host, options.port), FakeHandler)
+        self.options = options
+        self.generator = NoticeGenerator(options.per_day, options.seed)
+        self.rnd = random.Random(options.seed)
+        self.lock = threading.Lock()
+        self.stats = {'requests': 0, 'ok': 0, 'errors': {}, 'bytes': 0, 'replay_misses': 0}
+        self.quota_used = 0
+
+    @property
+    def url(self):
+        return f"http://{self.server_address[0]}:{self.server_address[1]}"
+
+    def count(self, outcome, size=0):
+        with self.lock:
+            self.stats['requests'] += 1
+            self.stats['bytes'] += size
+            if outcome == 'ok':
+                self.stats['ok'] += 1
+            else:
+                self.stats['errors'][outcome] = self.stats['errors'].get(outcome, 0) + 1
+
+    def pick_failure(self):
+        """이번 요청에 낼 실패 종류 (없으면 None)"""
+        with self.lock:
+            if self.options.fail_rate and self.rnd.random() < self.options.fail_rate:
+                return self.rnd.choice(self.options.fail_kinds)
+        return None
+
+    def over_quota(self):
+        """인증키별이 아닌 서버 전체 기준으로 --daily-limit을 넘었는지 (요청이 들어온 순서로 센다)"""
+        with self.lock:
+            self.quota_used += 1
+            return bool(self.options.daily_limit) and self.quota_used > self.options.daily_limit
+
+    def delay(self):
+        with self.lock:
+            seconds = self.options.latency + self.rnd.uniform(0, self.options.jitter)
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def start_background(self):
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return self
+
+
+class FakeHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'     # keep-alive (프로그램은 연결을 재사용한다)
+
+    def log_message(self, *args):
+        pass
+
+    def send_body(self, status, body, content_type='application/json;charset=UTF-8', outcome='ok'):
+        options = self.server.options
+        if options.bandwidth:
+            time.sleep(len(body) / (options.bandwidth * 2 ** 20))
+        headers = {'Content-Type': content_type}
+        if options.gzip and 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body, compresslevel=5)
+            headers['Content-Encoding'] = 'gzip'
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.count(outcome, len(body))
+
+    def do_GET(self):
+        server = self.server
+        options = server.options
+        parts = urlsplit(self.path)
+        if parts.path == '/stats':
+            with server.lock:
+                body = json.dumps(server.stats, ensure_ascii=False).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        query = parse_qsl(parts.query, keep_blank_values=True)
+        if options.record:
+            return self.record(parts, query)
+        if options.replay:
+            return self.replay(parts.path, query)
+
+        if self.fail(server.pick_failure()):
+            return
+
+        params = dict(query)
+        if not params.get('serviceKey') or params['serviceKey'] in options.reject_keys:
+            return self.send_body(200, gateway_error(30, 'SERVICE_KEY_IS_NOT_REGISTERED_ERROR'),
+                                  'text/xml;charset=UTF-8', outcome='key')
+        if server.over_quota():
+            return self.send_body(200, gateway_error(22, 'LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR'),
+                                  'text/xml;charset=UTF-8', outcome='limit')
+        service = parts.path.rstrip('/').rsplit('/', 1)[-1]
+        if service not in SERVICES:
+            return self.send_body(404, gateway_error(12, 'NO_OPENAPI_SERVICE_ERROR'), 'text/xml;charset=UTF-8',
+                                  outcome='404')
+        self.send_body(200, self.search(service, params))
+
+    def fail(self, failure):
+        """실패를 흉내 낸다. 응답을 끝냈으면 True ('slow'는 늦게라도 정상 응답)"""
+        if failure == 'reset':
+            self.server.count('reset')
+            self.close_connection = True
+            self.connection.shutdown(socket.SHUT_RDWR)
+            return True
+        if failure in ('500', '503'):
+            self.send_body(int(failure), b'<html><body>Unexpected errors</body></html>', 'text/html', outcome=failure)
+            return True
+        if failure == 'html':
+            self.send_body(200, b'<html><head><title>Service Unavailable</title></head></html>', 'text/html',
+                           outcome='html')
+            return True
+        if failure == 'slow':
+            time.sleep(self.server.options.slow_seconds)
+        self.server.delay()
+        return False
+
+    def search(self, service, params):
+        try:
+            begin = datetime.strptime(params['inqryBgnDt'], '%Y%m%d%H%M')
+            end = datetime.strptime(params['inqryEndDt'], '%Y%m%d%H%M')
+            page_no = max(1, int(params.get('pageNo') or 1))
+            rows = min(MAX_ROWS, max(1, int(params.get('numOfRows') or 10)))
+        except (KeyError, ValueError):
+            return response_error('08', '필수값 입력 에러')
+        if end < begin or end - begin > timedelta(days=MAX_RANGE_DAYS):
+            return response_error('07', '입력범위값 초과 에러')
+
+        keyword_param = SERVICES[service][0]
+        try:
+            found = self.server.generator.search(service, begin, end, params.get(keyword_param, ''), params)
+        except ValueError:
+            return response_error('08', '필수값 입력 에러')
+        page = found[(page_no - 1) * rows: page_no * rows]
+        return (RESPONSE_HEAD + b','.join(page)
+                + f'],"numOfRows":{rows},"pageNo":{page_no},"totalCount":{len(found)}'.encode('ascii') + b'}}}')
+
+    def record(self, parts, query):
+        """실제 API에 그대로 보내고 응답을 --record 폴더에 저장한다."""
+        options = self.server.options
+        url = options.upstream.rstrip('/') + parts.path + ('?' + parts.query if parts.query else '')
+        try:
+            with urllib.request.urlopen(url, timeout=60) as res:
+                status, content_type, body = res.status, res.headers.get('Content-Type', ''), res.read()
+        except urllib.error.HTTPError as e:
+            status, content_type, body = e.code, e.headers.get('Content-Type', ''), e.read()
+        except OSError as e:
+            return self.send_body(502, str(e).encode('utf-8'), 'text/plain', outcome='upstream')
+        key = recording_key(parts.path, query)
+        os.makedirs(options.record, exist_ok=True)
+        with open(os.path.join(options.record, key + '.body'), 'wb') as f:
+            f.write(body)
+        with open(os.path.join(options.record, key + '.json'), 'w', encoding='utf-8') as f:
+            json.dump({'path': parts.path, 'query': [(k, v) for k, v in query if k != 'serviceKey'],
+                       'status': status, 'content_type': content_type,
+                       'recorded_at': datetime.now().isoformat(timespec='seconds')}, f, ensure_ascii=False)
+        self.send_body(status, body, content_type)
+
+    def replay(self, path, query):
+        """--replay 폴더에 저장된 응답을 돌려준다 (지연·실패 옵션도 적용)."""
+        options = self.server.options
+        key = recording_key(path, query)
+        try:
+            with open(os.path.join(options.replay, key + '.json'), encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(os.path.join(options.replay, key + '.body'), 'rb') as f:
+                body = f.read()
+        except OSError:
+            with self.server.lock:
+                self.server.stats['replay_misses'] += 1
+            return self.send_body(404, response_error('99', '녹화된 응답이 없습니다'), outcome='replay_miss')
+        if self.fail(self.server.pick_failure()):
+            return
+        self.send_body(meta['status'], body, meta['content_type'])
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765, help='0이면 빈 포트 (주소는 첫 줄에 출력)')
+    parser.add_argument('--per-day', type=int, default=300, help='하루 입찰공고 수 (사전규격은 절반, 주말은 30%%)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--latency', type=float, default=0.0, help='응답마다 기본 지연(초)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='기본 지연에 더할 0~N초 무작위 지연')
+    parser.add_argument('--bandwidth', type=float, default=0.0, help='보내는 속도 상한(MB/s, 0이면 제한 없음)')
+    parser.add_argument('--gzip', action='store_true', help='Accept-Encoding: gzip이면 압축해서 보냄')
+    parser.add_argument('--fail-rate', type=float, default=0.0, help='실패 응답 비율 (0~1)')
+    parser.add_argument('--fail-kinds', type=lambda text: [k for k in text.split(',') if k], default=['500', 'reset'],
+                        help=f"실패 종류 ({','.join(FAIL_KINDS)} 중 쉼표로)")
+    parser.add_argument('--slow-seconds', type=float, default=70.0, help="'slow' 실패의 지연(초)")
+    parser.add_argument('--daily-limit', type=int, default=0, help='이 요청 수를 넘으면 일일 한도 초과 오류')
+    parser.add_argument('--reject-keys', type=lambda text: set(text.split(',')), default=set(),
+                        help='등록되지 않은 키로 볼 serviceKey (쉼표로)')
+    parser.add_argument('--record', metavar='DIR', default=None, help='--upstream에 보내고 응답을 DIR에 저장')
+    parser.add_argument('--upstream', default='http://apis.data.go.kr', help='--record 때 보낼 실제 API 주소')
+    parser.add_argument('--replay', metavar='DIR', default=None, help='DIR에 저장된 응답만 돌려줌')
+    return parser
+
+
+@contextmanager
+def spawn_server(*argv):
+    """가짜 서버를 별도 프로세스로 띄우고 주소를 내준다 (with spawn_server('--latency', '0.2') as url:)."""
+    command = [sys.executable, os.path.abspath(__file__), '--port', '0', *argv]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    try:
+        url = process.stdout.readline().strip()
+        if not url.startswith('http'):
+            raise RuntimeError(f"가짜 서버를 띄우지 못했습니다: {' '.join(command)}")
+        yield url
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def fetch_stats(url):
+    with urllib.request.urlopen(url.rstrip('/') + '/stats', timeout=10) as res:
+        return json.loads(res.read())
+
+
+def main(argv=None):
+    options = build_parser().parse_args(argv)
+    unknown = set(options.fail_kinds) - set(FAIL_KINDS)
+    if unknown:
+        raise SystemExit(f"알 수 없는 실패 종류: {', '.join(sorted(unknown))}")
+    server = FakeDataGoKr(options)
+    print(server.url, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
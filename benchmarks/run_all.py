@@ -0,0 +1,86 @@
+"""벤치마크 모음 실행: 인터넷·인증키 없이 한 번에 돌려 결과를 한 파일로 남긴다
+
+    python benchmarks/run_all.py [--quick] [--skip startup] [--output logs/bench-<시각>.txt]
+
+각 벤치마크를 새 프로세스로 차례로 실행하고 출력을 화면과 --output 파일에 함께 쓴다.
+검색 벤치마크는 fake_data_go_kr.py 서버를 띄워서 쓰므로 실제 API를 부르지 않는다.
+--quick은 행 수·기간을 줄인 설정으로 빨리 확인할 때 쓴다. 하나라도 실패하면 종료 코드 1.
+
+startup은 narasearch_v1.py를 실제로 띄우지만, 설정 DB(ui/narasearchdata.db)의 임시 복사본을 쓰므로
+원본은 건드리지 않는다.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# (이름, 스크립트, 기본 인자, --quick 인자)
+BENCHMARKS = [
+    ('search', 'bench_search.py', [], ['--days', '30', '--latency', '0.05', '--queries', '도로', '철도|교량']),
+    ('search-worker', 'bench_search.py', ['--worker', '--queries', '도로'],
+     ['--worker', '--days', '30', '--latency', '0.05', '--queries', '도로']),
+    ('decode', 'bench_decode.py', ['--memory'], ['--rows', '5000']),
+    ('keyword', 'bench_keyword_matcher.py', [], ['--repeat', '2']),
+    ('result', 'bench_result_frame.py', [], ['--rows', '5000']),
+    ('watch', 'bench_watch.py', [], ['--interval', '60', '--per-day', '300']),
+    ('conditions', 'bench_conditions.py', [], ['--days', '7', '--per-day', '300']),
+    ('table', 'bench_table_model.py', ['--rows', '20000'], ['--rows', '20000']),
+    ('export', 'bench_export.py', ['--rows', '20000'], ['--rows', '5000']),
+    ('startup', 'bench_startup.py', [], ['--runs', '2']),
+]
+
+
+def run_benchmark(name, command, out):
+    started = time.perf_counter()
+    header = f"=== {name}: {' '.join(command[1:])}"
+    print(header, flush=True)
+    out.write(header + '\n')
+    process = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                               text=True, encoding='utf-8', errors='replace')
+    for line in process.stdout:
+        print(line, end='', flush=True)
+        out.write(line)
+    code = process.wait()
+    footer = f"--- {name}: {time.perf_counter() - started:.1f}초" + ('' if code == 0 else f", 실패 (종료 코드 {code})")
+    print(footer, flush=True)
+    out.write(footer + '\n\n')
+    return code == 0
+
+
+def main():
+    names = [name for name, *_ in BENCHMARKS]
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--quick', action='store_true', help='작은 설정으로 빨리 실행')
+    parser.add_argument('--only', nargs='+', choices=names, default=None, help='이 벤치마크만 실행')
+    parser.add_argument('--skip', nargs='+', choices=names, default=[], help='이 벤치마크는 건너뜀')
+    parser.add_argument('--output', default=None, help='결과 파일 (기본: logs/bench-<시각>.txt)')
+    args = parser.parse_args()
+
+    output = args.output or os.path.join(ROOT, 'logs', f"bench-{datetime.now():%Y%m%d-%H%M%S}.txt")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    env_note = f"{datetime.now():%Y-%m-%d %H:%M:%S}  Python {sys.version.split()[0]}  {sys.platform}"
+
+    failed = []
+    with open(output, 'w', encoding='utf-8') as out:
+        out.write(env_note + '\n\n')
+        for name, script, default_args, quick_args in BENCHMARKS:
+            if name in args.skip or (args.only and name not in args.only):
+                continue
+            command = [sys.executable, os.path.join(HERE, script)] + (quick_args if args.quick else default_args)
+            if not run_benchmark(name, command, out):
+                failed.append(name)
+
+    print(f"결과: {output}")
+    if failed:
+        print(f"실패: {', '.join(failed)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,3076 @@
+"""나라장터 검색 엔진 (PyQt5 없이 동작)
+
+API 요청·페이지 수집·검색어 필터·컬럼 정리·저장까지의 파이프라인과 명령줄 실행.
+화면(narasearch_v1.py)과 서버·작업 스케줄러에서 같이 쓴다.
+
+    python narasearch_engine.py -q "철도 -유지보수" -c 통합 --days 7 -o 결과.xlsx
+    python narasearch_engine.py -q 도로 --begin 2026-10-01 --end 2026-10-15 > 결과.jsonl
+    python narasearch_engine.py --harvest --days 7
+"""
+import sys
+import os
+import re
+import math
+import random
+import threading
+import time
+import json
+import zlib
+import sqlite3
+import argparse
+import unicodedata
+import importlib
+import importlib.util
+import hashlib
+import shutil
+from contextlib import contextmanager
+from datetime import datetime, timedelta, date
+from urllib.parse import quote, unquote, urlparse
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+
+
+class LazyModule:
+    """속성에 처음 접근할 때 실제 모듈을 import하는 대리 객체
+
+    requests·numpy·pandas는 불러오는 데만 0.5초 넘게 걸리므로, 화면은 이것들 없이
+    먼저 띄우고 첫 검색(또는 preload_modules) 때 불러온다.
+    (동적 import라 PyInstaller가 찾지 못하므로 narasearch_v1.spec의 hiddenimports에 적어 둔다)
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self.load(), attr)
+
+    def __repr__(self):
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return f"<LazyModule {self._name!r} ({state})>"
+
+requests = LazyModule('requests')
+np = LazyModule('numpy')
+pd = LazyModule('pandas')
+
+def preload_modules():
+    """지연 import한 모듈을 미리 불러온다 (창을 띄운 뒤 백그라운드에서 호출)."""
+    for module in (np, pd, requests):
+        module.load()
+
+# 환경 설정
+if getattr(sys, 'frozen', False):
+    BASE_DIR = os.path.dirname(sys.executable)
+else:
+    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+    
+# 설정 DB·캐시 DB 위치 (NARASEARCH_DB · NARASEARCH_CACHE_DB로 바꿀 수 있다: 벤치마크가 임시 복사본을 쓸 때)
+DB_PATH = os.environ.get('NARASEARCH_DB', '').strip() or os.path.join(BASE_DIR, './ui/narasearchdata.db')
+CACHE_DB_PATH = os.environ.get('NARASEARCH_CACHE_DB', '').strip() or os.path.join(BASE_DIR, './ui/narasearchcache.db')
+
+# 검색 설정
+ROWS_PER_PAGE = 999          # API 1회 요청당 최대 행 수
+MAX_PAGES = 50               # 한 번의 검색에서 가져올 최대 페이지 수 (초과 시 안내)
+MAX_CONCURRENT_PAGES = 4     # 동시에 요청할 페이지 수
+MAX_WINDOW_DAYS = 31         # API가 허용하는 최대 조회 기간(일), 넘으면 구간을 나누어 요청
+BATCH_MAX_FETCHERS = 3       # 저장단어 전체 검색 시 동시에 받아올 1차 검색어 수
+BATCH_LABEL_FIELD = 'matchedShortcuts'   # 저장단어 전체 검색 결과에서 걸린 저장단어를 적는 필드
+CANCEL_POLL_SECONDS = 0.05   # 페이지를 기다리는 동안 검색 취소를 확인하는 간격(초)
+
+# 응답 캐시 설정 (검색유형 + 1차 검색어 + 날짜 단위)
+USE_RESPONSE_CACHE = True
+CACHE_TTL_SECONDS = 7 * 24 * 3600      # 지난 날짜(마감된 날) 캐시 유지 시간
+CACHE_OPEN_TTL_SECONDS = 10 * 60       # 아직 공고가 추가될 수 있는 최근 날짜의 캐시 유지 시간
+CACHE_OPEN_DAYS = 1                    # 오늘 포함 며칠 전까지를 '최근 날짜'로 볼지 (게시 반영 지연 대비)
+CACHE_MAX_BYTES = 200 * 1024 * 1024    # 캐시 파일 크기 상한, 넘으면 오래 안 쓴 항목부터 삭제
+LOCAL_SEARCH_LIMIT = 20000             # 로컬 검색 결과 최대 건수
+
+# 헤드리스 수집기 설정 (--harvest)
+HARVEST_WINDOW_DAYS = 21               # 수집 대상 기간(오늘부터 며칠 전까지)
+HARVEST_OVERLAP_MINUTES = 30           # 지난 수집 시점보다 얼마나 앞에서부터 다시 받을지 (게시 반영 지연 대비)
+HARVEST_MAX_PAGES = 1000               # 키워드 없이 받으므로 검색보다 넉넉한 페이지 상한
+
+# 공공데이터포털 주소 (NARASEARCH_API_BASE로 바꿀 수 있다: benchmarks/fake_data_go_kr.py 같은 가짜 서버, 프록시)
+API_BASE_URL = os.environ.get('NARASEARCH_API_BASE', '').strip() or 'http://apis.data.go.kr'
+
+# 검색 유형별 API 정보 (url은 API_BASE_URL + path, set_api_base가 채운다)
+CATEGORY_API = {
+    "입찰공고": {
+        'path': '/1230000/ad/BidPublicInfoService/getBidPblancListInfoServcPPSSrch?',
+        'keyword_param': 'bidNtceNm',
+        'title_field': 'bidNtceNm',
+        'key_fields': ('bidNtceNo', 'bidNtceOrd'),     # 공고번호 + 공고차수
+        'date_field': 'bidNtceDt',                      # inqryDiv=1 조회 기준 일시
+        'text_fields': {                                # 로컬 전문 검색 색인 대상
+            'title': ['bidNtceNm'],
+            'institution': ['ntceInsttNm', 'dminsttNm'],
+            'detail': ['ntceKindNm', 'bidMethdNm', 'cntrctCnclsMthdNm', 'sucsfbidMthdNm'],
+        },
+        'unified_fields': {                             # 통합 검색 공통 컬럼
+            'bidNtceNo': '공고번호', 'bidNtceDt': '공고일시', 'bidNtceNm': '공고명',
+            'ntceInsttNm': '기관명', 'bidClseDt': '마감일시', 'asignBdgtAmt': '배정예산금액',
+            'bidNtceDtlUrl': '상세링크',
+        },
+        'display_columns': {                            # 결과 표 컬럼 (뒤에 file_fields가 숨은 컬럼으로 붙는다)
+            'bidNtceNo': '입찰공고번호', 'bidNtceDt': '입찰공고일시', 'bidNtceNm': '입찰공고명',
+            'ntceInsttNm': '공고기관명', 'cntrctCnclsMthdNm': '계약체결방법명',
+            'bidBeginDt': '입찰개시일시', 'bidClseDt': '입찰마감일시', 'asignBdgtAmt': '배정예산금액',
+            'bidNtceDtlUrl': '상세링크',
+        },
+        'export_columns': {                             # 파일로 저장하는 컬럼
+            'bidNtceNo': '입찰공고번호', 'ntceKindNm': '공고종류명', 'bidNtceDt': '입찰공고일시',
+            'bidNtceNm': '입찰공고명', 'ntceInsttNm': '공고기관명', 'dminsttNm': '수요기관명',
+            'bidMethdNm': '입찰방식명', 'cntrctCnclsMthdNm': '계약체결방법명',
+            'bidBeginDt': '입찰개시일시', 'bidClseDt': '입찰마감일시', 'bidPrtcptLmtYn': '입찰참가제한여부',
+            'asignBdgtAmt': '배정예산금액', 'presmptPrce': '추정가격', 'sucsfbidLwltRate': '낙찰하한율',
+            'sucsfbidMthdNm': '낙찰방법명',
+        },
+        'file_fields': [f'ntceSpecDocUrl{i}' for i in range(1, 11)],
+        'condition_fields': {                           # 검색 조건 → (API 요청 파라미터, 로컬에서 거를 필드)
+            'institution': ('ntceInsttNm', 'ntceInsttNm'),
+            'demand_institution': ('dminsttNm', 'dminsttNm'),
+            'amount': (('presmptPrceBgn', 'presmptPrceEnd'), 'presmptPrce'),
+        },
+    },
+    "사전규격": {
+        'path': '/1230000/ao/HrcspSsstndrdInfoService/getPublicPrcureThngInfoServcPPSSrch?',
+        'keyword_param': 'prdctClsfcNoNm',
+        'title_field': 'prdctClsfcNoNm',
+        'key_fields': ('bfSpecRgstNo',),
+        'date_field': 'rcptDt',
+        'text_fields': {
+            'title': ['prdctClsfcNoNm'],
+            'institution': ['orderInsttNm', 'rlDminsttNm'],
+            'detail': ['refNo', 'ofclNm'],
+        },
+        'unified_fields': {
+            'bfSpecRgstNo': '공고번호', 'rcptDt': '공고일시', 'prdctClsfcNoNm': '공고명',
+            'orderInsttNm': '기관명', 'opninRgstClseDt': '마감일시', 'asignBdgtAmt': '배정예산금액',
+        },
+        'display_columns': {
+            'bfSpecRgstNo': '사전규격등록번호', 'rcptDt': '접수일시', 'prdctClsfcNoNm': '품명(사업명)',
+            'orderInsttNm': '발주기관명', 'rlDminsttNm': '실수요기관명',
+            'opninRgstClseDt': '의견등록마감일시', 'asignBdgtAmt': '배정예산금액',
+        },
+        'export_columns': {
+            'bfSpecRgstNo': '사전규격등록번호', 'refNo': '참조번호', 'rcptDt': '접수일시',
+            'prdctClsfcNoNm': '품명(사업명)', 'orderInsttNm': '발주기관명', 'rlDminsttNm': '실수요기관명',
+            'opninRgstClseDt': '의견등록마감일시', 'asignBdgtAmt': '배정예산금액',
+            'ofclNm': '담당자명', 'ofclTelNo': '담당자전화번호', 'dlvrTmlmtDt': '납품기한일시',
+        },
+        'file_fields': [f'specDocFileUrl{i}' for i in range(1, 6)],
+        'condition_fields': {                           # 요청 파라미터가 None이면 받은 뒤 로컬에서만 거른다
+            'institution': (None, 'orderInsttNm'),
+            'demand_institution': ('rlDminsttNm', 'rlDminsttNm'),
+            'amount': (None, 'asignBdgtAmt'),
+        },
+    },
+}
+
+def projected_fields(api):
+    """API 응답에서 남길 필드: 공고 키·일시·제목, 로컬 검색 색인, 검색 조건, 화면·저장·통합·첨부파일 컬럼"""
+    fields = [*api['key_fields'], api['date_field'], api['title_field']]
+    for names in api['text_fields'].values():
+        fields.extend(names)
+    fields += [field for _, field in api['condition_fields'].values()]
+    fields += [*api['display_columns'], *api['export_columns'], *api['unified_fields'], *api['file_fields']]
+    return tuple(dict.fromkeys(fields))
+
+# 페이지를 해석하자마자 이 필드만 남긴다 (입찰공고 응답은 공고마다 필드가 100개 가까이 된다)
+for _api in CATEGORY_API.values():
+    _api['fields'] = projected_fields(_api)
+
+def set_api_base(base):
+    """모든 검색 유형의 요청 주소를 base(예: http://127.0.0.1:8765) 아래로 바꾼다."""
+    for api in CATEGORY_API.values():
+        api['url'] = base.rstrip('/') + api['path']
+
+set_api_base(API_BASE_URL)
+
+# 통합 검색: 입찰공고·사전규격을 동시에 받아 공통 컬럼으로 보여준다
+COMBINED_CATEGORY = "통합"
+CATEGORY_FIELD = 'noticeCategory'       # 통합 검색 결과에서 공고의 검색유형을 적는 필드
+UNIFIED_FILE_COLUMNS = [f'첨부파일{i}' for i in range(1, 11)]
+UNIFIED_COLUMNS = ['구분', '공고번호', '공고일시', '공고명', '기관명', '마감일시', '배정예산금액',
+                   '상세링크'] + UNIFIED_FILE_COLUMNS
+
+# HTTP 전송 설정
+CONNECT_TIMEOUT = 5          # 접속 제한 시간(초)
+READ_TIMEOUT = 60            # 응답 대기 제한 시간(초)
+MAX_RETRIES = 4              # 일시적 오류 시 재시도 횟수
+BACKOFF_BASE = 0.5           # 재시도 대기 시간 기준(초), 시도마다 2배
+BACKOFF_MAX = 10             # 재시도 대기 시간 상한(초)
+HTTP_POOL_SIZE = 16          # 호스트당 유지할 연결 수
+
+# 재시도해도 소용없는 공공데이터포털 게이트웨이 오류
+FATAL_GATEWAY_ERRORS = {
+    'SERVICE_KEY_IS_NOT_REGISTERED_ERROR': "등록되지 않은 API 인증키입니다.",
+    'DEADLINE_HAS_EXPIRED_ERROR': "API 활용기간이 만료되었습니다.",
+    'UNREGISTERED_IP_ERROR': "등록되지 않은 IP에서 요청하였습니다.",
+    'LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR': "API 일일 요청 한도를 초과하였습니다.",
+    'SERVICE_ACCESS_DENIED_ERROR': "API 서비스 접근이 거부되었습니다.",
+}
+
+# ==========================================
+# HTTP 전송 계층 (모든 워커가 공유)
+# ==========================================
+class SearchError(Exception):
+    """사용자에게 그대로 보여줄 메시지를 담은 검색 오류"""
+    pass
+
+class SearchCancelled(SearchError):
+    """취소되었거나 새 검색으로 바뀌어 중단된 검색"""
+
+    def __init__(self, message="검색이 취소되었습니다."):
+        super().__init__(message)
+
+def check_cancelled(cancel_event):
+    """cancel_event(threading.Event)가 설정되었으면 SearchCancelled를 낸다."""
+    if cancel_event is not None and cancel_event.is_set():
+        raise SearchCancelled()
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+def get_http_session():
+    """연결을 재사용하는 공용 requests.Session을 돌려준다 (페이지·검색 간 keep-alive)."""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE, max_retries=0)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers.update({
+                'Accept': 'application/json',
+                'Accept-Encoding': 'gzip, deflate',
+                'Connection': 'keep-alive',
+            })
+            _http_session = session
+        return _http_session
+
+_json_loads = None
+
+def loads_json(content):
+    """응답 본문(bytes)을 JSON으로 해석한다.
+
+    orjson이 설치되어 있으면(선택 설치) 그것을, 없으면 표준 json을 쓴다. 둘 다 bytes를
+    바로 읽으므로 본문을 str로 한 번 더 복사하지 않는다. 해석 실패는 ValueError.
+    """
+    global _json_loads
+    if _json_loads is None:
+        try:
+            import orjson
+            _json_loads = orjson.loads
+        except ImportError:
+            _json_loads = json.loads
+    return _json_loads(content)
+
+def project_items(items, fields):
+    """items에서 fields만 남긴 새 dict 목록 (없는 필드는 넣지 않는다, fields가 None이면 그대로)"""
+    if fields is None:
+        return items
+    return [{field: item[field] for field in fields if field in item} for item in items]
+
+def backoff_delay(attempt):
+    """지수 백오프 + full jitter 대기 시간"""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+def request_json(url, timings=None, label='', cancel_event=None):
+    """URL을 요청해 JSON을 돌려준다.
+
+    5xx 응답, 연결 끊김/시간 초과, 게이트웨이의 비(非)JSON 오류 페이지는
+    지터가 있는 지수 백오프로 재시도하고, 끝내 실패하면 SearchError를 던진다.
+    timings(SearchTimings)가 주어지면 응답 대기·해석 시간과 받은 바이트를 label 페이지로 기록한다.
+    cancel_event가 설정되면 요청 전·재시도 대기 중에 바로 SearchCancelled를 낸다.
+    """
+    session = get_http_session()
+    last_error = ""
+    for attempt in range(MAX_RETRIES + 1):
+        if attempt > 0:
+            delay = backoff_delay(attempt - 1)
+            if cancel_event is None:
+                time.sleep(delay)
+            elif cancel_event.wait(delay):
+                raise SearchCancelled()
+        check_cancelled(cancel_event)
+        started = time.perf_counter()
+        try:
+            res = session.get(url, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT))
+        except (requests.ConnectionError, requests.Timeout) as e:
+            last_error = f"서버 연결 실패: {e.__class__.__name__}"
+            continue
+        finally:
+            network = time.perf_counter() - started
+            if timings is not None:
+                timings.add('network', network)
+
+        if res.status_code != 200 or not res.content.lstrip().startswith(b'{'):
+            text = res.text
+            for code, msg in FATAL_GATEWAY_ERRORS.items():
+                if code in text:
+                    raise SearchError(f"{msg}\n({code})")
+
+        if res.status_code >= 500 or res.status_code == 429:
+            last_error = f"서버 접속 오류: {res.status_code}"
+            continue
+        if res.status_code != 200:
+            raise SearchError(f"서버 접속 오류: {res.status_code}")
+
+        try:
+            data = loads_json(res.content)
+        except ValueError:
+            last_error = f"데이터 파싱 실패: {res.text[:300]}"
+            continue
+        if timings is not None:
+            # 받은 바이트는 압축된 그대로의 크기 (알 수 없으면 풀린 본문 크기)
+            timings.add_page(label, network, time.perf_counter() - started - network,
+                             getattr(res.raw, 'tell', lambda: 0)() or len(res.content))
+        return data
+
+    raise SearchError(f"{last_error}\n({MAX_RETRIES}회 재시도 후 실패)")
+
+# ==========================================
+# 검색 단계별 시간 측정 · 기록 · 프로파일링
+# ==========================================
+SEARCH_LOG_PATH = os.path.join(BASE_DIR, 'logs', 'search_timings.jsonl')   # 검색마다 한 줄씩 남기는 기록
+PROFILE_ENV = 'NARASEARCH_PROFILE'     # 이 환경 변수가 있으면 검색을 cProfile로 실행 (1이면 PROFILE_DIR에 저장)
+PROFILE_DIR = os.path.join(BASE_DIR, 'logs', 'profiles')
+PROFILE_TOP_FUNCTIONS = 40             # 프로파일 요약(.txt)에 적을 함수 수
+
+# 단계 이름: 화면에 보여줄 이름 (network · parse는 페이지마다 재서 더한 값이라 동시 요청이면 실제 경과보다 크다)
+TIMING_STAGES = {
+    'network': '네트워크 합계',
+    'parse': 'JSON 해석',
+    'filter': '필터',
+    'cache': '캐시',
+    'store': '로컬 저장소',
+    'frame': '표 데이터',
+    'model': '표 연결',
+    'resize': '크기 조정',
+}
+
+class SearchTimings:
+    """검색 한 번의 단계별 소요 시간과 페이지별 네트워크 기록 (여러 스레드에서 더해도 된다)"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.finished = None
+        self.lock = threading.Lock()
+        self.seconds = dict.fromkeys(TIMING_STAGES, 0.0)
+        self.pages = []
+
+    @contextmanager
+    def measure(self, stage):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - started)
+
+    def add(self, stage, seconds):
+        with self.lock:
+            self.seconds[stage] += seconds
+
+    def add_page(self, label, network, parse, size):
+        """받은 페이지 하나 (network은 add로 이미 더했으므로 parse만 더한다)"""
+        with self.lock:
+            self.seconds['parse'] += parse
+            self.pages.append({'page': label, 'network_ms': round(network * 1000, 1),
+                               'parse_ms': round(parse * 1000, 1), 'bytes': size})
+
+    def finish(self):
+        if self.finished is None:
+            self.finished = time.perf_counter()
+
+    @property
+    def total(self):
+        return (self.finished or time.perf_counter()) - self.started
+
+    def summary(self):
+        """화면에 보여줄 한 줄 요약: 네트워크 합계 3.21초(12쪽, 10.4MB) · JSON 해석 0.42초 · … / 전체 4.10초"""
+        with self.lock:
+            seconds = dict(self.seconds)
+            pages = len(self.pages)
+            size = sum(page['bytes'] for page in self.pages)
+        parts = []
+        for stage, label in TIMING_STAGES.items():
+            if stage == 'network' and pages:
+                parts.append(f"{label} {seconds[stage]:.2f}초({pages}쪽, {size / 2 ** 20:.1f}MB)")
+            elif seconds[stage] >= 0.005:
+                parts.append(f"{label} {seconds[stage]:.2f}초")
+        return " · ".join(parts) + f" / 전체 {self.total:.2f}초"
+
+    def as_record(self, **fields):
+        """검색 기록 파일에 남길 dict (fields: 검색유형 · 검색어 · 결과 건수 등)"""
+        with self.lock:
+            return {
+                'at': datetime.now().isoformat(timespec='seconds'),
+                **fields,
+                'total_ms': round(self.total * 1000, 1),
+                'stages_ms': {stage: round(value * 1000, 1) for stage, value in self.seconds.items()},
+                'page_count': len(self.pages),
+                'bytes': sum(page['bytes'] for page in self.pages),
+                'pages': list(self.pages),
+            }
+
+def append_search_log(record, path=SEARCH_LOG_PATH):
+    """검색 기록(JSON 한 줄)을 파일 끝에 덧붙인다."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+    except OSError as e:
+        print(f"검색 기록 저장 실패: {e}", file=sys.stderr)
+
+def run_profiled(func, name='search'):
+    """환경 변수 NARASEARCH_PROFILE이 있으면 func()를 cProfile로 실행하고 통계를 파일로 남긴다.
+
+    값이 1이면 PROFILE_DIR에, 아니면 그 값을 폴더로 보고 <name>-<시각>.prof(pstats·snakeviz용)와
+    누적 시간 순 요약 .txt를 쓴다. cProfile은 부른 스레드만 재므로 페이지 요청 스레드의 시간은
+    future를 기다리는 시간으로 나타난다 (네트워크 쪽은 SearchTimings의 페이지 기록을 본다).
+    """
+    target = os.environ.get(PROFILE_ENV, '').strip()
+    if not target or target == '0':
+        return func()
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func)
+    finally:
+        folder = PROFILE_DIR if target == '1' else target
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, f"{safe_filename(name)}-{datetime.now():%Y%m%d-%H%M%S}")
+        profiler.dump_stats(path + '.prof')
+        with open(path + '.txt', 'w', encoding='utf-8') as f:
+            pstats.Stats(profiler, stream=f).sort_stats('cumulative').print_stats(PROFILE_TOP_FUNCTIONS)
+        print(f"프로파일 저장: {path}.prof", file=sys.stderr)
+
+# ==========================================
+# 컬럼 타입 변환 (금액 = 숫자, 일시 = datetime)
+# ==========================================
+MONEY_FIELDS = ['asignBdgtAmt', 'presmptPrce']
+DATETIME_FIELDS = ['bidNtceDt', 'bidBeginDt', 'bidClseDt', 'rcptDt', 'opninRgstClseDt', 'dlvrTmlmtDt']
+DISPLAY_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+EXCEL_DATETIME_FORMAT = 'yyyy-mm-dd hh:mm:ss'
+
+def parse_amounts(series):
+    """'1,234' 같은 금액 문자열을 float로 (빈 값·잘못된 값은 NaN)"""
+    return pd.to_numeric(series.astype(str).str.replace(',', '', regex=False), errors='coerce')
+
+def parse_datetimes(series):
+    """'2026-09-01 10:00:00' 형식의 일시 문자열을 datetime64로 (빈 값은 NaT)"""
+    return pd.to_datetime(series, format='ISO8601', errors='coerce')
+
+def apply_column_types(df):
+    """API 원본 컬럼 중 금액·일시 컬럼을 한 번에(열 단위로) 타입 변환한다."""
+    for field in MONEY_FIELDS:
+        if field in df.columns:
+            df[field] = parse_amounts(df[field])
+    for field in DATETIME_FIELDS:
+        if field in df.columns:
+            df[field] = parse_datetimes(df[field])
+    return df
+
+_UNIT_LABELS = {}
+
+def _unit_labels(unit):
+    """0~9,999 에 대한 '1,234만원' 같은 표시 문자열 표 (처음 쓸 때 한 번만 만든다)"""
+    if unit not in _UNIT_LABELS:
+        _UNIT_LABELS[unit] = np.array([f"{v:,}{unit}" for v in range(10000)], dtype=object)
+    return _UNIT_LABELS[unit]
+
+def format_money(values):
+    """금액(float) 배열을 '3억 5,000만원' 형태 표시 문자열 목록으로 바꾼다 (NaN은 '-').
+
+    만·원 단위는 0~9,999 범위라 미리 만든 표에서 꺼내 쓰고, 억 단위는 나온 값만 만든다.
+    """
+    amounts = np.asarray(values, dtype=float)
+    valid = ~np.isnan(amounts)
+    amounts = np.where(valid, amounts, 0).astype(np.int64)
+    eok, rest = np.divmod(amounts, 100000000)
+    man = rest // 10000
+
+    units, inverse = np.unique(eok, return_inverse=True)
+    eok_text = np.array([f"{e}억" if e > 0 else '' for e in units], dtype=object)[inverse]
+    man_text = _unit_labels('만원')[man]
+    man_text[man == 0] = ''
+    space = np.where((eok > 0) & (man > 0), ' ', '').astype(object)
+    text = eok_text + space + man_text
+
+    small = (eok == 0) & (man == 0)
+    text[small] = _unit_labels('원')[amounts[small]]
+    text[~valid] = '-'
+    return text.tolist()
+
+AMOUNT_NUMBER = r'(\d[\d,]*(?:\.\d+)?)'
+# 금액 입력: [숫자 억] [숫자 만] [숫자] [원] 순서로 하나 이상 (공백 허용)
+AMOUNT_TEXT = re.compile(rf'\s*(?:{AMOUNT_NUMBER}\s*억)?\s*(?:{AMOUNT_NUMBER}\s*만)?\s*{AMOUNT_NUMBER}?\s*원?\s*')
+
+def parse_amount_text(text):
+    """'3억 5,000만', '3.5억', '500000', '5,000만원' 같은 입력을 원 단위 숫자로
+
+    그 밖의 글자가 있거나('1~3억', '-1억', '3억abc') 숫자가 없으면 ValueError.
+    """
+    match = AMOUNT_TEXT.fullmatch(text)
+    if not match or not any(match.groups()):
+        raise ValueError(f"금액을 읽을 수 없습니다: {text}")
+    return sum(float(number.replace(',', '')) * unit
+               for number, unit in zip(match.groups(), (100000000, 10000, 1)) if number)
+
+# ==========================================
+# 날짜 단위 응답 캐시
+# ==========================================
+class ResponseCache:
+    """(검색유형, 1차 검색어, 날짜) 단위로 API 원본 items를 보관하는 SQLite 캐시"""
+
+    def __init__(self, path=CACHE_DB_PATH, max_bytes=CACHE_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS response_cache (
+                category TEXT,
+                keyword TEXT,
+                day TEXT,
+                items BLOB,
+                size INTEGER,
+                expires_at REAL,
+                accessed_at REAL,
+                PRIMARY KEY (category, keyword, day)
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    def get_days(self, category, keyword, days):
+        """만료되지 않은 날짜별 items를 {day: items}로 돌려준다."""
+        if not days:
+            return {}
+        now = time.time()
+        found = {}
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            placeholders = ','.join('?' * len(days))
+            rows = conn.execute(
+                f"SELECT day, items FROM response_cache "
+                f"WHERE category=? AND keyword=? AND expires_at>? AND day IN ({placeholders})",
+                (category, keyword, now, *days)).fetchall()
+            for day, blob in rows:
+                found[day] = json.loads(zlib.decompress(blob))
+            if found:
+                conn.executemany(
+                    "UPDATE response_cache SET accessed_at=? WHERE category=? AND keyword=? AND day=?",
+                    [(now, category, keyword, day) for day in found])
+                conn.commit()
+        finally:
+            conn.close()
+        return found
+
+    def put_days(self, category, keyword, day_items, ttl_seconds):
+        """{day: items}를 저장하고, 만료·용량 초과 항목을 정리한다."""
+        if not day_items:
+            return
+        now = time.time()
+        rows = []
+        for day, items in day_items.items():
+            blob = zlib.compress(json.dumps(items, ensure_ascii=False).encode('utf-8'))
+            rows.append((category, keyword, day, blob, len(blob), now + ttl_seconds, now))
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            conn.executemany("INSERT OR REPLACE INTO response_cache VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            conn.execute("DELETE FROM response_cache WHERE expires_at<=?", (now,))
+            self._evict(conn)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _evict(self, conn):
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM response_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # 상한의 90%까지 최근에 쓰지 않은 항목부터 삭제
+        target = total - int(self.max_bytes * 0.9)
+        victims = []
+        for category, keyword, day, size in conn.execute(
+                "SELECT category, keyword, day, size FROM response_cache ORDER BY accessed_at"):
+            victims.append((category, keyword, day))
+            target -= size
+            if target <= 0:
+                break
+        conn.executemany("DELETE FROM response_cache WHERE category=? AND keyword=? AND day=?", victims)
+
+# ==========================================
+# 로컬 공고 저장소 (SQLite FTS5 전문 검색)
+# ==========================================
+def bigram_text(text):
+    """띄어쓰기로 나뉜 단어마다 두 글자씩 잘라 공백으로 이은 문자열 (2글자 검색어 색인용)"""
+    return ' '.join(word[i:i + 2] for word in (text or '').split() for i in range(len(word) - 1))
+
+def notice_key(category, item):
+    """공고를 구별하는 키 (검색유형별 key_fields 값을 |로 이은 것)
+
+    키 필드가 모두 비어 있는 공고는 남기는 필드(CATEGORY_API fields) 내용의 해시를 키로 쓴다.
+    ('|' 같은 빈 키끼리 저장소에서 서로 덮어쓰지 않게)
+    """
+    api = CATEGORY_API[category]
+    values = [str(item.get(f) or '') for f in api['key_fields']]
+    if any(values):
+        return '|'.join(values)
+    content = json.dumps([item.get(f) for f in api['fields']], ensure_ascii=False, default=str)
+    return 'sha1:' + hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+class NoticeStore:
+    """내려받은 공고를 모아 두고 FTS5로 오프라인 검색하는 저장소
+
+    제목·기관명·기타 텍스트 컬럼을 trigram 토크나이저로 색인하므로
+    띄어쓰기 없는 한글 제목에서도 부분 문자열로 찾을 수 있다.
+    (trigram을 지원하지 않는 SQLite에서는 unicode61 토크나이저를 쓴다)
+    trigram은 3글자 미만을 색인하지 못하므로 '철도' · '의왕' 같은 2글자 검색어를 위해
+    두 글자씩 자른 텍스트(bigram_text)를 notices_bigram에 따로 색인한다.
+    """
+
+    def __init__(self, path=CACHE_DB_PATH):
+        self.path = path
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS notices (
+                    id INTEGER PRIMARY KEY,
+                    category TEXT NOT NULL,
+                    notice_key TEXT NOT NULL,
+                    notice_dt TEXT,
+                    title TEXT,
+                    institution TEXT,
+                    detail TEXT,
+                    item TEXT,
+                    UNIQUE (category, notice_key)
+                )
+            ''')
+            conn.execute("CREATE INDEX IF NOT EXISTS notices_dt ON notices (category, notice_dt)")
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS harvest_state (
+                    category TEXT PRIMARY KEY,
+                    high_water TEXT,
+                    updated_at REAL
+                )
+            ''')
+            row = conn.execute("SELECT sql FROM sqlite_master WHERE name='notices_fts'").fetchone()
+            if row is None:
+                try:
+                    self._create_fts(conn, 'trigram')
+                except sqlite3.OperationalError:
+                    self._create_fts(conn, 'unicode61')
+                row = conn.execute("SELECT sql FROM sqlite_master WHERE name='notices_fts'").fetchone()
+            self.trigram = 'trigram' in row[0]
+            if self.trigram and conn.execute("SELECT 1 FROM sqlite_master WHERE name='notices_bigram'").fetchone() is None:
+                conn.execute('''
+                    CREATE VIRTUAL TABLE notices_bigram USING fts5(
+                        title, institution, detail, tokenize='unicode61'
+                    )
+                ''')
+                # 이전 버전에서 모아 둔 공고도 색인한다
+                self._index_bigrams(conn, conn.execute("SELECT id, title, institution, detail FROM notices").fetchall())
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _create_fts(self, conn, tokenizer):
+        conn.execute(f'''
+            CREATE VIRTUAL TABLE notices_fts USING fts5(
+                title, institution, detail,
+                content='notices', content_rowid='id', tokenize='{tokenizer}'
+            )
+        ''')
+        conn.executescript('''
+            CREATE TRIGGER IF NOT EXISTS notices_ai AFTER INSERT ON notices BEGIN
+                INSERT INTO notices_fts (rowid, title, institution, detail)
+                VALUES (new.id, new.title, new.institution, new.detail);
+            END;
+            CREATE TRIGGER IF NOT EXISTS notices_ad AFTER DELETE ON notices BEGIN
+                INSERT INTO notices_fts (notices_fts, rowid, title, institution, detail)
+                VALUES ('delete', old.id, old.title, old.institution, old.detail);
+            END;
+            CREATE TRIGGER IF NOT EXISTS notices_au AFTER UPDATE ON notices BEGIN
+                INSERT INTO notices_fts (notices_fts, rowid, title, institution, detail)
+                VALUES ('delete', old.id, old.title, old.institution, old.detail);
+                INSERT INTO notices_fts (rowid, title, institution, detail)
+                VALUES (new.id, new.title, new.institution, new.detail);
+            END;
+        ''')
+
+    @staticmethod
+    def _index_bigrams(conn, rows):
+        """(id, 제목, 기관명, 기타) 행들을 notices_bigram에 (다시) 색인한다."""
+        rows = [(row_id, *map(bigram_text, texts)) for row_id, *texts in rows]
+        for start in range(0, len(rows), 500):
+            chunk = rows[start:start + 500]
+            conn.execute(f"DELETE FROM notices_bigram WHERE rowid IN ({','.join('?' * len(chunk))})",
+                         [row[0] for row in chunk])
+        conn.executemany("INSERT INTO notices_bigram (rowid, title, institution, detail) VALUES (?, ?, ?, ?)", rows)
+
+    def add_items(self, category, items):
+        """API 원본 items를 저장(같은 공고는 갱신)하고 색인한다."""
+        if not items:
+            return
+        api = CATEGORY_API[category]
+        text_fields = api['text_fields']
+        rows = []
+        for item in items:
+            key = notice_key(category, item)
+            texts = [' '.join(str(item.get(f) or '') for f in text_fields[col]).strip()
+                     for col in ('title', 'institution', 'detail')]
+            rows.append((category, key, str(item.get(api['date_field']) or ''), *texts,
+                         json.dumps(item, ensure_ascii=False)))
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            conn.executemany('''
+                INSERT INTO notices (category, notice_key, notice_dt, title, institution, detail, item)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (category, notice_key) DO UPDATE SET
+                    notice_dt=excluded.notice_dt, title=excluded.title,
+                    institution=excluded.institution, detail=excluded.detail, item=excluded.item
+                WHERE notices.item != excluded.item
+            ''', rows)
+            if self.trigram:
+                # 새로 들어왔거나 바뀐 공고만 2글자 색인을 다시 만든다
+                texts = {key: (title, institution, detail) for _, key, _, title, institution, detail, _ in rows}
+                keys = list(texts)
+                stored = []
+                for start in range(0, len(keys), 500):
+                    chunk = keys[start:start + 500]
+                    stored += conn.execute(
+                        f"SELECT n.id, n.notice_key, b.title, b.institution, b.detail FROM notices n "
+                        f"LEFT JOIN notices_bigram b ON b.rowid = n.id "
+                        f"WHERE n.category=? AND n.notice_key IN ({','.join('?' * len(chunk))})",
+                        (category, *chunk)).fetchall()
+                self._index_bigrams(conn, [(row_id, *texts[key]) for row_id, key, *indexed in stored
+                                           if tuple(indexed) != tuple(map(bigram_text, texts[key]))])
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get_items(self, category, keys):
+        """공고 키 목록에 해당하는 API 원본 items를 {키: item}으로 돌려준다."""
+        found = {}
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = conn.execute(
+                    f"SELECT notice_key, item FROM notices "
+                    f"WHERE category=? AND notice_key IN ({','.join('?' * len(chunk))})",
+                    (category, *chunk)).fetchall()
+                for key, item in rows:
+                    found[key] = json.loads(item)
+        finally:
+            conn.close()
+        return found
+
+    def get_high_water(self, category):
+        """마지막 수집이 끝난 시점(datetime)을 돌려준다. 수집한 적이 없으면 None."""
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            row = conn.execute("SELECT high_water FROM harvest_state WHERE category=?", (category,)).fetchone()
+        finally:
+            conn.close()
+        return datetime.strptime(row[0], '%Y%m%d%H%M') if row and row[0] else None
+
+    def set_high_water(self, category, value):
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            conn.execute("INSERT OR REPLACE INTO harvest_state VALUES (?, ?, ?)",
+                         (category, value.strftime('%Y%m%d%H%M'), time.time()))
+            conn.commit()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def parse_query(query):
+        """검색어를 (포함 조건 목록, 제외 단어 목록)으로 나눈다.
+
+        포함 조건마다 [(구문 여부, 접두어 여부, 단어)]이며 'a|b'처럼 |로 묶은 단어 중 하나만 있으면 되고(OR),
+        조건끼리는 모두 만족(AND)해야 한다. "큰따옴표"로 묶은 부분은 구문, 끝에 *가 붙은 단어는
+        접두어 검색, '-단어'는 제외(NOT)이다. (구문·접두어 외에는 API 검색의 KeywordMatcher와 같은 문법)
+        """
+        groups = []
+        excludes = []
+        for phrase, word in re.findall(r'"([^"]+)"|([^\s,"]+)', query):
+            if phrase.strip():
+                groups.append([(True, False, phrase.strip())])
+                continue
+            if word.startswith('-'):
+                if word[1:]:
+                    excludes.append(word)
+                continue
+            alternatives = []
+            for text in word.split('|'):
+                prefix = text.endswith('*')
+                text = text.rstrip('*')
+                if text:
+                    alternatives.append((False, prefix, text))
+            if alternatives:
+                groups.append(alternatives)
+        return groups, excludes
+
+    def _term_index(self, text):
+        """단어를 찾을 색인: 'fts'(notices_fts) · 'bigram'(notices_bigram) · 'like'(색인 없이 LIKE)"""
+        if not self.trigram:
+            return 'fts'
+        # trigram은 부분 문자열 일치이므로 접두어 검색도 포함된다. 3글자 미만은 trigram 색인을 쓸 수 없어
+        # 2글자(글자·숫자만)는 notices_bigram에서, 1글자 등 나머지는 LIKE로 찾는다.
+        if len(text) >= 3:
+            return 'fts'
+        if len(text) == 2 and text.isalnum():
+            return 'bigram'
+        return 'like'
+
+    def search(self, category, query, start_dt=None, end_dt=None, limit=LOCAL_SEARCH_LIMIT):
+        """로컬 저장소에서 검색하여 관련도 순으로 API 원본 items를 돌려준다.
+
+        OR 단어가 모두 같은 색인에 있으면 그 색인의 MATCH에 'a OR b'로 넣고, 색인이 섞이면
+        단어별로 찾은 공고의 합집합으로 거른다. 제외어는 API 검색처럼 제목에서 KeywordMatcher로 뺀다.
+        """
+        groups, excludes = self.parse_query(query)
+        if not groups:
+            return []
+
+        match_groups = {'fts': [], 'bigram': []}
+        mixed_groups = []           # 색인이 섞였거나 LIKE가 필요한 OR 조건: [(색인, 단어, MATCH 식)]
+        for alternatives in groups:
+            terms = []
+            for is_phrase, is_prefix, text in alternatives:
+                quoted = '"' + text.replace('"', '""') + '"'
+                if not self.trigram and is_prefix:
+                    quoted += '*'
+                terms.append((self._term_index(text), text, quoted))
+            indexes = {index for index, _, _ in terms}
+            if len(indexes) == 1 and indexes <= set(match_groups):
+                expression = ' OR '.join(quoted for _, _, quoted in terms)
+                match_groups[indexes.pop()].append(f"({expression})" if len(terms) > 1 else expression)
+            else:
+                mixed_groups.append(terms)
+
+        tables = ["notices n"]
+        where = []
+        params = []
+        ranks = []
+        for index, table in (('fts', 'notices_fts'), ('bigram', 'notices_bigram')):
+            if match_groups[index]:
+                tables.append(f"JOIN {table} ON {table}.rowid = n.id")
+                where.append(f"{table} MATCH ?")
+                params.append(' AND '.join(match_groups[index]))
+                ranks.append(f"bm25({table}, 10.0, 3.0, 1.0)")
+        where.append("n.category = ?")
+        params.append(category)
+        if start_dt is not None:
+            where.append("n.notice_dt >= ?")
+            params.append(start_dt.strftime('%Y-%m-%d %H:%M'))
+        if end_dt is not None:
+            where.append("n.notice_dt <= ?")
+            params.append(end_dt.strftime('%Y-%m-%d %H:%M:59'))
+        rank_sql = []
+        rank_params = []
+        for terms in mixed_groups:
+            found = []
+            for index, table in (('fts', 'notices_fts'), ('bigram', 'notices_bigram')):
+                matched = [quoted for each, _, quoted in terms if each == index]
+                if matched:
+                    found.append(f"n.id IN (SELECT rowid FROM {table} WHERE {table} MATCH ?)")
+                    params.append(' OR '.join(matched))
+            patterns = []
+            for index, text, _ in terms:
+                patterns.append('%' + text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%')
+                if index == 'like':
+                    found.append("(n.title || ' ' || n.institution || ' ' || n.detail) LIKE ? ESCAPE '\\'")
+                    params.append(patterns[-1])
+            where.append(f"({' OR '.join(found)})")
+            in_title = ' OR '.join(["n.title LIKE ? ESCAPE '\\'"] * len(patterns))
+            in_institution = ' OR '.join(["n.institution LIKE ? ESCAPE '\\'"] * len(patterns))
+            rank_sql.append(f"(CASE WHEN {in_title} THEN 0 WHEN {in_institution} THEN 1 ELSE 2 END)")
+            rank_params += patterns + patterns
+
+        # 관련도: 색인에서 찾은 단어는 bm25(제목에 가중치), LIKE로도 찾는 단어는 제목 > 기관명 > 기타 순
+        order = [' + '.join(ranks)] if ranks else []
+        if rank_sql:
+            order.append(' + '.join(rank_sql))
+        order.append("n.notice_dt DESC")
+        sql = (f"SELECT n.title, n.item FROM {' '.join(tables)} WHERE {' AND '.join(where)} "
+               f"ORDER BY {', '.join(order)}")
+        params = params + rank_params
+        # 제외어가 있으면 몇 건이 빠질지 모르므로 LIMIT 없이 순서대로 읽으며 limit건을 채운다
+        excluder = KeywordMatcher(' '.join(excludes)) if excludes else None
+        if excluder is None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        items = []
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            cursor = conn.execute(sql, params)
+            while len(items) < limit:
+                rows = cursor.fetchmany(limit)
+                if not rows:
+                    break
+                if excluder is not None:
+                    rows = [row for row, keep in zip(rows, excluder.mask([title for title, _ in rows])) if keep]
+                items += [json.loads(item) for _, item in rows]
+        finally:
+            conn.close()
+        return items[:limit]
+
+    def match_titles(self, category, matcher, start_dt=None, end_dt=None, limit=LOCAL_SEARCH_LIMIT):
+        """기간 안 공고의 제목을 KeywordMatcher로 걸러 API 원본 items를 공고 일시 순으로 돌려준다.
+
+        API 검색과 같은 검색어 문법(AND · 'a|b' · '-a')으로 받아 둔 공고를 다시 거를 때 쓴다.
+        제목만 먼저 읽어 한꺼번에 거르고, 맞는 공고의 원본만 불러온다.
+        """
+        where = ["category = ?"]
+        params = [category]
+        if start_dt is not None:
+            where.append("notice_dt >= ?")
+            params.append(start_dt.strftime('%Y-%m-%d %H:%M'))
+        if end_dt is not None:
+            where.append("notice_dt <= ?")
+            params.append(end_dt.strftime('%Y-%m-%d %H:%M:59'))
+
+        items = []
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            rows = conn.execute(f"SELECT id, title FROM notices WHERE {' AND '.join(where)} "
+                                f"ORDER BY notice_dt, id", params).fetchall()
+            if not rows:
+                return []
+            hits = matcher.mask([title for _, title in rows])
+            ids = [row[0] for row, hit in zip(rows, hits) if hit][:limit]
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                found = dict(conn.execute(
+                    f"SELECT id, item FROM notices WHERE id IN ({','.join('?' * len(chunk))})", chunk).fetchall())
+                items.extend(json.loads(found[i]) for i in chunk)
+        finally:
+            conn.close()
+        return items
+
+# ==========================================
+# 설정 · 검색 기록 저장소 (연결 하나, WAL, 모아서 쓰기)
+# ==========================================
+SETTINGS_FLUSH_INTERVAL = 0.5    # 바뀐 설정을 모아 두었다가 쓰는 간격(초), 그 사이 입력은 한 번에 저장
+HISTORY_LIMIT = 200              # 보관할 검색 기록 수 (오래된 것부터 삭제)
+
+# 설정 DB 스키마 변경 목록: PRAGMA user_version이 N이면 앞의 N개가 적용된 상태다.
+# 이미 배포된 DB를 고치려면 항목을 고치지 말고 끝에 새 항목을 추가한다.
+SETTINGS_MIGRATIONS = [
+    # 1: 설정 · 저장단어 10칸 (이전 버전이 만든 DB에도 그대로 적용된다)
+    '''
+    CREATE TABLE IF NOT EXISTS settings (
+        id INTEGER PRIMARY KEY,
+        api_key TEXT,
+        expired_date TEXT,
+        use_3weeks INTEGER
+    );
+    INSERT OR IGNORE INTO settings (id, api_key, expired_date, use_3weeks) VALUES (1, '', '', 0);
+    CREATE TABLE IF NOT EXISTS shortcuts (
+        idx INTEGER PRIMARY KEY,
+        keyword TEXT
+    );
+    WITH RECURSIVE n(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM n WHERE i < 9)
+    INSERT OR IGNORE INTO shortcuts (idx, keyword) SELECT i, '' FROM n;
+    ''',
+    # 2: 검색 기록 (result_keys: 결과 공고 키 목록, zlib로 압축한 JSON)
+    '''
+    CREATE TABLE search_history (
+        id INTEGER PRIMARY KEY,
+        searched_at TEXT NOT NULL,
+        category TEXT NOT NULL,
+        query TEXT NOT NULL,
+        start_dt TEXT,
+        end_dt TEXT,
+        mode TEXT,
+        result_count INTEGER,
+        duration_ms REAL,
+        result_keys BLOB
+    );
+    ''',
+    # 3: 저장단어 감시 (켜짐 · 간격(분), 저장단어별 마지막 확인 시각과 이미 본 공고 키)
+    '''
+    ALTER TABLE settings ADD COLUMN watch_enabled INTEGER DEFAULT 0;
+    ALTER TABLE settings ADD COLUMN watch_minutes INTEGER DEFAULT 30;
+    CREATE TABLE watch_state (
+        category TEXT NOT NULL,
+        query TEXT NOT NULL,
+        high_water TEXT,
+        seen_keys BLOB,
+        updated_at TEXT,
+        PRIMARY KEY (category, query)
+    );
+    ''',
+    # 4: 감시할 검색 유형 (검색 유형 선택과 따로 기억한다, 이전에는 검색 유형 선택을 따라갔다)
+    '''
+    ALTER TABLE settings ADD COLUMN watch_category TEXT DEFAULT '입찰공고';
+    ''',
+]
+SETTINGS_FIELDS = ('api_key', 'expired_date', 'use_3weeks', 'watch_enabled', 'watch_minutes', 'watch_category')
+HISTORY_COLUMNS = ('id', 'searched_at', 'category', 'query', 'start_dt', 'end_dt', 'mode',
+                   'result_count', 'duration_ms')
+
+class SettingsStore:
+    """설정 · 저장단어 · 검색 기록 · 저장단어 감시 상태를 담는 SQLite 저장소
+
+    연결 하나를 계속 열어 두고(WAL), 설정 변경은 메모리에 모아 두었다가
+    쓰기 스레드가 SETTINGS_FLUSH_INTERVAL마다 한 트랜잭션으로 저장한다.
+    그래서 키를 입력할 때마다 DB를 열고 닫지 않고, 화면 스레드는 디스크를 기다리지 않는다.
+    """
+
+    def __init__(self, path=DB_PATH, flush_interval=SETTINGS_FLUSH_INTERVAL):
+        self.path = path
+        self.flush_interval = flush_interval
+        db_dir = os.path.dirname(path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        self.db_lock = threading.Lock()
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.migrate()
+        self.next_history_id = self.conn.execute(
+            "SELECT COALESCE(MAX(id), 0) + 1 FROM search_history").fetchone()[0]
+
+        self.pending_lock = threading.Lock()
+        self.pending_settings = {}
+        self.pending_shortcuts = {}
+        self.pending_history = []
+        self.dirty = threading.Event()
+        self.stopping = threading.Event()
+        self.writer = threading.Thread(target=self.write_loop, name='settings-writer', daemon=True)
+        self.writer.start()
+
+    @property
+    def schema_version(self):
+        return self.conn.execute("PRAGMA user_version").fetchone()[0]
+
+    def migrate(self):
+        """아직 적용하지 않은 스키마 변경을 차례로 적용한다 (항목마다 한 트랜잭션)."""
+        for version, script in enumerate(SETTINGS_MIGRATIONS[self.schema_version:], self.schema_version + 1):
+            try:
+                self.conn.executescript(f"BEGIN; {script} PRAGMA user_version = {version}; COMMIT;")
+            except sqlite3.Error:
+                self.conn.rollback()
+                raise
+
+    def load(self):
+        """저장된 설정을 dict로 돌려준다. 저장단어는 'shortcuts'에 {칸 번호: 검색어}로 담는다."""
+        with self.db_lock:
+            row = self.conn.execute(
+                f"SELECT {', '.join(SETTINGS_FIELDS)} FROM settings WHERE id=1").fetchone()
+            shortcuts = dict(self.conn.execute("SELECT idx, keyword FROM shortcuts").fetchall())
+        settings = dict(zip(SETTINGS_FIELDS, row or ('', '', 0, 0, WATCH_INTERVAL_MINUTES, WATCH_CATEGORY)))
+        settings['shortcuts'] = shortcuts
+        return settings
+
+    def set_settings(self, **fields):
+        """설정 값을 바꾼다 (곧바로 쓰지 않고 모아 둔다)."""
+        unknown = set(fields) - set(SETTINGS_FIELDS)
+        if unknown:
+            raise ValueError(f"알 수 없는 설정: {', '.join(sorted(unknown))}")
+        with self.pending_lock:
+            self.pending_settings.update(fields)
+        self.dirty.set()
+
+    def set_shortcut(self, idx, keyword):
+        with self.pending_lock:
+            self.pending_shortcuts[idx] = keyword
+        self.dirty.set()
+
+    def add_history(self, category, query, start_dt, end_dt, result_count, duration_ms,
+                    mode='api', result_keys=None):
+        """검색 기록을 추가하고, 결과 공고 키를 뺀 기록 dict를 돌려준다."""
+        with self.pending_lock:
+            entry = {
+                'id': self.next_history_id,
+                'searched_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'category': category,
+                'query': query,
+                'start_dt': start_dt.strftime('%Y-%m-%d %H:%M'),
+                'end_dt': end_dt.strftime('%Y-%m-%d %H:%M'),
+                'mode': mode,
+                'result_count': result_count,
+                'duration_ms': round(duration_ms, 1),
+            }
+            self.next_history_id += 1
+            blob = zlib.compress(json.dumps(result_keys or [], ensure_ascii=False).encode('utf-8'))
+            self.pending_history.append(tuple(entry.values()) + (blob,))
+        self.dirty.set()
+        return entry
+
+    def recent_history(self, limit=20):
+        """최근 검색 기록을 새것부터 돌려준다 (결과 공고 키 제외)."""
+        self.flush()
+        with self.db_lock:
+            rows = self.conn.execute(
+                f"SELECT {', '.join(HISTORY_COLUMNS)} FROM search_history ORDER BY id DESC LIMIT ?",
+                (limit,)).fetchall()
+        return [dict(zip(HISTORY_COLUMNS, row)) for row in rows]
+
+    def get_history(self, history_id):
+        """검색 기록 하나를 결과 공고 키('result_keys')까지 포함해 돌려준다. 없으면 None."""
+        self.flush()
+        with self.db_lock:
+            row = self.conn.execute(
+                f"SELECT {', '.join(HISTORY_COLUMNS)}, result_keys FROM search_history WHERE id=?",
+                (history_id,)).fetchone()
+        if row is None:
+            return None
+        entry = dict(zip(HISTORY_COLUMNS, row))
+        entry['result_keys'] = json.loads(zlib.decompress(row[-1])) if row[-1] else []
+        return entry
+
+    def watch_states(self, category):
+        """저장단어 감시 상태: {저장단어: (마지막으로 확인한 시각 또는 None, 이미 본 공고 키 집합)}"""
+        with self.db_lock:
+            rows = self.conn.execute("SELECT query, high_water, seen_keys FROM watch_state WHERE category=?",
+                                     (category,)).fetchall()
+        return {query: (datetime.strptime(high_water, '%Y-%m-%d %H:%M') if high_water else None,
+                        set(json.loads(zlib.decompress(seen_keys))) if seen_keys else set())
+                for query, high_water, seen_keys in rows}
+
+    def set_watch_states(self, category, states):
+        """저장단어 감시 상태({저장단어: (확인 시각, 공고 키 집합)})를 한 트랜잭션으로 바로 쓴다."""
+        updated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        rows = [(category, query, high_water.strftime('%Y-%m-%d %H:%M') if high_water else None,
+                 zlib.compress(json.dumps(sorted(seen_keys), ensure_ascii=False).encode('utf-8')), updated_at)
+                for query, (high_water, seen_keys) in states.items()]
+        with self.db_lock, self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO watch_state VALUES (?, ?, ?, ?, ?)", rows)
+
+    def write_loop(self):
+        while not self.stopping.is_set():
+            self.dirty.wait()
+            self.stopping.wait(self.flush_interval)   # 그 사이에 들어온 변경까지 한 번에 쓴다
+            self.flush()
+
+    def flush(self):
+        """모아 둔 변경을 한 트랜잭션으로 쓴다. 실패하면 다음 번에 다시 시도한다."""
+        with self.pending_lock:
+            self.dirty.clear()
+            settings, self.pending_settings = self.pending_settings, {}
+            shortcuts, self.pending_shortcuts = self.pending_shortcuts, {}
+            history, self.pending_history = self.pending_history, []
+        if not (settings or shortcuts or history):
+            return
+        try:
+            with self.db_lock, self.conn:
+                if settings:
+                    self.conn.execute(
+                        f"UPDATE settings SET {', '.join(f'{name}=?' for name in settings)} WHERE id=1",
+                        tuple(settings.values()))
+                if shortcuts:
+                    self.conn.executemany("INSERT OR REPLACE INTO shortcuts (idx, keyword) VALUES (?, ?)",
+                                          list(shortcuts.items()))
+                if history:
+                    self.conn.executemany(
+                        f"INSERT INTO search_history VALUES ({', '.join('?' * (len(HISTORY_COLUMNS) + 1))})",
+                        history)
+                    self.conn.execute("DELETE FROM search_history WHERE id <= ?",
+                                      (history[-1][0] - HISTORY_LIMIT,))
+        except sqlite3.Error as e:
+            print(f"설정 저장 에러: {e}")
+            with self.pending_lock:
+                for name, value in settings.items():
+                    self.pending_settings.setdefault(name, value)
+                for idx, keyword in shortcuts.items():
+                    self.pending_shortcuts.setdefault(idx, keyword)
+                self.pending_history[:0] = history
+            self.dirty.set()
+
+    def close(self):
+        """남은 변경을 쓰고 연결을 닫는다 (여러 번 불러도 된다)."""
+        if self.stopping.is_set():
+            return
+        self.stopping.set()
+        self.dirty.set()
+        self.writer.join()
+        self.flush()
+        with self.db_lock:
+            self.conn.close()
+
+# ==========================================
+# 검색어 매처 (AND / OR / NOT)
+# ==========================================
+MATCH_SEPARATOR = '\x00'     # 공고 제목들을 이어 붙일 때 쓰는 구분자 (공백 문자가 아님)
+
+def normalize_text(text):
+    """비교용 정규화: 유니코드 NFC, 공백 제거, 소문자"""
+    return re.sub(r'\s+', '', unicodedata.normalize('NFC', str(text))).lower()
+
+def compile_term(word):
+    """공백·대소문자를 무시하고 찾는 정규식 ('철도' → '철\\s*도')"""
+    return re.compile(r'\s*'.join(re.escape(c) for c in normalize_text(word)), re.IGNORECASE)
+
+class KeywordMatcher:
+    """검색어를 한 번만 해석·컴파일해 두고 공고 묶음 전체에 한꺼번에 적용하는 매처
+
+    문법: 쉼표·공백으로 나눈 조건은 모두 만족(AND), 'a|b'는 둘 중 하나(OR),
+    '-a'는 제외(NOT). 예) '철도|도로 -유지보수'
+    첫 번째 포함 조건은 API 검색어로 쓰이며, OR이면 각 단어를 따로 요청한다.
+
+    제목을 하나씩 정규화하지 않고, 묶음 전체를 한 문자열로 이어 붙여(NFC는 한 번만)
+    조건마다 정규식을 한 번 훑은 뒤 일치 위치를 행 번호로 바꾼다.
+    조건을 하나 통과할 때마다 남은 제목만 다시 이어 붙여 다음 조건을 검사한다.
+    """
+
+    def __init__(self, query):
+        self.terms = [t for t in re.split(r'[, ]+', query.strip()) if t]
+        self.groups = []            # [(원문 OR 단어 목록, 단어별 정규식 목록)] - 포함 조건
+        self.group_labels = []
+        self.excludes = []          # 제외 단어별 정규식
+        self.exclude_labels = []
+        for term in self.terms:
+            if term.startswith('-'):
+                if normalize_text(term[1:]):
+                    self.excludes.append(compile_term(term[1:]))
+                    self.exclude_labels.append(term)
+                continue
+            alternatives = [a for a in term.split('|') if normalize_text(a)]
+            if alternatives:
+                self.groups.append((alternatives, [compile_term(a) for a in alternatives]))
+                self.group_labels.append(term)
+
+    @property
+    def primary_keywords(self):
+        """API에 보낼 1차 검색어들 (첫 번째 포함 조건의 OR 단어들)"""
+        return self.groups[0][0] if self.groups else []
+
+    @property
+    def primary_label(self):
+        return self.group_labels[0] if self.group_labels else ''
+
+    @property
+    def detail_labels(self):
+        """1차 검색어를 뺀 나머지 조건 (안내 문구용)"""
+        return self.group_labels[1:] + self.exclude_labels
+
+    def mask(self, texts):
+        """texts 전체에 대해 조건을 만족하는지 bool 배열로 돌려준다."""
+        texts = [str(t) if t is not None else '' for t in texts]
+        result = np.zeros(len(texts), dtype=bool)
+        rows = np.arange(len(texts))   # 아직 모든 조건을 통과 중인 행 번호
+        checks = [(patterns, True) for _, patterns in self.groups]
+        checks += [([pattern], False) for pattern in self.excludes]
+
+        for patterns, wanted in checks:
+            if not len(rows):
+                return result
+            subset = texts if len(rows) == len(texts) else [texts[i] for i in rows]
+            joined, starts = self._join(subset)
+            hit = np.zeros(len(subset), dtype=bool)
+            for pattern in patterns:
+                positions = np.fromiter(map(re.Match.start, pattern.finditer(joined)), dtype=np.int64)
+                hit[np.searchsorted(starts, positions, side='right') - 1] = True
+            rows = rows[hit == wanted]
+        result[rows] = True
+        return result
+
+    @staticmethod
+    def _join(texts):
+        """구분자로 이어 붙인 NFC 문자열과 각 제목의 시작 위치"""
+        joined = MATCH_SEPARATOR.join(texts)
+        if joined.count(MATCH_SEPARATOR) != max(len(texts) - 1, 0):
+            texts = [t.replace(MATCH_SEPARATOR, '') for t in texts]
+            joined = MATCH_SEPARATOR.join(texts)
+        if not unicodedata.is_normalized('NFC', joined):
+            texts = [unicodedata.normalize('NFC', t) for t in texts]
+            joined = MATCH_SEPARATOR.join(texts)
+        lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts)) + 1
+        return joined, np.cumsum(lengths) - lengths
+
+    def filter(self, items, field):
+        """items 중 field 값이 조건을 만족하는 것만 남긴다."""
+        if not items or not (self.groups or self.excludes):
+            return items
+        mask = self.mask([item.get(field, '') for item in items])
+        return [items[i] for i in np.flatnonzero(mask)]
+
+class SearchConditions:
+    """검색어 외의 검색 조건: 공고기관명 · 수요기관명 · 금액 범위(원)
+
+    API가 받는 조건(CATEGORY_API의 condition_fields)은 요청 파라미터로 넣어 게이트웨이가
+    맞는 공고만 돌려주게 하고, 받은 공고에는 모든 조건을 로컬에서 다시 적용한다.
+    (API가 받지 않는 조건·검색유형, API로 보낼 수 없는 'a|b' · '-제외' 같은 문법도 걸러진다)
+    기관명은 검색어와 같은 문법이며, 첫 조건이 단어 하나이면 그 단어를 API에 보낸다.
+    금액은 입찰공고는 추정가격, 사전규격은 배정예산금액 기준이고 금액이 없는 공고는 뺀다.
+    """
+
+    def __init__(self, institution='', demand_institution='', min_amount=None, max_amount=None):
+        self.matchers = {}          # 조건 이름 → KeywordMatcher (입력한 기관명 조건만)
+        for name, text in (('institution', institution), ('demand_institution', demand_institution)):
+            matcher = KeywordMatcher(text or '')
+            if matcher.groups:
+                self.matchers[name] = matcher
+        self.min_amount = min_amount
+        self.max_amount = max_amount
+
+    def __bool__(self):
+        return bool(self.matchers) or self.min_amount is not None or self.max_amount is not None
+
+    @property
+    def labels(self):
+        """조건 설명 (안내 문구용)"""
+        names = {'institution': '공고기관', 'demand_institution': '수요기관'}
+        labels = [f"{names[name]} '{' '.join(matcher.terms)}'" for name, matcher in self.matchers.items()]
+        low, high = (format_money([value])[0] if value is not None else None
+                     for value in (self.min_amount, self.max_amount))
+        if low and high:
+            labels.append(f"금액 {low} ~ {high}")
+        elif low or high:
+            labels.append(f"금액 {low} 이상" if low else f"금액 {high} 이하")
+        return labels
+
+    def query_params(self, category):
+        """이 검색유형의 API가 받는 조건을 요청 파라미터('&이름=값...')로"""
+        params = []
+        for name, (param, _) in CATEGORY_API[category]['condition_fields'].items():
+            if param is None:
+                continue
+            if name == 'amount':
+                for bound, value in zip(param, (self.min_amount, self.max_amount)):
+                    if value is not None:
+                        params.append(f"&{bound}={int(value)}")
+            elif name in self.matchers:
+                alternatives = self.matchers[name].groups[0][0]
+                if len(alternatives) == 1:
+                    params.append(f"&{param}={quote(alternatives[0])}")
+        return ''.join(params)
+
+    def filter(self, category, items):
+        """items 중 모든 조건을 만족하는 공고만 남긴다."""
+        if not items or not self:
+            return items
+        fields = CATEGORY_API[category]['condition_fields']
+        for name, matcher in self.matchers.items():
+            items = matcher.filter(items, fields[name][1])
+        if self.min_amount is not None or self.max_amount is not None:
+            amounts = parse_amounts(pd.Series([item.get(fields['amount'][1]) for item in items], dtype=object))
+            keep = amounts.notna()
+            if self.min_amount is not None:
+                keep &= amounts >= self.min_amount
+            if self.max_amount is not None:
+                keep &= amounts <= self.max_amount
+            items = [items[i] for i in np.flatnonzero(keep.to_numpy())]
+        return items
+
+def local_conditions(conditions, category, items):
+    """로컬 저장소에서 꺼낸 공고에 검색 조건을 적용한다 (조건이 없으면 그대로)."""
+    return conditions.filter(category, items) if conditions else items
+
+def no_result_message(conditions=None):
+    """받은 공고가 하나도 없을 때의 메시지 (검색 조건이 있으면 함께 보여준다)"""
+    if conditions:
+        return f"검색 결과가 없습니다. (검색 조건: {', '.join(conditions.labels)})"
+    return "검색 결과가 없습니다."
+
+# ==========================================
+# 검색 워커 (스레드)
+# ==========================================
+def split_date_windows(start_dt, end_dt, max_days=MAX_WINDOW_DAYS):
+    """[start_dt, end_dt] 기간을 달력 기준 최대 max_days일짜리 구간들로 나눈다."""
+    windows = []
+    window_start = start_dt
+    while window_start <= end_dt:
+        day_start = datetime(window_start.year, window_start.month, window_start.day)
+        window_end = min(end_dt, day_start + timedelta(days=max_days) - timedelta(minutes=1))
+        windows.append((window_start, window_end))
+        window_start = window_end + timedelta(minutes=1)
+    return windows
+
+def item_day(item, date_field):
+    """공고의 기준 일시('YYYY-MM-DD HH:MM:SS')에서 'YYYYMMDD'를 꺼낸다."""
+    value = str(item.get(date_field) or '')[:10].replace('-', '').replace('/', '')
+    return value if len(value) == 8 and value.isdigit() else None
+
+def consecutive_day_runs(days):
+    """정렬된 'YYYYMMDD' 목록을 연속된 날짜 묶음들로 나눈다."""
+    runs = []
+    prev = None
+    for day in days:
+        current = datetime.strptime(day, '%Y%m%d')
+        if prev is not None and current - prev == timedelta(days=1):
+            runs[-1].append(day)
+        else:
+            runs.append([day])
+        prev = current
+    return runs
+
+def dedupe_items(items, key_fields):
+    """key_fields 값이 같은 공고를 한 번만 남긴다 (구간 경계에서 중복 수신된 공고 제거)."""
+    seen = set()
+    unique = []
+    for item in items:
+        key = tuple(item.get(f) for f in key_fields)
+        if any(key):
+            if key in seen:
+                continue
+            seen.add(key)
+        unique.append(item)
+    return unique
+
+class NoticeFetcher:
+    """한 검색 유형의 기간 내 공고를 API(와 캐시)에서 가져오는 Qt 비의존 수집기
+
+    SearchWorker와 헤드리스 수집기(run_harvest)가 함께 사용한다.
+    키워드 필터는 하지 않으며, params_base 조건과 1차 검색어(primary_keyword)로 받아온다.
+    cancel_event(threading.Event)가 설정되면 남은 페이지 요청을 버리고 SearchCancelled를 낸다.
+    받은 공고는 CATEGORY_API의 fields만 남긴다 (raw이면 API 원본 필드 그대로).
+    conditions(SearchConditions)가 주어지면 API가 받는 조건은 요청에 넣고, 모든 조건으로 다시 거른다.
+    """
+
+    def __init__(self, category, params_base, start_dt, end_dt, primary_keyword='',
+                 max_pages=MAX_PAGES, max_workers=MAX_CONCURRENT_PAGES, cache=None, store=None, timings=None,
+                 cancel_event=None, raw=False, conditions=None):
+        self.category = category
+        self.api = CATEGORY_API[category]
+        self.url_base = self.api['url']
+        self.params_base = params_base
+        self.start_dt = start_dt
+        self.end_dt = end_dt
+        self.primary_keyword = primary_keyword
+        self.max_pages = max_pages
+        self.max_workers = max_workers
+        self.cache = cache
+        self.store = store
+        self.timings = timings or SearchTimings()
+        self.cancel_event = cancel_event
+        self.fields = None if raw else self.api['fields']
+        self.conditions = conditions
+        self.condition_params = conditions.query_params(category) if conditions else ''
+        # 조건을 넣어 받은 응답은 조건 없이 받은 것과 따로 캐시한다
+        self.cache_keyword = primary_keyword + self.condition_params
+
+    def fetch_page(self, window, page_no):
+        """한 구간의 한 페이지를 요청하여 (items, totalCount)를 돌려준다."""
+        begin_str = window[0].strftime('%Y%m%d%H%M')
+        end_str = window[1].strftime('%Y%m%d%H%M')
+        keyword_params = ''
+        if self.primary_keyword:
+            keyword_params = f"&{self.api['keyword_param']}={quote(self.primary_keyword)}"
+        current_params = (f"{self.params_base}{keyword_params}{self.condition_params}"
+                          f"&inqryBgnDt={begin_str}&inqryEndDt={end_str}"
+                          f"&pageNo={page_no}&numOfRows={ROWS_PER_PAGE}")
+        full_url = self.url_base + current_params
+        
+        data = request_json(full_url, self.timings, f"{self.category} {begin_str}~{end_str} {page_no}쪽",
+                            self.cancel_event)
+
+        result_code = None
+        if 'response' in data and 'header' in data['response']:
+            result_code = data['response']['header'].get('resultCode')
+        elif 'nkoneps.com.response.ResponseError' in data:
+            result_code = data['nkoneps.com.response.ResponseError'].get('header', {}).get('resultCode')
+        elif 'resultCode' in data:
+            result_code = data.get('resultCode')
+
+        if str(result_code) == "07":
+            raise SearchError(f"최대 검색기간을 초과하였습니다. ({begin_str} ~ {end_str})")
+
+        if 'response' not in data or 'body' not in data['response']:
+            return [], 0
+
+        body = data['response']['body']
+        items = body.get('items')
+        total_count = int(body.get('totalCount') or 0)
+
+        if not items:
+            return [], total_count
+
+        if isinstance(items, dict):
+            items = [items]
+
+        # 필요한 필드만 남기고 원본 응답(data)은 여기서 버린다
+        with self.timings.measure('parse'):
+            items = project_items(items, self.fields)
+        return items, total_count
+
+    def iter_pages(self, windows):
+        """여러 구간의 모든 페이지를 하나의 풀에서 동시에 요청하고, 구간·페이지 순서대로 내놓는다.
+
+        각 구간의 1페이지에서 totalCount를 확인한 뒤 나머지 페이지를 같은 풀에 넣는다.
+        (구간 번호, items, 구간별 totalCount 목록)을 페이지가 준비되는 대로 yield한다.
+        """
+        if not windows:
+            return
+
+        pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            first_futures = [pool.submit(self.fetch_page, w, 1) for w in windows]
+            first_pages = [self.page_result(f) for f in first_futures]
+            window_totals = [window_total for _, window_total in first_pages]
+
+            rest_futures = {}
+            for wi, (items, window_total) in enumerate(first_pages):
+                if not items:
+                    continue
+                total_pages = math.ceil(window_total / ROWS_PER_PAGE)
+                for p in range(2, min(total_pages, self.max_pages) + 1):
+                    rest_futures[(wi, p)] = pool.submit(self.fetch_page, windows[wi], p)
+
+            for wi, (items, _) in enumerate(first_pages):
+                yield wi, items, window_totals
+                p = 2
+                while (wi, p) in rest_futures:
+                    items, _ = self.page_result(rest_futures[(wi, p)])
+                    yield wi, items, window_totals
+                    p += 1
+        finally:
+            # 오류·취소로 끝나면 아직 시작하지 않은 페이지 요청은 버린다.
+            # 취소된 경우에는 받는 중인 요청도 기다리지 않는다 (끝나는 대로 결과를 버림)
+            cancelled = self.cancel_event is not None and self.cancel_event.is_set()
+            pool.shutdown(wait=not cancelled, cancel_futures=True)
+
+    def page_result(self, future):
+        """페이지 요청 결과를 기다린다. 기다리는 중에 취소되면 바로 SearchCancelled를 낸다."""
+        if self.cancel_event is not None:
+            while not wait((future,), timeout=CANCEL_POLL_SECONDS).done:
+                check_cancelled(self.cancel_event)
+            check_cancelled(self.cancel_event)
+        return future.result()
+
+    def fetch_all(self, on_items=None):
+        """검색 기간의 공고를 날짜 단위로 캐시에서 꺼내고, 없는 날짜만 API로 요청한다.
+
+        캐시에 없는 연속된 날짜들은 31일 이하 구간으로 나누어 한꺼번에 요청하고,
+        받은 공고를 날짜별로 나누어 캐시에 저장한다. 공고는 실제 검색 기간
+        (시·분 포함)으로 걸러지고 구간 경계에서 중복 수신된 것은 제거된다.
+
+        on_items(items, 수신 건수, 전체 예상 건수)가 주어지면 캐시분과 각 페이지가
+        준비되는 대로 걸러진 공고를 넘겨준다.
+
+        반환값: (items, totalCount 합계, 페이지 상한 도달 여부, 캐시에서 꺼낸 날짜 수)
+        """
+        check_cancelled(self.cancel_event)
+        date_field = self.api['date_field']
+        key_fields = self.api['key_fields']
+        days = []
+        day = self.start_dt.date()
+        while day <= self.end_dt.date():
+            days.append(day.strftime('%Y%m%d'))
+            day += timedelta(days=1)
+
+        cached = {}
+        if self.cache is not None:
+            with self.timings.measure('cache'):
+                cached = self.cache.get_days(self.category, self.cache_keyword, days)
+        missing = [d for d in days if d not in cached]
+
+        if self.cache is None:
+            # 캐시를 쓰지 않으면 날짜 단위로 넓힐 필요 없이 요청한 기간만 받는다
+            windows = split_date_windows(self.start_dt, self.end_dt)
+        else:
+            windows = []
+            for run in consecutive_day_runs(missing):
+                run_start = datetime.strptime(run[0], '%Y%m%d')
+                run_end = datetime.strptime(run[-1], '%Y%m%d') + timedelta(hours=23, minutes=59)
+                windows.extend(split_date_windows(run_start, run_end))
+
+        # 실제 검색 기간(시·분)으로 자르고 중복을 제거한다. 기준 일시가 없는 공고는 그대로 둔다.
+        begin_str = self.start_dt.strftime('%Y-%m-%d %H:%M')
+        end_str = self.end_dt.strftime('%Y-%m-%d %H:%M')
+        seen = set()
+        def accept(items):
+            kept = []
+            for item in items:
+                stamp = str(item.get(date_field) or '')[:16]
+                if stamp and not (begin_str <= stamp <= end_str):
+                    continue
+                key = tuple(item.get(f) for f in key_fields)
+                if any(key):
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                kept.append(item)
+            return self.conditions.filter(self.category, kept) if self.conditions else kept
+
+        all_items = []
+        cached_items = [item for d in days for item in cached.get(d, [])]
+        received = len(cached_items)
+        expected = received
+        if cached_items:
+            with self.timings.measure('filter'):
+                kept = accept(cached_items)
+            all_items.extend(kept)
+            if on_items:
+                on_items(kept, received, expected)
+
+        fetched = {d: [] for d in missing}
+        undated = []
+        window_totals = []
+        for wi, items, window_totals in self.iter_pages(windows):
+            with self.timings.measure('filter'):
+                for item in items:
+                    item_date = item_day(item, date_field)
+                    if item_date in fetched:
+                        fetched[item_date].append(item)
+                    else:
+                        undated.append(item)
+                kept = accept(items)
+            all_items.extend(kept)
+            received += len(items)
+            expected = len(cached_items) + sum(window_totals)
+            if on_items:
+                on_items(kept, received, expected)
+
+        truncated = False
+        incomplete_days = set()
+        for window, window_total in zip(windows, window_totals):
+            if math.ceil(window_total / ROWS_PER_PAGE) > self.max_pages:
+                truncated = True
+                first_day, last_day = window[0].strftime('%Y%m%d'), window[1].strftime('%Y%m%d')
+                incomplete_days.update(d for d in missing if first_day <= d <= last_day)
+
+        if self.store is not None:
+            with self.timings.measure('store'):
+                self.store.add_items(self.category, [item for items in fetched.values() for item in items] + undated)
+
+        if self.cache is not None:
+            open_from = (date.today() - timedelta(days=CACHE_OPEN_DAYS)).strftime('%Y%m%d')
+            closed = {d: v for d, v in fetched.items() if d < open_from and d not in incomplete_days}
+            recent = {d: v for d, v in fetched.items() if d >= open_from and d not in incomplete_days}
+            with self.timings.measure('cache'):
+                self.cache.put_days(self.category, self.cache_keyword, closed, CACHE_TTL_SECONDS)
+                self.cache.put_days(self.category, self.cache_keyword, recent, CACHE_OPEN_TTL_SECONDS)
+
+        return all_items, expected, truncated, len(cached)
+
+# ==========================================
+# 검색 실행 (화면의 워커와 명령줄이 같이 쓴다)
+# ==========================================
+def search_params(service_key):
+    """모든 검색 요청에 붙는 공통 쿼리 문자열"""
+    return f'inqryDiv=1&type=json&serviceKey={service_key}'
+
+def search_category(category, params_base, matcher, start_dt, end_dt, on_page=None,
+                    max_pages=MAX_PAGES, max_workers=MAX_CONCURRENT_PAGES, cache=None, store=None, timings=None,
+                    cancel_event=None, raw=False, conditions=None):
+    """한 검색유형에서 검색어 조건(AND/OR/NOT)에 맞는 공고를 모은다.
+
+    1차 검색어가 OR('a|b')이면 단어마다 따로 요청해서 합친다. on_page(dict)가
+    주어지면 페이지마다 걸러진 공고와 진행 상황을 넘겨준다.
+    conditions(SearchConditions)가 주어지면 기관명·금액 조건도 적용한다 (API가 받는 것은 요청에 넣음).
+    결과가 없거나 요청이 실패하면 화면에 그대로 보여줄 메시지로 SearchError를 낸다.
+    cancel_event가 설정되면 남은 요청을 버리고 SearchCancelled를 낸다.
+    raw이면 공고를 필요한 필드로 줄이지 않는다 (API 원본 그대로 저장할 때).
+    """
+    title_field = CATEGORY_API[category]['title_field']
+    key_fields = CATEGORY_API[category]['key_fields']
+    timings = timings or SearchTimings()
+    fetchers = [NoticeFetcher(category, params_base, start_dt, end_dt,
+                              primary_keyword=keyword,
+                              max_pages=max_pages, max_workers=max_workers,
+                              cache=cache, store=store, timings=timings, cancel_event=cancel_event, raw=raw,
+                              conditions=conditions)
+                for keyword in matcher.primary_keywords]
+
+    final_items = []
+    seen = set()
+    received_before = 0
+    expected_before = 0
+
+    def on_items(items, received, expected):
+        # 페이지마다 걸러진 공고를 바로 넘긴다
+        matched = []
+        with timings.measure('filter'):
+            for item in matcher.filter(items, title_field):
+                if len(fetchers) > 1:
+                    key = tuple(item.get(f) for f in key_fields)
+                    if any(key):
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                matched.append(item)
+        final_items.extend(matched)
+        if on_page:
+            on_page({
+                'category': category,
+                'items': matched,
+                'received': received_before + received,
+                'expected': expected_before + expected,
+                'matched': len(final_items),
+            })
+
+    fetched_count = 0
+    total_count = 0
+    truncated = False
+    cached_days = 0
+    for fetcher in fetchers:
+        all_items, fetcher_total, fetcher_truncated, fetcher_cached = fetcher.fetch_all(on_items=on_items)
+        fetched_count += len(all_items)
+        total_count += fetcher_total
+        truncated = truncated or fetcher_truncated
+        cached_days += fetcher_cached
+        received_before = expected_before = total_count
+
+    if not fetched_count:
+        raise SearchError(no_result_message(conditions))
+
+    if not final_items:
+        if matcher.detail_labels:
+            detail_msg = f"상세 조건('{', '.join(matcher.detail_labels)}')을 만족하는"
+        else:
+            detail_msg = "조건에 맞는"
+        msg = f"'{matcher.primary_label}' 관련 데이터 {fetched_count}개를 가져왔으나,\n{detail_msg} 공고는 없습니다."
+        if truncated:
+            msg += f"\n(전체 {total_count}건 중 {fetched_count}건만 조회되었습니다. 검색어나 기간을 좁혀주세요.)"
+        raise SearchError(msg)
+
+    return {
+        'category': category,
+        'items': final_items,
+        'total_count': total_count,
+        'fetched_count': fetched_count,
+        'truncated': truncated,
+        'max_pages': max_pages,
+        'cached_days': cached_days,
+        'streamed': True,
+    }
+
+def search_combined(params_base, matcher, start_dt, end_dt, on_page=None, categories=tuple(CATEGORY_API),
+                    max_pages=MAX_PAGES, max_workers=MAX_CONCURRENT_PAGES,
+                    max_fetchers=HTTP_POOL_SIZE // MAX_CONCURRENT_PAGES, cache=None, store=None, timings=None,
+                    cancel_event=None, raw=False, conditions=None):
+    """입찰공고·사전규격을 동시에 검색한다 (통합 검색).
+
+    두 API(1차 검색어가 OR이면 단어마다)를 병렬로 요청하므로 걸리는 시간은 둘 중
+    느린 쪽 정도다. 걸러진 공고에는 CATEGORY_FIELD에 검색유형을 적어 넘기고,
+    공통 컬럼으로 바꾸는 일은 build_unified_result가 한다.
+    """
+    timings = timings or SearchTimings()
+    fetchers = [(category, NoticeFetcher(category, params_base, start_dt, end_dt,
+                                         primary_keyword=keyword,
+                                         max_pages=max_pages, max_workers=max_workers,
+                                         cache=cache, store=store, timings=timings,
+                                         cancel_event=cancel_event, raw=raw, conditions=conditions))
+                for category in categories for keyword in matcher.primary_keywords]
+
+    lock = threading.Lock()
+    progress = {}
+    seen = set()
+    counts = {category: 0 for category, _ in fetchers}
+    final_items = []
+
+    def on_items(index, category, items, received, expected):
+        api = CATEGORY_API[category]
+        matched = []
+        with lock, timings.measure('filter'):
+            progress[index] = (received, expected)
+            for item in matcher.filter(items, api['title_field']):
+                key = tuple(item.get(f) for f in api['key_fields'])
+                if any(key):
+                    # 키가 없는 공고는 서로 다른 공고일 수 있으므로 합치지 않는다
+                    if (category,) + key in seen:
+                        continue
+                    seen.add((category,) + key)
+                item = dict(item)
+                item[CATEGORY_FIELD] = category
+                matched.append(item)
+            final_items.extend(matched)
+            counts[category] += len(matched)
+            received_all = sum(r for r, _ in progress.values())
+            expected_all = sum(e for _, e in progress.values())
+            matched_all = len(final_items)
+        if on_page:
+            on_page({
+                'category': COMBINED_CATEGORY,
+                'items': matched,
+                'received': received_all,
+                'expected': expected_all,
+                'matched': matched_all,
+            })
+
+    fetched_count = 0
+    total_count = 0
+    truncated = False
+    cached_days = 0
+    failures = []
+    with ThreadPoolExecutor(max_workers=min(max_fetchers, len(fetchers))) as pool:
+        futures = {}
+        for index, (category, fetcher) in enumerate(fetchers):
+            callback = lambda items, received, expected, i=index, c=category: on_items(i, c, items, received, expected)
+            futures[pool.submit(fetcher.fetch_all, on_items=callback)] = (category, fetcher.primary_keyword)
+        for future in as_completed(futures):
+            try:
+                items, fetcher_total, fetcher_truncated, fetcher_cached = future.result()
+            except SearchCancelled:
+                raise
+            except SearchError as e:
+                category, keyword = futures[future]
+                failures.append(f"{category} '{keyword}': {e}")
+                continue
+            fetched_count += len(items)
+            total_count += fetcher_total
+            truncated = truncated or fetcher_truncated
+            cached_days += fetcher_cached
+
+    if failures and len(failures) == len(fetchers):
+        raise SearchError("\n".join(failures))
+
+    if not final_items:
+        if not fetched_count:
+            raise SearchError(no_result_message(conditions))
+        msg = f"'{matcher.primary_label}' 관련 데이터 {fetched_count}개를 가져왔으나,\n조건에 맞는 공고는 없습니다."
+        if failures:
+            msg += "\n(실패: " + ", ".join(failures) + ")"
+        raise SearchError(msg)
+
+    return {
+        'category': COMBINED_CATEGORY,
+        'items': final_items,
+        'total_count': total_count,
+        'fetched_count': fetched_count,
+        'truncated': truncated,
+        'max_pages': max_pages,
+        'cached_days': cached_days,
+        'streamed': True,
+        'category_counts': counts,
+        'failures': failures,
+    }
+
+def search_shortcuts(category, params_base, queries, start_dt, end_dt, on_page=None,
+                     max_pages=MAX_PAGES, max_workers=MAX_CONCURRENT_PAGES,
+                     max_fetchers=BATCH_MAX_FETCHERS, cache=None, store=None, timings=None, cancel_event=None,
+                     unfiltered=False, allow_empty=False, conditions=None):
+    """저장단어 여러 개([(저장단어 원문, KeywordMatcher)])를 한 번에 검색한다.
+
+    1차 검색어(API로 보내는 단어)가 같은 저장단어들은 한 번 받아온 공고를 같이 쓰고,
+    나머지 조건은 저장단어마다 로컬에서 거른다. 서로 다른 1차 검색어는 동시에 받아오며,
+    결과는 공고 키 기준으로 합치고 어느 저장단어에 걸렸는지 BATCH_LABEL_FIELD에 적는다.
+    unfiltered이면 검색어 없이 기간 전체를 한 번 받아 모든 조건을 로컬에서 거르고(짧은 기간용),
+    allow_empty이면 조건에 맞는 공고가 없어도 오류 대신 빈 결과를 돌려준다 (저장단어 감시).
+    conditions(SearchConditions)는 모든 저장단어에 같이 적용한다.
+    """
+    title_field = CATEGORY_API[category]['title_field']
+    timings = timings or SearchTimings()
+    keywords = [''] if unfiltered else [k for _, matcher in queries for k in matcher.primary_keywords]
+    fetchers = {}
+    for keyword in keywords:
+        if keyword not in fetchers:
+            fetchers[keyword] = NoticeFetcher(category, params_base, start_dt, end_dt,
+                                              primary_keyword=keyword,
+                                              max_pages=max_pages, max_workers=max_workers,
+                                              cache=cache, store=store, timings=timings,
+                                              cancel_event=cancel_event, conditions=conditions)
+
+    progress = {keyword: (0, 0) for keyword in fetchers}
+    lock = threading.Lock()
+    merged = {}                 # 공고 키 → item (처음 나온 순서 유지)
+    labels = {}                 # 공고 키 → 걸린 저장단어 목록
+
+    def report(keyword, received, expected):
+        with lock:
+            progress[keyword] = (received, expected)
+            received_all = sum(r for r, _ in progress.values())
+            expected_all = sum(e for _, e in progress.values())
+            matched = len(merged)
+        if on_page:
+            on_page({
+                'category': category,
+                'items': [],
+                'received': received_all,
+                'expected': expected_all,
+                'matched': matched,
+            })
+
+    fetched_count = 0
+    total_count = 0
+    truncated = False
+    cached_days = 0
+    failures = []
+    with ThreadPoolExecutor(max_workers=max_fetchers) as pool:
+        futures = {
+            pool.submit(fetcher.fetch_all,
+                        on_items=lambda items, received, expected, k=keyword: report(k, received, expected)): keyword
+            for keyword, fetcher in fetchers.items()}
+        for future in as_completed(futures):
+            keyword = futures[future]
+            try:
+                items, fetcher_total, fetcher_truncated, fetcher_cached = future.result()
+            except SearchCancelled:
+                raise
+            except SearchError as e:
+                failures.append(f"'{keyword or '전체'}': {e}")
+                continue
+            fetched_count += len(items)
+            total_count += fetcher_total
+            truncated = truncated or fetcher_truncated
+            cached_days += fetcher_cached
+
+            # 이 1차 검색어를 쓰는 저장단어들의 나머지 조건을 로컬에서 적용한다
+            with lock, timings.measure('filter'):
+                for label, matcher in queries:
+                    if keyword and keyword not in matcher.primary_keywords:
+                        continue
+                    for item in matcher.filter(items, title_field):
+                        key = notice_key(category, item)     # 키 필드가 빈 공고는 내용 해시로 구별된다
+                        if key not in merged:
+                            merged[key] = item
+                            labels[key] = []
+                        if label not in labels[key]:
+                            labels[key].append(label)
+            report(keyword, *progress[keyword])
+
+    if failures and len(failures) == len(fetchers):
+        raise SearchError("\n".join(failures))
+
+    if not merged and not allow_empty:
+        if not fetched_count:
+            raise SearchError(no_result_message(conditions))
+        msg = f"저장단어 {len(queries)}개로 데이터 {fetched_count}개를 가져왔으나,\n조건에 맞는 공고는 없습니다."
+        if failures:
+            msg += "\n(실패: " + ", ".join(failures) + ")"
+        raise SearchError(msg)
+
+    # 받아온 순서와 관계없이 저장단어 순서·공고 일시 순으로 정리한다
+    position = {label: i for i, (label, _) in enumerate(queries)}
+    date_field = CATEGORY_API[category]['date_field']
+    final_items = []
+    for key, item in merged.items():
+        item = dict(item)
+        item[BATCH_LABEL_FIELD] = ", ".join(sorted(labels[key], key=position.get))
+        final_items.append(item)
+    final_items.sort(key=lambda item: str(item.get(date_field) or ''))
+
+    return {
+        'category': category,
+        'items': final_items,
+        'total_count': total_count,
+        'fetched_count': fetched_count,
+        'truncated': truncated,
+        'max_pages': max_pages,
+        'cached_days': cached_days,
+        'batch': len(queries),
+        'failures': failures,
+    }
+
+def search_local(store, category, query, start_dt, end_dt, timings=None, conditions=None):
+    """API 호출 없이 로컬 공고 저장소에서 검색한다 (통합이면 두 유형 모두)."""
+    if not store.parse_query(query)[0]:
+        raise SearchError("검색어를 입력해주세요. (제외어 '-단어'만으로는 검색할 수 없습니다)")
+    started = time.perf_counter()
+    if category == COMBINED_CATEGORY:
+        items = []
+        for each in CATEGORY_API:
+            for item in local_conditions(conditions, each, store.search(each, query, start_dt, end_dt)):
+                item[CATEGORY_FIELD] = each
+                items.append(item)
+    else:
+        items = local_conditions(conditions, category, store.search(category, query, start_dt, end_dt))
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if timings is not None:
+        timings.add('store', elapsed_ms / 1000)
+    if not items:
+        raise SearchError(no_result_message(conditions) + " (로컬 저장소)")
+    return {
+        'category': category,
+        'items': items,
+        'total_count': len(items),
+        'fetched_count': len(items),
+        'truncated': False,
+        'local': True,
+        'elapsed_ms': elapsed_ms,
+    }
+
+def refine_local(store, category, query, start_dt, end_dt, timings=None, conditions=None):
+    """API를 부르지 않고, 이미 받아 둔 공고(로컬 저장소)를 API 검색과 같은 검색어 문법으로 다시 거른다.
+
+    '입력하며 좁히기'에서 검색어를 고칠 때마다 쓴다. 결과 dict는 search_local과 같은 모양이다.
+    """
+    matcher = KeywordMatcher(query)
+    if not matcher.groups:
+        raise SearchError("검색어를 입력해주세요. (제외어 '-단어'만으로는 검색할 수 없습니다)")
+    started = time.perf_counter()
+    if category == COMBINED_CATEGORY:
+        items = []
+        for each in CATEGORY_API:
+            for item in local_conditions(conditions, each, store.match_titles(each, matcher, start_dt, end_dt)):
+                item[CATEGORY_FIELD] = each
+                items.append(item)
+    else:
+        items = local_conditions(conditions, category, store.match_titles(category, matcher, start_dt, end_dt))
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if timings is not None:
+        timings.add('store', elapsed_ms / 1000)
+    if not items:
+        raise SearchError("받아 둔 공고 중에는 조건에 맞는 공고가 없습니다. (Enter를 누르면 API로 검색합니다)")
+    return {
+        'category': category,
+        'items': items,
+        'total_count': len(items),
+        'fetched_count': len(items),
+        'truncated': False,
+        'local': True,
+        'refined': True,
+        'elapsed_ms': elapsed_ms,
+    }
+
+def history_keys(items, category):
+    """검색 기록에 남길 결과 공고 키 목록: [검색유형, 공고 키(, 걸린 저장단어)]"""
+    keys = []
+    for item in items:
+        each = item.get(CATEGORY_FIELD, category) if category == COMBINED_CATEGORY else category
+        key = [each, notice_key(each, item)]
+        if BATCH_LABEL_FIELD in item:
+            key.append(item[BATCH_LABEL_FIELD])
+        keys.append(key)
+    return keys
+
+def recall_search(store, entry):
+    """검색 기록(SettingsStore.get_history)의 결과를 다시 받지 않고 로컬 저장소에서 되살린다."""
+    started = time.perf_counter()
+    category = entry['category']
+    wanted = {}
+    for key in entry['result_keys']:
+        wanted.setdefault(key[0], []).append(key[1])
+    found = {each: store.get_items(each, keys) for each, keys in wanted.items()}
+    items = []
+    for key in entry['result_keys']:
+        item = found[key[0]].get(key[1])
+        if item is None:
+            continue
+        if category == COMBINED_CATEGORY:
+            item[CATEGORY_FIELD] = key[0]
+        if len(key) > 2:
+            item[BATCH_LABEL_FIELD] = key[2]
+        items.append(item)
+    if not items:
+        raise SearchError("검색 결과가 없습니다. (로컬 저장소에 남아 있는 공고가 없습니다)")
+    return {
+        'category': category,
+        'items': items,
+        'total_count': len(items),
+        'fetched_count': len(items),
+        'truncated': False,
+        'recalled': True,
+        'missing': len(entry['result_keys']) - len(items),
+        'history': {k: v for k, v in entry.items() if k != 'result_keys'},
+        'elapsed_ms': (time.perf_counter() - started) * 1000,
+    }
+
+def search(category, query, start_dt, end_dt, service_key='', on_page=None, local=False, cache=None, store=None,
+           timings=None, cancel_event=None, raw=False, conditions=None):
+    """검색유형(입찰공고/사전규격/통합)과 검색어로 검색해 결과 dict를 돌려준다.
+
+    local이면 로컬 저장소만, 아니면 API를 검색한다. 잘못된 입력이나 결과 없음은 SearchError.
+    raw이면 받은 공고를 필요한 필드로 줄이지 않는다. conditions는 SearchConditions (기관명·금액).
+    """
+    if category not in CATEGORY_API and category != COMBINED_CATEGORY:
+        raise SearchError("검색 유형(입찰공고/사전규격/통합)을 선택해주세요.")
+    if start_dt > end_dt:
+        raise SearchError("검색 시작일이 종료일보다 늦습니다.")
+    if local:
+        return search_local(store or NoticeStore(), category, query, start_dt, end_dt, timings=timings,
+                            conditions=conditions)
+
+    matcher = KeywordMatcher(query)
+    if not matcher.groups:
+        raise SearchError("검색어를 입력해주세요. (제외어 '-단어'만으로는 검색할 수 없습니다)")
+    if not service_key:
+        raise SearchError("API 인증키를 입력해주세요.")
+    if category == COMBINED_CATEGORY:
+        return search_combined(search_params(service_key), matcher, start_dt, end_dt, on_page=on_page,
+                               cache=cache, store=store, timings=timings, cancel_event=cancel_event, raw=raw,
+                               conditions=conditions)
+    return search_category(category, search_params(service_key), matcher, start_dt, end_dt, on_page=on_page,
+                           cache=cache, store=store, timings=timings, cancel_event=cancel_event, raw=raw,
+                           conditions=conditions)
+
+# ==========================================
+# 저장단어 감시 (마지막 확인 이후에 등록된 공고만 받아 새 공고를 알린다)
+# ==========================================
+WATCH_INTERVAL_MINUTES = 30            # 감시 간격 기본값(분)
+WATCH_CATEGORY = "입찰공고"             # 감시할 검색 유형 기본값 (설정 DB migration 4의 기본값과 같다)
+WATCH_OVERLAP_MINUTES = HARVEST_OVERLAP_MINUTES   # 지난 확인 시각보다 얼마나 앞에서부터 다시 받을지 (게시 반영 지연 대비)
+WATCH_MAX_DAYS = 21                    # 오래 꺼 두었다가 켜도 이보다 오래된 공고는 받지 않는다 (3주 검색과 같은 기간)
+WATCH_UNFILTERED_HOURS = 2             # 확인 기간이 이 이하이면 검색어 없이 한 번에 받아 저장단어마다 로컬에서 거른다
+
+def poll_watchlist(settings_store, category, params_base, queries, now=None, store=None, timings=None,
+                   cancel_event=None):
+    """저장단어들([(저장단어 원문, KeywordMatcher)])을 마지막 확인 이후 기간만 검색해 새 공고를 돌려준다.
+
+    저장단어마다 마지막으로 확인한 시각(SettingsStore.watch_states)에서 WATCH_OVERLAP_MINUTES만큼
+    앞부터 지금까지만 요청하고, 그 사이 이미 본 공고 키와 비교해 처음 보는 공고만 남긴다.
+    확인 기간이 같은 저장단어끼리는 요청을 같이 쓰며, 기간이 짧으면(WATCH_UNFILTERED_HOURS)
+    저장단어 수와 관계없이 검색어 없이 한 번만 받는다. 처음 감시하는 저장단어는 겹치는 기간만
+    받아 기준으로 삼고 알리지 않는다. 통합이면 입찰공고·사전규격을 차례로 확인한다.
+    일부만 받았으면(실패·페이지 상한) 확인 시각을 앞당기지 않는다 (다음 확인에서 다시 받는다).
+    """
+    started = time.perf_counter()
+    now = now or datetime.now().replace(second=0, microsecond=0)
+    timings = timings or SearchTimings()
+    overlap = timedelta(minutes=WATCH_OVERLAP_MINUTES)
+    cutoff = (now - overlap).strftime('%Y-%m-%d %H:%M')     # 다음 확인에서 다시 받을 수 있는 공고의 시작
+    position = {label: i for i, (label, _) in enumerate(queries)}
+    categories = list(CATEGORY_API) if category == COMBINED_CATEGORY else [category]
+
+    found = []                  # (공고 일시, 새 공고)
+    failures = []
+    fetched_count = 0
+    truncated = False
+    checked = 0                 # 받아 온 확인 기간 수
+    new_watches = set()         # 이번에 처음 감시를 시작한 저장단어
+    start_all = now
+    for each in categories:
+        api = CATEGORY_API[each]
+        states = settings_store.watch_states(each)
+        groups = {}             # 확인 시작 시각 → 그 기간을 확인할 저장단어들
+        for label, matcher in queries:
+            high_water, _ = states.get(label, (None, set()))
+            if high_water is None:
+                start_dt = now - overlap
+                new_watches.add(label)
+            else:
+                start_dt = max(now - timedelta(days=WATCH_MAX_DAYS), high_water - overlap)
+            groups.setdefault(min(start_dt, now), []).append((label, matcher))
+
+        updates = {}
+        new_labels = {}         # 공고 키 → (item, 새로 걸린 저장단어들)
+        for start_dt, group in sorted(groups.items()):
+            try:
+                result = search_shortcuts(each, params_base, group, start_dt, now, store=store, timings=timings,
+                                          cancel_event=cancel_event, allow_empty=True,
+                                          unfiltered=now - start_dt <= timedelta(hours=WATCH_UNFILTERED_HOURS))
+            except SearchCancelled:
+                raise
+            except SearchError as e:
+                failures.append(f"[{each}] {e}")
+                continue
+            checked += 1
+            start_all = min(start_all, start_dt)
+            fetched_count += result['fetched_count']
+            truncated = truncated or result['truncated']
+            failures += [f"[{each}] {failure}" for failure in result['failures']]
+            complete = not (result['failures'] or result['truncated'])
+
+            with timings.measure('filter'):
+                for label, matcher in group:
+                    high_water, seen = states.get(label, (None, set()))
+                    matched = {notice_key(each, item): item
+                               for item in matcher.filter(result['items'], api['title_field'])}
+                    if high_water is not None:
+                        for key, item in matched.items():
+                            if key not in seen:
+                                new_labels.setdefault(key, (item, []))[1].append(label)
+                    if complete:
+                        # 다음 확인 기간에 다시 나올 수 있는 공고 키만 남긴다
+                        kept = {key for key, item in matched.items()
+                                if str(item.get(api['date_field']) or '')[:16] >= cutoff
+                                or not item.get(api['date_field'])}
+                        updates[label] = (now, kept)
+                    else:
+                        updates[label] = (high_water, seen | set(matched))
+
+        if updates:
+            settings_store.set_watch_states(each, updates)
+        for item, labels in new_labels.values():
+            item = dict(item)
+            item[BATCH_LABEL_FIELD] = ", ".join(sorted(labels, key=position.get))
+            if category == COMBINED_CATEGORY:
+                item[CATEGORY_FIELD] = each
+            found.append((str(item.get(api['date_field']) or ''), item))
+
+    if failures and not checked:
+        raise SearchError("\n".join(failures))
+    found.sort(key=lambda pair: pair[0])
+    items = [item for _, item in found]
+    return {
+        'category': category,
+        'items': items,
+        'total_count': len(items),
+        'fetched_count': fetched_count,
+        'truncated': truncated,
+        'batch': len(queries),
+        'failures': failures,
+        'watch': {'start_dt': start_all, 'checked_at': now, 'started': len(new_watches),
+                  'labels': [label for label, _ in queries]},
+        'elapsed_ms': (time.perf_counter() - started) * 1000,
+    }
+
+# ==========================================
+# 결과 표 (검색마다 DataFrame 하나, 화면·저장·첨부파일은 컬럼 이름만 바꿔 보는 ColumnView)
+# ==========================================
+# 값이 몇 가지뿐인 문자 컬럼은 category로 둔다 (같은 기관명·계약방법을 행마다 따로 갖지 않게)
+CATEGORICAL_FIELDS = {
+    'ntceInsttNm', 'dminsttNm', 'ntceKindNm', 'bidMethdNm', 'cntrctCnclsMthdNm', 'bidPrtcptLmtYn',
+    'sucsfbidLwltRate', 'sucsfbidMthdNm', 'orderInsttNm', 'rlDminsttNm', 'ofclNm', 'ofclTelNo',
+    BATCH_LABEL_FIELD,
+}
+DETAIL_LINK_COLUMN = '상세링크'     # 행을 더블클릭하면 여는 링크 (화면에서는 숨김)
+
+def result_column(field, values):
+    """공고 필드 값 목록을 결과 표 컬럼으로 만든다 (금액은 숫자, 일시는 datetime, CATEGORICAL_FIELDS는 category)."""
+    if field in MONEY_FIELDS:
+        return parse_amounts(pd.Series(values, dtype=object)).to_numpy()
+    if field in DATETIME_FIELDS:
+        return parse_datetimes(pd.Series(values, dtype=object)).to_numpy()
+    if field in CATEGORICAL_FIELDS:
+        return pd.Categorical(values)
+    return values
+
+def concat_frames(frames):
+    """같은 컬럼 구성의 DataFrame들을 이어 붙인다 (category 컬럼은 카테고리를 합쳐 category 그대로)."""
+    if len(frames) == 1:
+        return frames[0]
+    columns = {}
+    for name in frames[0].columns:
+        parts = [frame[name] for frame in frames]
+        if isinstance(parts[0].dtype, pd.CategoricalDtype):
+            columns[name] = pd.api.types.union_categoricals(parts, ignore_order=True)
+        else:
+            columns[name] = pd.concat(parts, ignore_index=True)
+    return pd.DataFrame(columns)
+
+class ColumnView:
+    """ResultFrame의 컬럼 일부를 다른 이름으로 보여주는 읽기 전용 보기 (데이터를 복사하지 않는다)
+
+    columns · len() · view[이름](Series) · items()를 DataFrame처럼 쓸 수 있어서 PandasModel,
+    첨부파일 목록, 파일 저장이 그대로 읽는다. 행을 DataFrame으로 만드는 것은 slice()뿐이다.
+    """
+
+    def __init__(self, result, columns):
+        self._result = result
+        self._sources = dict(columns)       # 보이는 이름 → ResultFrame.frame 컬럼
+        self.columns = list(self._sources)
+
+    def __len__(self):
+        return len(self._result)
+
+    @property
+    def empty(self):
+        return len(self) == 0
+
+    def __getitem__(self, name):
+        return self._result.frame[self._sources[name]]
+
+    def items(self):
+        for name in self.columns:
+            yield name, self[name]
+
+    def value(self, row, name):
+        return self[name].iat[row]
+
+    def slice(self, start, stop):
+        """start:stop 행을 보이는 컬럼 이름의 DataFrame으로 만든다 (저장할 때 덩어리 단위로만 쓴다)."""
+        frame = self._result.frame
+        positions = frame.columns.get_indexer(list(self._sources.values()))
+        return frame.iloc[start:stop, positions].set_axis(self.columns, axis=1)
+
+class ResultFrame:
+    """한 검색 결과를 담는 타입이 정해진 DataFrame 하나
+
+    금액·일시는 숫자·datetime, 값이 몇 가지뿐인 문자 컬럼은 category로 가진다. 화면(display),
+    저장(export), 링크·첨부파일(links)은 컬럼 이름만 바꿔 보는 ColumnView로 읽는다.
+    검색 중에는 페이지마다 extend()로 이어 붙이고, frame은 처음 읽을 때 한 번만 합친다.
+    """
+
+    def __init__(self, frame, category, display_columns, export_columns, hidden_columns):
+        self.category = category
+        self.display_columns = display_columns     # 화면에 보이는 컬럼: 이름 → frame 컬럼
+        self.export_columns = export_columns       # 파일로 저장하는 컬럼
+        self.hidden_columns = hidden_columns       # 화면에서 숨기는 상세링크·첨부파일 URL 컬럼
+        self._frames = [frame]
+        self._frame = frame
+        self._rows = len(frame)
+
+    def __len__(self):
+        return self._rows
+
+    @property
+    def frame(self):
+        if self._frame is None:
+            self._frame = concat_frames(self._frames)
+            self._frames = [self._frame]
+        return self._frame
+
+    def extend(self, other):
+        """같은 검색유형의 결과(다음 페이지)를 끝에 이어 붙인다."""
+        if len(other):
+            self._frames.append(other.frame)
+            self._frame = None
+            self._rows += len(other)
+
+    def display(self):
+        return ColumnView(self, self.display_columns)
+
+    def export(self):
+        return ColumnView(self, self.export_columns)
+
+    def links(self):
+        return ColumnView(self, {**self.display_columns, **self.hidden_columns})
+
+def build_result(items, category):
+    """API items로 검색 결과(ResultFrame)를 만든다.
+
+    컬럼은 CATEGORY_API의 display_columns · export_columns · file_fields를 한 번씩만 갖고,
+    화면·저장용 이름은 ColumnView가 붙인다. 공고 dict에서 컬럼별로 바로 값을 꺼내 타입을 정하므로
+    원본 전체를 담은 중간 DataFrame을 만들지 않는다. 페이지마다 만들어 extend()로 이어 붙일 수
+    있도록 공고에 없는 필드도 빈 컬럼으로 채워 항상 같은 구성으로 만든다.
+    """
+    if category == COMBINED_CATEGORY:
+        return build_unified_result(items)
+
+    api = CATEGORY_API[category]
+    fields = dict.fromkeys([*api['display_columns'], *api['export_columns'], *api['file_fields']])
+    columns = {field: result_column(field, [item.get(field, '') for item in items]) for field in fields}
+    display = {label: field for field, label in api['display_columns'].items()}
+    if DETAIL_LINK_COLUMN not in display:
+        # 사전규격은 상세링크가 없다 (더블클릭 시 '링크 없음' 안내)
+        columns[DETAIL_LINK_COLUMN] = [''] * len(items)
+        display[DETAIL_LINK_COLUMN] = DETAIL_LINK_COLUMN
+    hidden = {DETAIL_LINK_COLUMN: display.pop(DETAIL_LINK_COLUMN)}
+    hidden.update((field, field) for field in api['file_fields'])
+    export = {label: field for field, label in api['export_columns'].items()}
+
+    # 저장단어 전체 검색: 어느 저장단어에 걸린 공고인지 맨 앞에 표시
+    if any(BATCH_LABEL_FIELD in item for item in items):
+        columns[BATCH_LABEL_FIELD] = result_column(BATCH_LABEL_FIELD, [item.get(BATCH_LABEL_FIELD, '') for item in items])
+        display = {'검색어': BATCH_LABEL_FIELD, **display}
+        export = {'검색어': BATCH_LABEL_FIELD, **export}
+
+    return ResultFrame(pd.DataFrame(columns), category, display, export, hidden)
+
+def build_unified_result(items):
+    """통합 검색 결과를 검색유형과 관계없는 공통 컬럼(UNIFIED_COLUMNS)으로 만든다.
+
+    공고마다 CATEGORY_FIELD의 검색유형에 따라 CATEGORY_API의 unified_fields·
+    file_fields에서 값을 꺼내 원래 순서대로 한 컬럼에 담는다.
+    """
+    sources = {}
+    for category, api in CATEGORY_API.items():
+        sources[category] = {label: field for field, label in api['unified_fields'].items()}
+        sources[category].update(zip(UNIFIED_FILE_COLUMNS, api['file_fields']))
+    kinds = [item[CATEGORY_FIELD] for item in items]
+    columns = {'구분': pd.Categorical(kinds)}
+    for name in UNIFIED_COLUMNS[1:]:
+        # 금액·일시·category 여부는 검색유형과 관계없이 같으므로 처음 나오는 원본 필드로 정한다
+        field = next((each[name] for each in sources.values() if name in each), name)
+        columns[name] = result_column(field, [item.get(sources[kind].get(name), '') for item, kind in zip(items, kinds)])
+
+    hidden_names = [DETAIL_LINK_COLUMN] + UNIFIED_FILE_COLUMNS
+    display = {name: name for name in UNIFIED_COLUMNS if name not in hidden_names}
+    hidden = {name: name for name in hidden_names}
+    export = {**display, DETAIL_LINK_COLUMN: DETAIL_LINK_COLUMN}
+    return ResultFrame(pd.DataFrame(columns), COMBINED_CATEGORY, display, export, hidden)
+
+# ==========================================
+# 헤드리스 수집기 (명령줄 / 작업 스케줄러용)
+# ==========================================
+def load_service_key():
+    """설정 DB에 저장된 API 인증키를 읽는다."""
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        row = conn.execute("SELECT api_key FROM settings WHERE id=1").fetchone()
+        conn.close()
+        return (row[0] or '').strip() if row else ''
+    except Exception:
+        return ''
+
+def run_harvest(service_key, categories=None, window_days=HARVEST_WINDOW_DAYS, full=False, store=None):
+    """키워드 없이 입찰공고·사전규격 전체를 로컬 저장소로 내려받는다.
+
+    유형별로 마지막 수집 시점(high-water mark)을 기록해 두고, 다음 실행에서는
+    그 이후(HARVEST_OVERLAP_MINUTES만큼 겹쳐서)에 등록된 공고만 요청한다.
+    반환값: 유형별 수집 건수
+    """
+    store = store or NoticeStore()
+    categories = categories or list(CATEGORY_API)
+    now = datetime.now().replace(second=0, microsecond=0)
+    window_start = now - timedelta(days=window_days)
+    summary = {}
+
+    for category in categories:
+        high_water = None if full else store.get_high_water(category)
+        start_dt = window_start
+        if high_water is not None:
+            start_dt = max(window_start, high_water - timedelta(minutes=HARVEST_OVERLAP_MINUTES))
+
+        params_base = search_params(service_key)
+        fetcher = NoticeFetcher(category, params_base, start_dt, now,
+                                max_pages=HARVEST_MAX_PAGES, store=store)
+        started = time.perf_counter()
+        items, total_count, truncated, _ = fetcher.fetch_all()
+        elapsed = time.perf_counter() - started
+
+        if truncated:
+            # 일부만 받았으므로 기록을 앞당기지 않는다 (다음 실행에서 다시 받는다)
+            print(f"[{category}] 페이지 상한({HARVEST_MAX_PAGES})에 도달하여 일부만 수집했습니다. "
+                  f"({len(items)} / {total_count}건)")
+        else:
+            store.set_high_water(category, now)
+
+        print(f"[{category}] {start_dt:%Y-%m-%d %H:%M} ~ {now:%Y-%m-%d %H:%M}: "
+              f"{len(items)}건 수집 ({elapsed:.1f}초)")
+        summary[category] = len(items)
+
+    return summary
+
+def harvest_main(argv, prog='narasearch_v1'):
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description='나라장터 입찰공고·사전규격을 키워드 없이 로컬 저장소로 수집합니다.')
+    parser.add_argument('--harvest', action='store_true', help='헤드리스 수집 모드로 실행')
+    parser.add_argument('--category', choices=list(CATEGORY_API) + ['all'], default='all',
+                        help='수집할 검색 유형 (기본: all)')
+    parser.add_argument('--days', type=int, default=HARVEST_WINDOW_DAYS,
+                        help=f'오늘부터 며칠 전까지 수집할지 (기본: {HARVEST_WINDOW_DAYS})')
+    parser.add_argument('--full', action='store_true', help='마지막 수집 시점을 무시하고 기간 전체를 다시 수집')
+    parser.add_argument('--service-key', default=None,
+                        help='API 인증키 (생략 시 NARASEARCH_SERVICE_KEY 환경변수, 그 다음 설정 DB 사용)')
+    args = parser.parse_args(argv)
+
+    service_key = args.service_key or os.environ.get('NARASEARCH_SERVICE_KEY') or load_service_key()
+    if not service_key:
+        print("API 인증키가 없습니다. --service-key 옵션이나 프로그램 설정에서 입력해주세요.")
+        return 2
+
+    categories = None if args.category == 'all' else [args.category]
+    try:
+        run_harvest(service_key, categories, args.days, args.full)
+    except SearchError as e:
+        print(f"수집 실패: {e}")
+        return 1
+    return 0
+
+# ==========================================
+# 결과 저장 (엑셀 / CSV / JSON Lines / Parquet)
+# ==========================================
+EXPORT_FORMATS = ('jsonl', 'csv', 'xlsx', 'parquet')
+EXPORT_CHUNK_ROWS = 5000     # 저장할 때 한 번에 변환해 쓰는 행 수 (진행률 알림 단위)
+
+def export_format_for(path, default='jsonl'):
+    """파일 확장자로 저장 형식을 고른다 (모르는 확장자·표준출력이면 default)."""
+    ext = os.path.splitext(path or '')[1].lower().lstrip('.')
+    return ext if ext in EXPORT_FORMATS else default
+
+def parquet_supported():
+    """Parquet 저장에 필요한 pyarrow가 설치되어 있는지 (선택 설치)"""
+    return importlib.util.find_spec('pyarrow') is not None
+
+def export_column(df, series):
+    """저장할 컬럼 값: 검색 결과(ColumnView)의 금액은 원 단위 정수로 쓴다 (빈 값은 그대로 비워 둔다).
+
+    결과 표에서 float 컬럼은 금액(parse_amounts)뿐이다. 그대로 쓰면 '1960000000.0'처럼 소수로 저장된다.
+    """
+    if isinstance(df, ColumnView) and series.dtype.kind == 'f':
+        return series.round().astype('Int64')
+    return series
+
+def export_chunks(df):
+    """저장용으로 df를 EXPORT_CHUNK_ROWS 행씩 나눈다 (빈 표도 머리글을 쓰도록 한 번은 돌려준다).
+
+    df가 ColumnView이면 덩어리마다 그 행만 저장용 컬럼 이름의 DataFrame으로 만들고 금액은 정수로 바꾼다.
+    """
+    for start in range(0, max(len(df), 1), EXPORT_CHUNK_ROWS):
+        if isinstance(df, ColumnView):
+            chunk = df.slice(start, start + EXPORT_CHUNK_ROWS)
+            yield pd.DataFrame({name: export_column(df, series) for name, series in chunk.items()})
+        else:
+            yield df.iloc[start:start + EXPORT_CHUNK_ROWS]
+
+def export_frame(df, stream, fmt, on_progress=None):
+    """DataFrame(또는 ResultFrame.export()의 ColumnView)을 fmt 형식으로 바이너리 스트림(파일·표준출력)에 쓴다.
+
+    금액(원 단위 정수)·일시는 타입을 유지한다: 엑셀은 숫자·날짜 셀, CSV는 'YYYY-MM-DD HH:MM:SS',
+    JSON Lines는 ISO 8601 문자열과 숫자(빈 값은 null), Parquet은 열 타입 그대로 쓴다.
+    EXPORT_CHUNK_ROWS 행씩 변환해 바로 쓰므로 파일 전체를 메모리에 만들지 않으며,
+    한 덩어리를 쓸 때마다 on_progress(쓴 행 수, 전체 행 수)를 부른다.
+    """
+    writers = {'xlsx': _export_xlsx, 'csv': _export_csv, 'jsonl': _export_jsonl, 'parquet': _export_parquet}
+    if fmt not in writers:
+        raise ValueError(f"지원하지 않는 저장 형식입니다: {fmt}")
+    total = len(df)
+    written = 0
+    for rows in writers[fmt](df, stream):
+        written += rows
+        if on_progress:
+            on_progress(written, total)
+
+def _export_xlsx(df, stream):
+    """쓰기 전용(write_only) 통합문서로 행을 흘려 쓴다 (메모리 사용량이 행 수와 무관)."""
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet('Sheet1')
+    ws.append([str(name) for name in df.columns])
+
+    date_columns = [i for i, (_, series) in enumerate(df.items()) if series.dtype.kind == 'M']
+    for chunk in export_chunks(df):
+        columns = [series.astype(object).where(series.notna(), None).tolist() for _, series in chunk.items()]
+        for i in date_columns:
+            cells = columns[i]
+            for j, value in enumerate(cells):
+                if value is not None:
+                    cell = WriteOnlyCell(ws, value=value)
+                    cell.number_format = EXCEL_DATETIME_FORMAT
+                    cells[j] = cell
+        for row in zip(*columns):
+            ws.append(row)
+        yield len(chunk)
+    wb.save(stream)
+
+def _export_csv(df, stream):
+    for i, chunk in enumerate(export_chunks(df)):
+        text = chunk.to_csv(index=False, header=(i == 0), date_format=DISPLAY_DATETIME_FORMAT)
+        # 엑셀에서 바로 열 수 있도록 맨 앞에만 BOM을 붙인다
+        stream.write(text.encode('utf-8-sig' if i == 0 else 'utf-8'))
+        yield len(chunk)
+
+def _export_jsonl(df, stream):
+    for chunk in export_chunks(df):
+        if len(chunk):
+            text = chunk.to_json(orient='records', lines=True, force_ascii=False, date_format='iso', date_unit='s')
+            # pandas 버전에 따라 마지막 줄바꿈이 있기도 없기도 하다 (빈 줄이 생기면 JSON Lines가 깨진다)
+            if not text.endswith('\n'):
+                text += '\n'
+            stream.write(text.encode('utf-8'))
+        yield len(chunk)
+
+def _export_parquet(df, stream):
+    """분석 파이프라인용: 덩어리마다 row group 하나씩 쓴다 (pyarrow 필요)."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError("Parquet 저장에는 pyarrow가 필요합니다. (pip install pyarrow)")
+    # 덩어리마다 타입을 추론하면 빈 값만 있는 덩어리에서 스키마가 달라지므로 전체로 한 번 정한다
+    # (컬럼 하나씩 보므로 ColumnView도 전체를 DataFrame으로 만들지 않는다)
+    schema = pa.schema([pa.Schema.from_pandas(export_column(df, series).to_frame(str(name)), preserve_index=False).field(0)
+                        for name, series in df.items()])
+    with pq.ParquetWriter(stream, schema) as writer:
+        for chunk in export_chunks(df):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+            yield len(chunk)
+
+def export_items(items, stream, fmt):
+    """API 원본 items를 가공 없이 저장한다 (--raw)."""
+    if fmt == 'jsonl':
+        for item in items:
+            stream.write(json.dumps(item, ensure_ascii=False).encode('utf-8'))
+            stream.write(b'\n')
+    else:
+        export_frame(pd.DataFrame(items), stream, fmt)
+
+# ==========================================
+# 첨부파일 일괄 내려받기 (공고별 폴더, 이어받기, 내용 해시로 중복 제거)
+# ==========================================
+DOWNLOAD_DIR = os.path.join(BASE_DIR, 'downloads')
+DOWNLOAD_STORE_DIR = '.store'     # 내려받기 폴더 안의 원본 보관소 (sha256 이름으로 한 번만 저장)
+DOWNLOAD_WORKERS = 8              # 동시에 내려받는 파일 수
+DOWNLOAD_PER_HOST = 3             # 한 서버에 동시에 여는 연결 수
+DOWNLOAD_CHUNK_BYTES = 64 * 1024     # 연결이 끊기면 최대 이만큼만 다시 받는다
+DOWNLOAD_PROGRESS_INTERVAL = 0.2  # 진행 상황 알림 최소 간격(초)
+
+# 결과 표(ResultFrame.links())에서 첨부파일 받기에 쓰는 컬럼: (공고번호, 공고명, 파일 URL 컬럼들)
+ATTACHMENT_COLUMNS = {
+    "입찰공고": ('입찰공고번호', '입찰공고명', CATEGORY_API["입찰공고"]['file_fields']),
+    "사전규격": ('사전규격등록번호', '품명(사업명)', CATEGORY_API["사전규격"]['file_fields']),
+    COMBINED_CATEGORY: ('공고번호', '공고명', UNIFIED_FILE_COLUMNS),
+}
+WINDOWS_RESERVED_NAMES = {'CON', 'PRN', 'AUX', 'NUL', *(f'COM{i}' for i in range(1, 10)), *(f'LPT{i}' for i in range(1, 10))}
+
+class DownloadCancelled(Exception):
+    """사용자가 내려받기를 중지함"""
+    pass
+
+def safe_filename(name, max_length=120):
+    """Windows에서도 쓸 수 있는 파일·폴더 이름 (금지 문자 치환, 길이 제한은 확장자를 남긴다)"""
+    name = re.sub(r'[\\/:*?"<>|\x00-\x1f]', '_', unicodedata.normalize('NFC', str(name)))
+    name = re.sub(r'\s+', ' ', name).strip().rstrip('. ')
+    if name.split('.')[0].upper() in WINDOWS_RESERVED_NAMES:
+        name = '_' + name
+    if len(name) > max_length:
+        stem, ext = os.path.splitext(name)
+        ext = ext if len(ext) <= 10 else ''
+        name = stem[:max_length - len(ext)].rstrip('. ') + ext
+    return name
+
+def attachment_filename(headers, url, fallback):
+    """Content-Disposition에서 원래 파일 이름을 꺼낸다.
+
+    나라장터 서버는 파일 이름을 EUC-KR 바이트 그대로 보내는 경우가 많아, latin-1로
+    잘못 읽힌 이름을 UTF-8 → CP949 순으로 다시 풀어 본다.
+    """
+    disposition = headers.get('Content-Disposition', '')
+    match = re.search(r"filename\*\s*=\s*([\w-]*)'[^']*'([^;]+)", disposition, re.I)
+    if match:
+        name = unquote(match.group(2).strip(), encoding=match.group(1) or 'utf-8', errors='replace')
+    else:
+        match = re.search(r'filename\s*=\s*"?([^";]+)"?', disposition, re.I)
+        if match:
+            name = match.group(1).strip()
+            for encoding in ('utf-8', 'cp949'):
+                try:
+                    name = name.encode('latin-1').decode(encoding)
+                    break
+                except (UnicodeEncodeError, UnicodeDecodeError):
+                    continue
+            if '%' in name:
+                name = unquote(name)
+        else:
+            # fileDownload.do 같은 주소는 파일 이름이 아니다
+            name = os.path.basename(urlparse(url).path)
+            if not re.search(r'\.\w{1,5}$', name) or re.search(r'\.(do|jsp|php|aspx?)$', name, re.I):
+                name = ''
+    return safe_filename(name) or fallback
+
+def attachment_jobs(df, category, rows=None):
+    """결과 표에서 내려받을 첨부파일 목록 [(공고 폴더 이름, URL, 기본 파일 이름)]을 만든다.
+
+    df는 DataFrame 또는 ResultFrame.links()의 ColumnView.
+    rows: df의 행 위치 목록 (None이면 전체). URL이 없는 칸은 건너뛴다.
+    """
+    notice_column, title_column, url_columns = ATTACHMENT_COLUMNS[category]
+    url_columns = [c for c in url_columns if c in df.columns]
+    if not url_columns:
+        return []
+    columns = [df[c].to_numpy(dtype=object) for c in [notice_column, title_column] + url_columns]
+    if rows is not None:
+        rows = list(rows)
+        columns = [values[rows] for values in columns]
+    jobs = []
+    for record in zip(*columns):
+        folder = safe_filename(f"{record[0]} {record[1]}", max_length=80)
+        for i, url in enumerate(record[2:], 1):
+            url = '' if url is None else str(url).strip()
+            if url.startswith('http'):
+                jobs.append((folder, url, f"첨부파일{i}"))
+    return jobs
+
+def file_sha256(path):
+    """파일 내용의 sha256 (첨부파일 중복 확인용)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class AttachmentStore:
+    """내려받은 첨부파일의 원본 보관소
+
+    파일 내용은 <폴더>/.store/<sha256>에 한 번만 저장하고, 공고별 폴더에는 하드링크
+    (안 되는 파일 시스템이면 복사)로 놓는다. URL → sha256 색인(SQLite)을 두어 다시
+    받을 때는 네트워크를 쓰지 않고, 받다 만 파일은 partial/에 남겨 이어받는다.
+    """
+
+    def __init__(self, root=DOWNLOAD_DIR):
+        self.root = root
+        self.store_dir = os.path.join(root, DOWNLOAD_STORE_DIR)
+        self.partial_dir = os.path.join(self.store_dir, 'partial')
+        self.index_path = os.path.join(self.store_dir, 'index.db')
+        os.makedirs(self.partial_dir, exist_ok=True)
+        self._place_lock = threading.Lock()
+        conn = sqlite3.connect(self.index_path, timeout=10)
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS attachments (
+                url TEXT PRIMARY KEY,
+                sha256 TEXT,
+                filename TEXT,
+                size INTEGER,
+                downloaded_at REAL
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    def blob_path(self, sha256):
+        return os.path.join(self.store_dir, sha256)
+
+    def partial_path(self, url):
+        return os.path.join(self.partial_dir, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.part')
+
+    def lookup(self, url):
+        """이미 받은 URL이면 (sha256, 파일 이름, 크기), 아니면 None"""
+        conn = sqlite3.connect(self.index_path, timeout=10)
+        try:
+            row = conn.execute("SELECT sha256, filename, size FROM attachments WHERE url=?", (url,)).fetchone()
+        finally:
+            conn.close()
+        if row and os.path.exists(self.blob_path(row[0])):
+            return row
+        return None
+
+    def commit(self, url, part_path, filename):
+        """다 받은 임시 파일을 내용 해시 이름으로 보관소에 넣는다 (같은 내용이 있으면 버림)."""
+        sha256 = file_sha256(part_path)
+        size = os.path.getsize(part_path)
+        if os.path.exists(self.blob_path(sha256)):
+            os.remove(part_path)
+        else:
+            os.replace(part_path, self.blob_path(sha256))
+        conn = sqlite3.connect(self.index_path, timeout=10)
+        try:
+            conn.execute("INSERT OR REPLACE INTO attachments VALUES (?, ?, ?, ?, ?)",
+                         (url, sha256, filename, size, time.time()))
+            conn.commit()
+        finally:
+            conn.close()
+        return sha256, size
+
+    def place(self, sha256, folder, filename):
+        """보관소 파일을 <root>/<folder>/<filename>에 놓는다. 이름이 겹치면 ' (2)'를 붙인다.
+
+        이미 같은 내용이 놓여 있으면 아무것도 하지 않는다. 놓은 경로를 돌려준다.
+        """
+        blob = self.blob_path(sha256)
+        folder_path = os.path.join(self.root, folder)
+        stem, ext = os.path.splitext(filename)
+        with self._place_lock:
+            os.makedirs(folder_path, exist_ok=True)
+            for n in range(1, 1000):
+                target = os.path.join(folder_path, filename if n == 1 else f"{stem} ({n}){ext}")
+                if not os.path.exists(target):
+                    break
+                if os.path.samefile(target, blob) or (os.path.getsize(target) == os.path.getsize(blob)
+                                                      and file_sha256(target) == sha256):
+                    return target
+            try:
+                os.link(blob, target)
+            except OSError:
+                shutil.copyfile(blob, target)
+        return target
+
+class AttachmentDownloader:
+    """첨부파일을 여러 개 동시에 받는다 (서버별 연결 수 제한, 이어받기, 중복 제거).
+
+    같은 URL은 한 번만 받고, 내용이 같은 파일은 AttachmentStore에 한 번만 저장한다.
+    on_progress(dict)는 DOWNLOAD_PROGRESS_INTERVAL 간격으로 불린다:
+        files_done, files_total, bytes_done, bytes_total(크기를 아는 파일만), rate(바이트/초), failed
+    """
+
+    def __init__(self, store, on_progress=None, cancel_event=None,
+                 max_workers=DOWNLOAD_WORKERS, per_host=DOWNLOAD_PER_HOST):
+        self.store = store
+        self.on_progress = on_progress
+        self.cancel_event = cancel_event or threading.Event()
+        self.max_workers = max_workers
+        self.per_host = per_host
+        self._host_limits = {}
+        self._lock = threading.Lock()
+        self._received = {}      # URL → 이번에 받은 바이트 (이어받기 전에 받아 둔 부분은 빼고)
+        self._sizes = {}         # URL → 이번에 받을 크기 (Content-Length를 알 때만)
+        self._files_done = 0
+        self._failed = 0
+        self._files_total = 0
+        self._started = 0.0
+        self._last_report = 0.0
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=max_workers, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        # 압축해서 보내면 Range 위치가 파일 위치와 달라지므로 원본 그대로 받는다
+        self.session.headers['Accept-Encoding'] = 'identity'
+
+    def _host_limit(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.BoundedSemaphore(self.per_host)
+            return self._host_limits[host]
+
+    def _report(self, force=False):
+        if not self.on_progress:
+            return
+        now = time.perf_counter()
+        with self._lock:
+            if not force and now - self._last_report < DOWNLOAD_PROGRESS_INTERVAL:
+                return
+            self._last_report = now
+            bytes_done = sum(self._received.values())
+            progress = {
+                'files_done': self._files_done, 'files_total': self._files_total, 'failed': self._failed,
+                'bytes_done': bytes_done, 'bytes_total': sum(self._sizes.values()),
+                'rate': bytes_done / max(now - self._started, 1e-6),
+            }
+        self.on_progress(progress)
+
+    def _set_received(self, url, received):
+        with self._lock:
+            self._received[url] = received
+        self._report()
+
+    def download(self, url, fallback_name):
+        """URL 하나를 받아 보관소에 넣고 (sha256, 파일 이름)을 돌려준다."""
+        known = self.store.lookup(url)
+        if known:
+            sha256, filename, size = known
+            with self._lock:
+                self._received[url] = self._sizes[url] = 0   # 네트워크로 받은 양이 아니므로 세지 않는다
+            return sha256, filename
+
+        part_path = self.store.partial_path(url)
+        meta_path = part_path + '.json'
+        last_error = ""
+        for attempt in range(MAX_RETRIES + 1):
+            if self.cancel_event.is_set():
+                raise DownloadCancelled()
+            if attempt > 0:
+                time.sleep(backoff_delay(attempt - 1))
+            offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+            meta = {}
+            if offset and os.path.exists(meta_path):
+                with open(meta_path, encoding='utf-8') as f:
+                    meta = json.load(f)
+            headers = {}
+            if offset:
+                headers['Range'] = f'bytes={offset}-'
+                if meta.get('validator'):
+                    headers['If-Range'] = meta['validator']   # 서버 파일이 바뀌었으면 처음부터 받는다
+            try:
+                with self._host_limit(url):
+                    with self.session.get(url, headers=headers, stream=True,
+                                          timeout=(CONNECT_TIMEOUT, READ_TIMEOUT)) as res:
+                        if res.status_code == 416:
+                            # 이미 다 받은 파일에 Range를 보낸 경우 등: 처음부터 다시
+                            os.remove(part_path)
+                            last_error = "HTTP 416"
+                            continue
+                        if res.status_code >= 500:
+                            last_error = f"HTTP {res.status_code}"
+                            continue
+                        if res.status_code not in (200, 206):
+                            raise SearchError(f"HTTP {res.status_code}")
+                        if res.status_code == 200:
+                            offset = 0
+                        if ('html' in res.headers.get('Content-Type', '')
+                                and 'filename' not in res.headers.get('Content-Disposition', '')):
+                            raise SearchError("파일 대신 웹 페이지가 돌아왔습니다 (삭제되었거나 만료된 첨부파일)")
+                        filename = meta.get('filename') if offset else None
+                        filename = filename or attachment_filename(res.headers, url, fallback_name)
+                        length = res.headers.get('Content-Length')
+                        with self._lock:
+                            if length and length.isdigit():
+                                self._sizes[url] = int(length)
+                            self._received[url] = 0
+                        with open(meta_path, 'w', encoding='utf-8') as f:
+                            json.dump({'validator': res.headers.get('ETag') or res.headers.get('Last-Modified'),
+                                       'filename': filename}, f, ensure_ascii=False)
+                        received = offset
+                        with open(part_path, 'ab' if offset else 'wb') as f:
+                            for chunk in res.iter_content(DOWNLOAD_CHUNK_BYTES):
+                                if self.cancel_event.is_set():
+                                    raise DownloadCancelled()
+                                f.write(chunk)
+                                received += len(chunk)
+                                self._set_received(url, received - offset)
+                        if length and length.isdigit() and received < offset + int(length):
+                            last_error = "연결이 중간에 끊어졌습니다"
+                            continue
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+                last_error = f"서버 연결 실패: {e.__class__.__name__}"
+                continue
+            sha256, size = self.store.commit(url, part_path, filename)
+            if os.path.exists(meta_path):
+                os.remove(meta_path)
+            return sha256, filename
+        raise SearchError(f"{last_error} (재시도 {MAX_RETRIES}회 실패)")
+
+    def run(self, jobs):
+        """jobs: [(공고 폴더 이름, URL, 기본 파일 이름)] → 결과 요약 dict"""
+        by_url = {}
+        for folder, url, fallback_name in jobs:
+            by_url.setdefault(url, {'fallback': fallback_name, 'folders': []})
+            if folder not in by_url[url]['folders']:
+                by_url[url]['folders'].append(folder)
+        self._files_total = len(by_url)
+        self._started = time.perf_counter()
+        result = {'root': self.store.root, 'files': 0, 'placed': 0, 'reused': 0, 'failed': [], 'bytes': 0,
+                  'cancelled': False}
+
+        def fetch(url):
+            job = by_url[url]
+            sha256, filename = self.download(url, job['fallback'])
+            return [self.store.place(sha256, folder, filename) for folder in job['folders']]
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures = {executor.submit(fetch, url): url for url in by_url}
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    placed = future.result()
+                except DownloadCancelled:
+                    result['cancelled'] = True
+                    continue
+                except Exception as e:
+                    with self._lock:
+                        self._failed += 1
+                    result['failed'].append((url, str(e)))
+                    continue
+                with self._lock:
+                    self._files_done += 1
+                    if not self._received.get(url):
+                        result['reused'] += 1
+                result['files'] += 1
+                result['placed'] += len(placed)
+                self._report()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        result['cancelled'] = result['cancelled'] or self.cancel_event.is_set()
+        result['bytes'] = sum(self._received.values())
+        result['elapsed'] = time.perf_counter() - self._started
+        self._report(force=True)
+        return result
+
+def download_attachments(jobs, root=DOWNLOAD_DIR, on_progress=None, cancel_event=None,
+                         max_workers=DOWNLOAD_WORKERS, per_host=DOWNLOAD_PER_HOST):
+    """첨부파일 목록(attachment_jobs)을 root 아래 공고별 폴더로 받는다."""
+    store = AttachmentStore(root)
+    downloader = AttachmentDownloader(store, on_progress, cancel_event, max_workers, per_host)
+    return downloader.run(jobs)
+
+# ==========================================
+# 명령줄 실행 (PyQt5 없이 서버·작업 스케줄러에서 사용)
+# ==========================================
+def parse_cli_datetime(text, end_of_day=False):
+    """'2026-10-01' 또는 '2026-10-01 09:30' 형식의 명령줄 일시"""
+    for fmt in ('%Y-%m-%d %H:%M', '%Y-%m-%d', '%Y%m%d%H%M', '%Y%m%d'):
+        try:
+            value = datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+        if end_of_day and fmt in ('%Y-%m-%d', '%Y%m%d'):
+            value = value.replace(hour=23, minute=59)
+        return value
+    raise argparse.ArgumentTypeError(f"일시 형식이 올바르지 않습니다: {text} (예: 2026-10-01 또는 '2026-10-01 09:30')")
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if '--harvest' in argv:
+        return harvest_main(argv, prog='narasearch_engine')
+
+    parser = argparse.ArgumentParser(
+        prog='narasearch_engine',
+        description='나라장터 입찰공고·사전규격을 검색해 JSON Lines / CSV / 엑셀 / Parquet으로 저장합니다. '
+                    '(수집 모드는 --harvest, 자세한 옵션은 --harvest --help)')
+    parser.add_argument('-q', '--query', required=True,
+                        help="검색어 (쉼표·공백 AND, 'a|b' OR, '-a' 제외)")
+    parser.add_argument('-c', '--category', choices=list(CATEGORY_API) + [COMBINED_CATEGORY], default='입찰공고',
+                        help='검색 유형 (기본: 입찰공고)')
+    parser.add_argument('--begin', type=parse_cli_datetime, default=None,
+                        help='검색 시작 일시 (예: 2026-10-01, 기본: --days 전)')
+    parser.add_argument('--end', type=lambda text: parse_cli_datetime(text, end_of_day=True), default=None,
+                        help='검색 종료 일시 (기본: 지금)')
+    parser.add_argument('--days', type=int, default=HARVEST_WINDOW_DAYS,
+                        help=f'--begin이 없을 때 종료 일시부터 며칠 전까지 검색할지 (기본: {HARVEST_WINDOW_DAYS})')
+    parser.add_argument('--institution', default='', help="공고기관명 조건 (검색어와 같은 문법, 예: '의왕|군포')")
+    parser.add_argument('--demand-institution', default='', help='수요기관명 조건')
+    parser.add_argument('--min-amount', type=parse_amount_text, default=None,
+                        help="최소 금액 (예: 3억, 5000만 / 입찰공고는 추정가격, 사전규격은 배정예산금액)")
+    parser.add_argument('--max-amount', type=parse_amount_text, default=None, help='최대 금액')
+    parser.add_argument('-o', '--output', default='-', help="저장할 파일 (기본: '-' 표준출력)")
+    parser.add_argument('-f', '--format', choices=EXPORT_FORMATS, default=None,
+                        help='저장 형식 (기본: 파일 확장자, 표준출력이면 jsonl)')
+    parser.add_argument('--raw', action='store_true', help='컬럼 정리 없이 API 원본 필드 그대로 저장')
+    parser.add_argument('--local', action='store_true', help='API 대신 로컬 저장소(--harvest로 수집한 공고)에서 검색')
+    parser.add_argument('--no-cache', action='store_true', help='응답 캐시를 쓰지 않고 항상 API에서 받기')
+    parser.add_argument('--quiet', action='store_true', help='진행 상황을 표준오류로 출력하지 않음')
+    parser.add_argument('--service-key', default=None,
+                        help='API 인증키 (생략 시 NARASEARCH_SERVICE_KEY 환경변수, 그 다음 설정 DB 사용)')
+    parser.add_argument('--attachments', metavar='DIR', default=None,
+                        help='검색된 공고의 첨부파일을 DIR 아래 공고별 폴더로 받기')
+    args = parser.parse_args(argv)
+
+    end_dt = args.end or datetime.now().replace(second=0, microsecond=0)
+    start_dt = args.begin or end_dt - timedelta(days=args.days)
+    fmt = args.format or export_format_for(None if args.output == '-' else args.output)
+    service_key = args.service_key or os.environ.get('NARASEARCH_SERVICE_KEY') or load_service_key()
+    conditions = SearchConditions(args.institution, args.demand_institution, args.min_amount, args.max_amount)
+
+    def log(message, end='\n'):
+        if not args.quiet:
+            print(message, end=end, file=sys.stderr, flush=True)
+
+    def on_page(page):
+        log(f"\r[{page['category']}] {page['received']:,} / {max(page['expected'], page['received']):,}건 수신, "
+            f"{page['matched']:,}건 일치", end='')
+
+    timings = SearchTimings()
+    try:
+        # 캐시·로컬 저장소에는 필요한 필드만 들어 있으므로 --raw는 항상 API에서 새로 받고 저장소에 넣지 않는다
+        store = NoticeStore() if args.local or not args.raw else None
+        cache = None if args.no_cache or args.local or args.raw else ResponseCache()
+        result = run_profiled(lambda: search(args.category, args.query, start_dt, end_dt, service_key,
+                                             on_page=on_page, local=args.local, cache=cache, store=store,
+                                             timings=timings, raw=args.raw, conditions=conditions),
+                             f"{args.category}-{args.query}")
+    except (SearchError, sqlite3.Error, OSError) as e:
+        log(f"\n검색 실패: {e}")
+        append_search_log(timings.as_record(category=args.category, query=args.query, mode='cli', error=str(e)))
+        return 1
+    log('')
+
+    items = result['items']
+    result_frame = None
+    # 파일은 임시 파일(.part)에 다 쓴 뒤 이름을 바꾼다 (실패해도 빈 파일·반쯤 쓴 파일이 남지 않는다)
+    part_path = None if args.output == '-' else args.output + '.part'
+    try:
+        stream = sys.stdout.buffer if part_path is None else open(part_path, 'wb')
+        try:
+            if args.raw:
+                export_items(items, stream, fmt)
+            else:
+                with timings.measure('frame'):
+                    result_frame = build_result(items, result['category'])
+                export_frame(result_frame.export(), stream, fmt)
+            stream.flush()
+        finally:
+            if stream is not sys.stdout.buffer:
+                stream.close()
+        if part_path is not None:
+            os.replace(part_path, args.output)
+    except BrokenPipeError:
+        # '| head'처럼 읽는 쪽이 먼저 닫힌 경우: 남은 출력은 버리고 조용히 끝낸다
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except (ValueError, OSError) as e:
+        log(f"저장 실패: {e}")
+        return 1
+    finally:
+        if part_path is not None and os.path.exists(part_path):
+            try:
+                os.remove(part_path)
+            except OSError:
+                pass
+
+    summary = f"[{result['category']}] {start_dt:%Y-%m-%d %H:%M} ~ {end_dt:%Y-%m-%d %H:%M} '{args.query}': {len(items):,}건"
+    if conditions:
+        summary += f" (검색 조건: {', '.join(conditions.labels)})"
+    if result.get('truncated'):
+        summary += f" (전체 {result['total_count']:,}건 중 일부만 조회)"
+    timings.finish()
+    log(f"{summary} ({timings.total:.1f}초)")
+    log(f"  {timings.summary()}")
+    append_search_log(timings.as_record(category=result['category'], query=args.query, mode='cli',
+                                        start_dt=f"{start_dt:%Y-%m-%d %H:%M}", end_dt=f"{end_dt:%Y-%m-%d %H:%M}",
+                                        result_count=len(items)))
+
+    if args.attachments and items:
+        if result_frame is None:
+            result_frame = build_result(items, result['category'])
+        jobs = attachment_jobs(result_frame.links(), result['category'])
+        downloaded = download_attachments(jobs, args.attachments, on_progress=lambda p: log(
+            f"\r첨부파일 {p['files_done']:,} / {p['files_total']:,}개, {p['bytes_done'] / 2 ** 20:,.1f} MB "
+            f"({p['rate'] / 2 ** 20:,.1f} MB/s)", end=''))
+        log(f"\n첨부파일 {downloaded['files']:,}개 받음 (이미 받은 파일 {downloaded['reused']:,}개), "
+            f"실패 {len(downloaded['failed']):,}개 → {args.attachments}")
+        for url, error in downloaded['failed']:
+            log(f"  실패: {url} ({error})")
+        if downloaded['failed']:
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
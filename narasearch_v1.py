@@ -1,15 +1,27 @@
+import time
+STARTUP_STARTED = time.perf_counter()   # 시작 시간 측정 기준 (다른 import보다 먼저)
+
 from PyQt5.QtWidgets import *
 from PyQt5.QtGui import *
 from PyQt5.QtCore import *
-from PyQt5 import uic
 import sys
-import requests
-import pandas as pd
 from datetime import datetime
 import os
-import sqlite3
 import webbrowser
+import json
+import threading
 import re 
+from contextlib import nullcontext
+
+# 검색·수집·저장 파이프라인 (PyQt5 없이 동작하는 엔진)
+# pandas·numpy·requests는 엔진이 처음 쓸 때 불러온다 (pd, np는 LazyModule)
+from narasearch_engine import *
+
+# pyuic5로 미리 변환한 화면 (narasearch_v1.spec이 빌드할 때마다 다시 만든다)
+try:
+    from narasearchv1_ui import Ui_Form
+except ImportError:
+    Ui_Form = None
 
 # ==========================================
 # [커스텀] 날짜/시간 선택 팝업 클래스
@@ -152,182 +164,550 @@ class DateTimePopup(QFrame):
         self.dateTimeSelected.emit(dt)
         self.close()
 
-# 환경 설정
-if getattr(sys, 'frozen', False):
-    BASE_DIR = os.path.dirname(sys.executable)
-else:
-    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-    
 UI_PATH = "./ui/narasearchv1.ui"
-DB_PATH = os.path.join(BASE_DIR, './ui/narasearchdata.db') 
+UI_MODULE_PATH = "./narasearchv1_ui.py"
+
+def ui_module_is_current():
+    """미리 변환한 화면 모듈을 써도 되는지 (.ui를 고친 뒤 다시 변환하지 않았으면 False)"""
+    if Ui_Form is None:
+        return False
+    if getattr(sys, 'frozen', False):
+        return True
+    try:
+        return os.path.getmtime(os.path.join(BASE_DIR, UI_MODULE_PATH)) >= os.path.getmtime(os.path.join(BASE_DIR, UI_PATH))
+    except OSError:
+        return True
 
 # ==========================================
-# Pandas 모델 클래스 (폰트 14pt)
+# 시작 시간 측정 (--startup-report)
 # ==========================================
+class StartupTimer:
+    """프로그램 시작 단계별 소요 시간 (import → 화면 구성 → DB → 창 표시)"""
+
+    def __init__(self, started):
+        self.started = started
+        self.last = started
+        self.stages = []
+
+    def mark(self, stage):
+        now = time.perf_counter()
+        self.stages.append((stage, now - self.last))
+        self.last = now
+
+    def elapsed(self):
+        return self.last - self.started
+
+    def as_dict(self):
+        return {stage: round(seconds * 1000, 1) for stage, seconds in self.stages}
+
+    def report(self):
+        parts = ", ".join(f"{stage} {seconds * 1000:.0f} ms" for stage, seconds in self.stages)
+        return f"시작 시간: {parts} (창 표시까지 {self.elapsed() * 1000:.0f} ms)"
+
+startup_timer = StartupTimer(STARTUP_STARTED)
+
+class PreloadWorker(QThread):
+    """창을 띄운 뒤 pandas·numpy·requests를 백그라운드에서 미리 불러온다 (첫 검색 지연 방지)"""
+
+    def __init__(self):
+        super().__init__()
+        self.elapsed = 0.0
+
+    def run(self):
+        started = time.perf_counter()
+        try:
+            preload_modules()
+        except Exception as e:
+            print(f"모듈 미리 불러오기 실패: {e}")
+        self.elapsed = time.perf_counter() - started
+
+def print_startup_report(report_mode, preload_elapsed, app):
+    """--startup-report: 단계별 시작 시간을 출력하고 종료한다 (=json이면 한 줄 JSON).
+
+    창 모드 exe처럼 표준출력이 없으면 실행 파일 옆 startup_report.txt에 쓴다.
+    """
+    if report_mode == '--startup-report=json':
+        text = json.dumps({'stages_ms': startup_timer.as_dict(),
+                           'window_ms': round(startup_timer.elapsed() * 1000, 1),
+                           'preload_ms': round(preload_elapsed * 1000, 1),
+                           'window_shown_at': time.time() - (time.perf_counter() - startup_timer.last)},
+                          ensure_ascii=False)
+    else:
+        text = f"{startup_timer.report()}, 백그라운드 모듈 로드 {preload_elapsed * 1000:.0f} ms"
+    if sys.stdout is not None:
+        print(text, flush=True)
+    else:
+        with open(os.path.join(BASE_DIR, 'startup_report.txt'), 'a', encoding='utf-8') as f:
+            f.write(text + '\n')
+    app.quit()
+
+# ==========================================
+# 결과 테이블 모델 (폰트 14pt)
+# ==========================================
+BOLD_COLUMNS = {'입찰공고명', '입찰개시일시', '품명(사업명)', '접수일시', '공고명'}   # 제목 컬럼들 볼드 처리
+MONEY_COLUMNS = {'배정예산금액'}    # 화면에서만 '억/만원'으로 표시하는 컬럼
+FILTER_COMPARE = re.compile(r'^(>=|<=|>|<|=)\s*(.+)$')   # 결과 내 필터 비교식 ('>= 3억')
+FILTER_OPERATORS = {'>=': 'greater_equal', '<=': 'less_equal', '>': 'greater', '<': 'less', '=': 'equal'}   # numpy 비교 함수 이름
+
+RESIZE_SAMPLE_ROWS = 200     # 컬럼 폭 계산에 사용할 행 수 (전체 행을 재지 않음)
+
 class PandasModel(QAbstractTableModel):
+    """DataFrame(또는 ResultFrame.display()의 ColumnView)을 열 단위 표시 문자열로 미리 변환해 두고 그대로 돌려주는 모델
+
+    셀을 그릴 때마다 iloc·str()·QFont 생성을 하지 않도록, 표시 문자열은
+    데이터를 받을 때 한 번에(열 단위로) 만들고 폰트·정렬 값은 열마다 캐시한다.
+    금액·일시 컬럼은 데이터에 숫자·datetime 그대로 두고 표시 문자열만 바꾼다.
+    category 컬럼(기관명 등)의 표시 문자열은 고유값마다 하나씩만 만든다.
+
+    정렬·결과 내 필터는 원본 행 번호 배열(_order)만 바꿔서 처리한다. 정렬 키는
+    컬럼마다 처음 정렬할 때 한 번 만들어(숫자·일시는 값 그대로, 문자는 순위 번호)
+    np.argsort로 정렬하므로 표시 문자열끼리 비교하지 않는다.
+    """
+
     def __init__(self, data):
         QAbstractTableModel.__init__(self)
         self._data = data
+        self._columns = list(data.columns)
+        self._cells = [self._to_display(c, data[c]) for c in self._columns]
+        self._rows = len(data)
+        self._kinds = [self._column_kind(data[c]) for c in self._columns]
+        self._keys = {}             # 컬럼 번호 → 정렬·비교용 float 배열 (필요할 때 만든다)
+        self._codes = {}            # 문자 컬럼 번호 → (정렬된 고유값 순위, 고유값 목록)
+        self._order = None          # 화면 행 → 원본 행 번호 (정렬·필터가 없으면 None)
+        self._sort_spec = None      # (컬럼 번호, Qt.SortOrder)
+        self._filter_spec = None    # (컬럼 번호, 필터 문자열)
+        self._filter_mask = None    # (_filter_spec, 행 수, bool 배열) 캐시
+
+        normal_font = QFont()
+        normal_font.setPointSize(14)
+        bold_font = QFont(normal_font)
+        bold_font.setBold(True)
+        self._fonts = [bold_font if c in BOLD_COLUMNS else normal_font for c in self._columns]
+        self._alignment = int(Qt.AlignCenter)
+
+    @staticmethod
+    def _to_display(column, series):
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # 코드 -1(빈 값)은 맨 뒤의 'nan'을 가리킨다 (astype(str)과 같은 표시)
+            labels = np.append(series.cat.categories.astype(str).to_numpy(dtype=object), 'nan')
+            return labels[series.cat.codes.to_numpy()].tolist()
+        # 금액·일시는 고유값만 표시 문자열로 바꿔 같은 값끼리 문자열 하나를 같이 쓴다 (코드 -1 = 빈 값)
+        if column in MONEY_COLUMNS and pd.api.types.is_numeric_dtype(series):
+            codes, uniques = pd.factorize(series)
+            labels = np.array(format_money(np.asarray(uniques, dtype=float)) + ['-'], dtype=object)
+            return labels[codes].tolist()
+        if pd.api.types.is_datetime64_any_dtype(series):
+            codes, uniques = pd.factorize(series)
+            labels = np.array(list(uniques.strftime(DISPLAY_DATETIME_FORMAT)) + [''], dtype=object)
+            return labels[codes].tolist()
+        return series.astype(str).tolist()
+
+    @staticmethod
+    def _column_kind(series):
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return 'datetime'
+        if pd.api.types.is_numeric_dtype(series):
+            return 'number'
+        return 'text'
 
     def rowCount(self, parent=None):
-        return self._data.shape[0]
+        if self._order is not None:
+            return len(self._order)
+        return self._rows
 
     def columnCount(self, parent=None):
-        return self._data.shape[1]
+        return len(self._columns)
 
     def data(self, index, role=Qt.DisplayRole):
-        if not index.isValid():
-            return None
-
         if role == Qt.DisplayRole:
-            return str(self._data.iloc[index.row(), index.column()])
-        
+            row = index.row()
+            if self._order is not None:
+                row = self._order[row]
+            return self._cells[index.column()][row]
         elif role == Qt.FontRole:
-            font = QFont()
-            font.setPointSize(14) 
-            
-            # 제목 컬럼들 볼드 처리
-            col_name = self._data.columns[index.column()]
-            if col_name in ['입찰공고명', '입찰개시일시', '품명(사업명)', '접수일시']:
-                font.setBold(True)
-            return font
-            
+            return self._fonts[index.column()]
         elif role == Qt.TextAlignmentRole:
-            return Qt.AlignCenter
-            
+            return self._alignment
         return None
 
     def headerData(self, col, orientation, role):
         if orientation == Qt.Horizontal and role == Qt.DisplayRole:
-            return self._data.columns[col]
+            return self._columns[col]
         return None
 
+    def append_frame(self, df):
+        """같은 컬럼 구성의 행들을 끝에 이어 붙인다 (검색 중 페이지 단위 추가).
+
+        모델의 data가 ResultFrame 보기이면 ResultFrame.extend()로 data에 먼저 붙인 뒤,
+        붙인 페이지(df)만 넘겨 표시 문자열을 만든다.
+        """
+        if df.empty:
+            return
+        if self._order is not None:
+            # 정렬·필터 중이면 새 행이 들어갈 위치가 흩어지므로 화면 순서를 다시 만든다
+            self._extend(df)
+            self._apply_view()
+            return
+        self.beginInsertRows(QModelIndex(), self._rows, self._rows + len(df) - 1)
+        self._extend(df)
+        self.endInsertRows()
+
+    def _extend(self, df):
+        for cells, col in zip(self._cells, self._columns):
+            cells.extend(self._to_display(col, df[col]))
+        self._rows += len(df)
+        self._keys = {}
+        self._codes = {}
+
+    # ---------------------------------------------------------------------
+    # 정렬 / 결과 내 필터
+    # ---------------------------------------------------------------------
+    def column_names(self):
+        return list(self._columns)
+
+    def total_rows(self):
+        """필터와 관계없이 모델이 가진 전체 행 수"""
+        return self._rows
+
+    def source_row(self, row):
+        """화면 행 번호를 모델 데이터(결과)의 행 번호로 바꾼다."""
+        if self._order is not None:
+            return int(self._order[row])
+        return row
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """헤더 클릭 정렬 (QTableView가 호출). 금액·일시는 값 기준으로 정렬한다."""
+        self._sort_spec = (column, order) if 0 <= column < len(self._columns) else None
+        self._apply_view()
+
+    def set_filter(self, column, text):
+        """column 값이 text에 맞는 행만 보여준다 (빈 문자열이면 해제).
+
+        금액·일시 컬럼은 '>= 3억', '< 2026-11-01' 같은 비교식을 쓸 수 있고,
+        그 밖에는 검색어와 같은 문법(쉼표·공백 AND, 'a|b' OR, '-a' 제외)으로 찾는다.
+        비교식의 값을 읽을 수 없으면 ValueError를 낸다.
+        """
+        text = text.strip()
+        spec = (column, text) if text and 0 <= column < len(self._columns) else None
+        if spec is not None:
+            self._matching_rows(spec)   # 잘못된 비교식이면 여기서 ValueError
+        self._filter_spec = spec
+        self._apply_view()
+
+    def _sort_key(self, column):
+        """정렬·비교용 float 배열 (빈 값은 NaN이라 정렬 시 항상 맨 뒤)"""
+        if column not in self._keys:
+            kind = self._kinds[column]
+            if kind == 'text':
+                # 빈 문자열도 고유값 순위(0)를 받으므로 NaN으로 바꿔 금액·일시처럼 맨 뒤로 보낸다
+                codes, uniques = self._text_codes(column)
+                key = codes.astype(float)
+                empty = [code for code, value in enumerate(uniques) if not str(value).strip()]
+                key[(codes < 0) | np.isin(codes, empty)] = np.nan
+            else:
+                series = self._data[self._columns[column]]
+                if kind == 'datetime':
+                    values = series.to_numpy(dtype='datetime64[ns]')
+                    key = np.where(np.isnat(values), np.nan, values.astype(np.int64).astype(float))
+                else:
+                    key = series.to_numpy(dtype=float, na_value=np.nan)
+            self._keys[column] = key
+        return self._keys[column]
+
+    def _text_codes(self, column):
+        """문자 컬럼을 (고유값 순위 배열, 고유값 목록)으로 (정렬 키·필터에서 같이 쓴다)"""
+        if column not in self._codes:
+            codes, uniques = pd.factorize(np.asarray(self._cells[column], dtype=object), sort=True)
+            self._codes[column] = (codes, list(uniques))
+        return self._codes[column]
+
+    def _matching_rows(self, spec):
+        cached = self._filter_mask
+        if cached is not None and cached[0] == spec and cached[1] == self._rows:
+            return cached[2]
+        column, text = spec
+        kind = self._kinds[column]
+        compare = FILTER_COMPARE.match(text)
+        if compare and kind != 'text':
+            operator, value = compare.groups()
+            if kind == 'datetime':
+                target = pd.Timestamp(value.strip())
+                if pd.isna(target):
+                    raise ValueError(f"일시를 읽을 수 없습니다: {value}")
+                target = float(target.as_unit('ns').value)
+            else:
+                target = parse_amount_text(value)
+            with np.errstate(invalid='ignore'):
+                mask = getattr(np, FILTER_OPERATORS[operator])(self._sort_key(column), target)
+        else:
+            # 기관명·계약방법처럼 값이 몇 가지뿐인 컬럼은 고유값만 검사하면 된다
+            codes, uniques = self._text_codes(column) if kind == 'text' else (None, None)
+            if codes is not None:
+                mask = KeywordMatcher(text).mask(uniques)[codes]
+            else:
+                mask = KeywordMatcher(text).mask(self._cells[column])
+        self._filter_mask = (spec, self._rows, mask)
+        return mask
+
+    def _apply_view(self):
+        """필터·정렬 조건으로 화면에 보일 원본 행 번호 배열을 다시 만든다."""
+        if self._filter_spec is None and self._sort_spec is None:
+            order = None
+        else:
+            if self._filter_spec is not None:
+                order = np.flatnonzero(self._matching_rows(self._filter_spec))
+            else:
+                order = np.arange(self._rows)
+            if self._sort_spec is not None:
+                column, sort_order = self._sort_spec
+                key = self._sort_key(column)[order]
+                if sort_order == Qt.DescendingOrder:
+                    key = -key
+                order = order[np.argsort(key, kind='stable')]
+        self.layoutAboutToBeChanged.emit()
+        self._order = order
+        self.layoutChanged.emit()
+
 # ==========================================
 # 검색 워커 (스레드)
 # ==========================================
 class SearchWorker(QThread):
+    """한 검색유형을 API로 검색하는 워커 (본체는 엔진의 search_category)
+
+    cancel()을 부르면 남은 페이지 요청을 버리고 아무 신호 없이 끝난다.
+    """
     result_signal = pyqtSignal(dict)
+    page_signal = pyqtSignal(dict)
     error_signal = pyqtSignal(str)
     
-    def __init__(self, url_base, params_base, keywords, title_field='bidNtceNm'):
+    def __init__(self, category, params_base, matcher, start_dt, end_dt,
+                 max_pages=MAX_PAGES, max_workers=MAX_CONCURRENT_PAGES, cache=None, store=None, timings=None,
+                 conditions=None):
         super().__init__()
-        self.url_base = url_base
+        self.category = category
         self.params_base = params_base
-        self.keywords = keywords
-        self.title_field = title_field 
+        self.matcher = matcher
+        self.start_dt = start_dt
+        self.end_dt = end_dt
+        self.cancel_event = threading.Event()
+        self.options = dict(max_pages=max_pages, max_workers=max_workers, cache=cache, store=store,
+                            timings=timings, cancel_event=self.cancel_event, conditions=conditions)
 
-    def run(self):
-        all_items = []
-        page_no = 1
-        rows_per_page = 999 
+    def cancel(self):
+        self.cancel_event.set()
 
+    def search(self):
+        return search_category(self.category, self.params_base, self.matcher, self.start_dt, self.end_dt,
+                               on_page=self.page_signal.emit, **self.options)
+
+    def run(self):
         try:
-            while True:
-                current_params = f"{self.params_base}&pageNo={page_no}&numOfRows={rows_per_page}"
-                full_url = self.url_base + current_params
-                
-                res = requests.get(full_url)
-                
-                if res.status_code != 200:
-                    self.error_signal.emit(f"서버 접속 오류: {res.status_code}")
-                    return
+            # NARASEARCH_PROFILE 환경 변수가 있으면 cProfile로 실행해 통계를 남긴다
+            self.result_signal.emit(run_profiled(self.search, self.category))
+        except SearchCancelled:
+            pass        # 화면은 취소할 때 이미 정리했다
+        except SearchError as e:
+            self.error_signal.emit(str(e))
+        except Exception as e:
+            self.error_signal.emit(f"시스템 에러: {str(e)}")
 
-                try:
-                    data = res.json()
-                except:
-                    self.error_signal.emit(f"데이터 파싱 실패: {res.text[:300]}")
-                    return
-
-                result_code = None
-                if 'response' in data and 'header' in data['response']:
-                    result_code = data['response']['header'].get('resultCode')
-                elif 'nkoneps.com.response.ResponseError' in data:
-                    result_code = data['nkoneps.com.response.ResponseError'].get('header', {}).get('resultCode')
-                elif 'resultCode' in data:
-                    result_code = data.get('resultCode')
-
-                if str(result_code) == "07":
-                    self.error_signal.emit("최대 검색기간을 초과하였습니다.\n31일 이내로 검색해주세요.")
-                    return
-
-                if 'response' not in data or 'body' not in data['response']:
-                    break 
-
-                body = data['response']['body']
-                items = body.get('items')
-                total_count = body.get('totalCount', 0)
-
-                if not items:
-                    break 
-
-                if isinstance(items, dict):
-                    items = [items]
-
-                all_items.extend(items)
-
-                if len(all_items) >= int(total_count):
-                    break
-                
-                page_no += 1
-                if page_no > 20: 
-                    break
-
-            if not all_items:
-                self.error_signal.emit("검색 결과가 없습니다.")
-                return
+class CombinedSearchWorker(SearchWorker):
+    """입찰공고·사전규격을 동시에 검색하는 워커 (통합 검색, 본체는 search_combined)"""
 
-            final_items = []
-            
-            if self.keywords:
-                for item in all_items:
-                    title = item.get(self.title_field, '')
-                    title_clean = title.replace(" ", "").lower()
-                    
-                    is_match = True
-                    for k in self.keywords:
-                        k_clean = k.replace(" ", "").lower()
-                        if k_clean not in title_clean:
-                            is_match = False
-                            break
-                    
-                    if is_match:
-                        final_items.append(item)
-            else:
-                final_items = all_items
+    def __init__(self, params_base, matcher, start_dt, end_dt, cache=None, store=None, timings=None,
+                 conditions=None):
+        super().__init__(COMBINED_CATEGORY, params_base, matcher, start_dt, end_dt, cache=cache, store=store,
+                         timings=timings, conditions=conditions)
 
-            if not final_items:
-                if len(self.keywords) > 1:
-                    detail_msg = f"상세 조건('{', '.join(self.keywords[1:])}')이"
-                else:
-                    detail_msg = "조건이"
-                self.error_signal.emit(f"'{self.keywords[0]}' 관련 데이터 {len(all_items)}개를 가져왔으나,\n{detail_msg} 포함된 공고는 없습니다.")
-                return
+    def search(self):
+        return search_combined(self.params_base, self.matcher, self.start_dt, self.end_dt,
+                               on_page=self.page_signal.emit, **self.options)
 
-            self.result_signal.emit({'items': final_items})
+class BatchSearchWorker(SearchWorker):
+    """저장단어 여러 개를 한 번에 검색하는 워커 (본체는 search_shortcuts)"""
+
+    def __init__(self, category, params_base, queries, start_dt, end_dt, cache=None, store=None, timings=None,
+                 conditions=None):
+        super().__init__(category, params_base, None, start_dt, end_dt, cache=cache, store=store, timings=timings,
+                         conditions=conditions)
+        self.queries = queries          # [(저장단어 원문, KeywordMatcher)]
+
+    def search(self):
+        return search_shortcuts(self.category, self.params_base, self.queries, self.start_dt, self.end_dt,
+                                on_page=self.page_signal.emit, **self.options)
+
+class WatchWorker(QThread):
+    """저장단어 감시: 마지막 확인 이후에 등록된 공고만 받아 새 공고를 찾는 워커 (본체는 poll_watchlist)"""
+    result_signal = pyqtSignal(dict)
+    error_signal = pyqtSignal(str)
+
+    def __init__(self, settings_store, category, params_base, queries, store=None):
+        super().__init__()
+        self.settings_store = settings_store
+        self.category = category
+        self.params_base = params_base
+        self.queries = queries
+        self.store = store
+        self.cancel_event = threading.Event()
 
+    def cancel(self):
+        self.cancel_event.set()
+
+    def run(self):
+        try:
+            self.result_signal.emit(poll_watchlist(self.settings_store, self.category, self.params_base, self.queries,
+                                                   store=self.store, cancel_event=self.cancel_event))
+        except SearchCancelled:
+            pass
+        except SearchError as e:
+            self.error_signal.emit(str(e))
         except Exception as e:
             self.error_signal.emit(f"시스템 에러: {str(e)}")
 
+class LocalSearchWorker(QThread):
+    """API 호출 없이 로컬 공고 저장소에서 검색하는 워커
+
+    refine이면 전문 검색(search_local) 대신 API 검색과 같은 검색어 문법으로 받아 둔 공고를
+    다시 거른다 (refine_local, '입력하며 좁히기').
+    """
+    result_signal = pyqtSignal(dict)
+    error_signal = pyqtSignal(str)
+
+    def __init__(self, store, category, query, start_dt, end_dt, timings=None, refine=False, conditions=None):
+        super().__init__()
+        self.store = store
+        self.category = category
+        self.query = query
+        self.start_dt = start_dt
+        self.end_dt = end_dt
+        self.timings = timings
+        self.refine = refine
+        self.conditions = conditions
+
+    def run(self):
+        search_func = refine_local if self.refine else search_local
+        try:
+            self.result_signal.emit(run_profiled(
+                lambda: search_func(self.store, self.category, self.query, self.start_dt, self.end_dt,
+                                    timings=self.timings, conditions=self.conditions), f"로컬-{self.category}"))
+        except SearchError as e:
+            self.error_signal.emit(str(e))
+        except Exception as e:
+            self.error_signal.emit(f"로컬 검색 에러: {str(e)}")
+
+class HistoryRecallWorker(QThread):
+    """검색 기록의 결과를 API 호출 없이 로컬 저장소에서 되살리는 워커"""
+    result_signal = pyqtSignal(dict)
+    error_signal = pyqtSignal(str)
+
+    def __init__(self, settings_store, notice_store, history_id):
+        super().__init__()
+        self.settings_store = settings_store
+        self.notice_store = notice_store
+        self.history_id = history_id
+
+    def run(self):
+        try:
+            entry = self.settings_store.get_history(self.history_id)
+            if entry is None:
+                raise SearchError("검색 기록을 찾을 수 없습니다.")
+            self.result_signal.emit(recall_search(self.notice_store, entry))
+        except SearchError as e:
+            self.error_signal.emit(str(e))
+        except Exception as e:
+            self.error_signal.emit(f"검색 기록 불러오기 에러: {str(e)}")
+
+class ExportWorker(QThread):
+    """검색 결과를 파일로 저장하는 워커 (큰 결과도 화면이 멈추지 않도록)
+
+    임시 파일(.part)에 다 쓴 뒤 이름을 바꾸므로, 실패해도 반쯤 쓴 파일이 남지 않는다.
+    """
+    progress_signal = pyqtSignal(dict)
+    done_signal = pyqtSignal(dict)
+    error_signal = pyqtSignal(str)
+
+    def __init__(self, df, path, fmt):
+        super().__init__()
+        self.df = df
+        self.path = path
+        self.fmt = fmt
+
+    def run(self):
+        started = time.perf_counter()
+        part_path = self.path + '.part'
+        try:
+            with open(part_path, 'wb') as f:
+                export_frame(self.df, f, self.fmt,
+                             on_progress=lambda written, total: self.progress_signal.emit({'written': written, 'total': total}))
+            os.replace(part_path, self.path)
+        except PermissionError:
+            self.error_signal.emit("파일에 쓸 수 없습니다. 다른 프로그램(엑셀 등)에서 열려 있다면 닫고 다시 저장해 주세요.")
+        except Exception as e:
+            self.error_signal.emit(str(e))
+        else:
+            self.done_signal.emit({'path': self.path, 'fmt': self.fmt, 'rows': len(self.df),
+                                   'elapsed': time.perf_counter() - started})
+        finally:
+            if os.path.exists(part_path):
+                try:
+                    os.remove(part_path)
+                except OSError:
+                    pass
+
+class DownloadWorker(QThread):
+    """여러 공고의 첨부파일을 한꺼번에 받는 워커 (본체는 엔진의 download_attachments)"""
+    progress_signal = pyqtSignal(dict)
+    done_signal = pyqtSignal(dict)
+    error_signal = pyqtSignal(str)
+
+    def __init__(self, jobs, root):
+        super().__init__()
+        self.jobs = jobs
+        self.root = root
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def run(self):
+        try:
+            self.done_signal.emit(download_attachments(self.jobs, self.root, on_progress=self.progress_signal.emit,
+                                                       cancel_event=self.cancel_event))
+        except Exception as e:
+            self.error_signal.emit(f"첨부파일 받기 에러: {str(e)}")
+
 # ==========================================
 # 메인 위젯
 # ==========================================
+HISTORY_MENU_SIZE = 20       # '최근 검색' 목록에 보여줄 검색 기록 수
+REFINE_DELAY_MS = 2000       # '입력하며 좁히기': 검색어 입력을 멈추고 이만큼 지나면 받아 둔 공고에서 다시 거른다
+WATCH_NOTIFY_TITLES = 5      # 새 공고 알림에 보여줄 공고명 수 (나머지는 '외 N건')
+WATCH_MESSAGE_MS = 15000     # 트레이 알림을 띄워 두는 시간
+CONDITION_LINE_EDITS = ('institutionLineEdit', 'demandInstitutionLineEdit', 'minAmountLineEdit', 'maxAmountLineEdit')   # [검색 조건] 칸 (Enter로 검색)
+
 class MainWidget(QWidget):
     def __init__(self):
         QWidget.__init__(self, None)
-        uic.loadUi(os.path.join(BASE_DIR, UI_PATH), self)
+        if ui_module_is_current():
+            ui = Ui_Form()
+            ui.setupUi(self)
+            self.__dict__.update(vars(ui))   # loadUi처럼 위젯을 self 속성으로 둔다
+        else:
+            from PyQt5 import uic
+            uic.loadUi(os.path.join(BASE_DIR, UI_PATH), self)
+        startup_timer.mark('화면 불러오기')
         
-        self.init_db() 
+        # 설정·저장단어·검색 기록 (연결 하나를 계속 쓰고, 변경은 쓰기 스레드가 모아서 저장)
+        self.settings_store = SettingsStore(DB_PATH)
+        startup_timer.mark('DB 초기화')
         self.initUI()
-        
-        self.main_search_timer = QTimer(self)
-        self.main_search_timer.setSingleShot(True) 
-        self.main_search_timer.timeout.connect(self.save_settings_to_db) 
-
-        self.shortcut_timers = {} 
 
         self.startButton.clicked.connect(self.search_start_main)
+        if hasattr(self, 'cancelButton'):
+            self.cancelButton.clicked.connect(self.stop_search)
         self.resetButton.clicked.connect(self.search_reset)
         self.saveButton.clicked.connect(self.search_save)
+        self.save_button_text = self.saveButton.text()
         self.endButton.clicked.connect(self.search_end)
 
         self.search_keyword.returnPressed.connect(self.search_start_main)
@@ -336,16 +716,43 @@ class MainWidget(QWidget):
         if hasattr(self.expiredkeydate, 'returnPressed'):
             self.expiredkeydate.returnPressed.connect(self.search_start_main)
 
-        self.search_keyword.textChanged.connect(lambda: self.main_search_timer.start(2000))
+        for name in CONDITION_LINE_EDITS:
+            if hasattr(self, name):
+                getattr(self, name).returnPressed.connect(self.search_start_main)
+
         self.search_servicekey.textChanged.connect(self.save_settings_to_db)
         self.expiredkeydate.textChanged.connect(self.save_settings_to_db)
 
         self.threeweeksButton.clicked.connect(self.set_date_range_3weeks)
+
+        if hasattr(self, 'runAllShortcutsButton'):
+            self.runAllShortcutsButton.clicked.connect(self.search_all_shortcuts)
         
         if hasattr(self, 'noticeButton'):
             self.noticeButton.clicked.connect(self.show_notice)
 
+        if hasattr(self, 'historyComboBox'):
+            self.historyComboBox.activated.connect(self.recall_history)
+
+        # '입력하며 좁히기': 입력을 멈추고 2초 뒤 받아 둔 공고에서만 다시 거른다 (API는 Enter·검색 시작 때만)
+        self.refine_timer = QTimer(self)
+        self.refine_timer.setSingleShot(True)
+        self.refine_timer.timeout.connect(self.refine_search)
+        if hasattr(self, 'refineCheckBox'):
+            self.search_keyword.textEdited.connect(self.schedule_refine)
+
         self.tableView.doubleClicked.connect(self.open_link)
+
+        # 헤더 클릭 정렬 · 결과 내 필터 (이미 받은 결과만 다시 보여준다)
+        self.tableView.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.tableView.setSortingEnabled(True)
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.timeout.connect(self.apply_result_filter)
+        if hasattr(self, 'filterLineEdit'):
+            self.filterLineEdit.textChanged.connect(lambda: self.filter_timer.start(200))
+            self.filterLineEdit.returnPressed.connect(self.apply_result_filter)
+            self.filterColumnComboBox.currentIndexChanged.connect(self.apply_result_filter)
         
         # [추가] 컨텍스트 메뉴(우클릭 메뉴) 정책 설정
         self.tableView.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -357,22 +764,57 @@ class MainWidget(QWidget):
 
             if line_edit and btn:
                 line_edit.setAlignment(Qt.AlignCenter)
-                timer = QTimer(self)
-                timer.setSingleShot(True)
-                timer.timeout.connect(lambda idx=i: self.save_shortcut_actual(idx))
-                self.shortcut_timers[i] = timer
-
-                line_edit.textChanged.connect(lambda text, idx=i: self.shortcut_timers[idx].start(2000))
+                line_edit.textChanged.connect(lambda text, idx=i: self.settings_store.set_shortcut(idx, text))
                 line_edit.textChanged.connect(lambda text, le=line_edit: self.update_shortcut_style(le))
 
                 line_edit.returnPressed.connect(lambda idx=i: self.search_start_shortcut(idx))
                 btn.clicked.connect(lambda checked, idx=i: self.search_start_shortcut(idx))
 
+        startup_timer.mark('화면 구성')
         self.load_settings_from_db()
         self.set_date_range_3weeks()
+        self.fill_history_combo(self.settings_store.recent_history(HISTORY_MENU_SIZE))
+        startup_timer.mark('설정 불러오기')
         
-        self.df2 = None
-        self.display_df = None 
+        self.result = None          # 지금 표에 있는 검색 결과 (ResultFrame)
+        self.export_view = None     # 저장할 결과 (끝까지 받은 검색만, ResultFrame.export())
+        self.result_model = None
+        self.response_cache = None
+        self.notice_store = None
+        self.export_worker = None
+        self.download_worker = None
+        self.download_dir = DOWNLOAD_DIR
+        self.search_request = None      # 진행 중인 검색 (끝나면 검색 기록에 남긴다)
+        self.search_timings = None      # 진행 중인 검색의 단계별 시간 (SearchTimings)
+        self.worker = None              # 진행 중인 검색 워커
+        self.search_generation = 0      # 검색 번호: 취소·교체된 워커가 늦게 보낸 신호를 버리는 데 쓴다
+        self.retired_workers = []       # 취소했지만 아직 끝나지 않은 워커 (끝날 때까지 참조 유지)
+
+        # 저장단어 감시: 간격마다 마지막 확인 이후에 등록된 공고만 받아 새 공고를 알린다
+        self.watch_timer = QTimer(self)
+        self.watch_timer.timeout.connect(self.run_watch)
+        self.watch_worker = None
+        self.watch_result = None        # 마지막으로 알린 새 공고 (트레이 알림을 누르면 표로 보여준다)
+        self.tray_icon = None
+        if hasattr(self, 'watchCheckBox'):
+            self.watchCheckBox.toggled.connect(self.toggle_watch)
+            self.watchIntervalSpinBox.valueChanged.connect(self.change_watch_interval)
+            self.watchCategoryComboBox.currentTextChanged.connect(self.change_watch_category)
+            if self.watchCheckBox.isChecked():
+                self.start_watch()
+
+    def init_local_store(self):
+        """응답 캐시와 로컬 공고 저장소를 처음 쓸 때 연다."""
+        if self.response_cache is None and USE_RESPONSE_CACHE:
+            try:
+                self.response_cache = ResponseCache()
+            except Exception as e:
+                print(f"캐시 초기화 실패: {e}")
+        if self.notice_store is None:
+            try:
+                self.notice_store = NoticeStore()
+            except Exception as e:
+                print(f"로컬 저장소 초기화 실패: {e}")
 
     def open_datetime_popup(self, target):
         try:
@@ -397,18 +839,61 @@ class MainWidget(QWidget):
 - 검색창 오른쪽 노란색 버튼에서 [입찰공고] / [사전규격] 선택 후
   검색어를 입력하시면 원하는 검색이 가능합니다.
 
-- 검색 기간이 반드시 지정되며, 최대 31일 간의 검색이 가능합니다.
+- 검색 기간이 반드시 지정되며, 31일을 넘는 기간은 자동으로 나누어 검색합니다.
+
+- [통합]을 선택하면 입찰공고·사전규격을 동시에 검색해 한 표로 보여줍니다.
+  (구분 · 공고번호 · 공고일시 · 공고명 · 기관명 · 마감일시 · 배정예산금액)
+
+- [검색 조건]에 공고기관명 · 수요기관명 · 금액 범위(예: 1억 ~ 10억)를 넣으면 함께 적용됩니다.
+  API가 받는 조건(입찰공고의 공고기관 · 수요기관 · 추정가격, 사전규격의 수요기관)은 요청에 넣어
+  맞는 공고만 받아오므로 받는 페이지가 줄고, 나머지 조건은 받은 뒤 거릅니다.
+  (금액은 입찰공고는 추정가격, 사전규격은 배정예산금액 기준이며 금액이 없는 공고는 빠집니다)
 
 - 저장단어 검색(총 10칸)에 원하는 검색어를 저장하여
   같은 단어를 손쉽게 자주 검색할 수 있습니다.
 
-- 검색 결과는 엑셀 파일로 저장 가능합니다.
+- [저장단어 전체 검색]을 누르면 저장단어 10칸을 한 번에 검색해 한 표로 보여줍니다.
+  첫 단어가 같은 저장단어끼리는 API 요청을 같이 쓰고, 중복 공고는 한 줄로 합쳐
+  [검색어] 컬럼에 어느 저장단어에 걸렸는지 표시합니다.
+
+- [저장단어 감시]를 체크하면 정해진 간격(기본 30분)마다 저장단어를 확인해, 마지막 확인 이후에
+  새로 등록된 공고만 트레이 알림(또는 상태줄)으로 알려줍니다. 저장단어마다 마지막 확인 시각을
+  기억해 그 이후(30분 겹쳐서)만 요청하고, 이미 본 공고는 다시 알리지 않습니다.
+  간격이 짧으면 저장단어 수와 관계없이 유형마다 요청 한 번으로 확인합니다.
+  알림을 누르거나 [최근 검색]에서 고르면 새 공고를 표로 볼 수 있습니다.
+  (처음 감시하는 저장단어는 그 시점을 기준으로 삼고, 그 뒤에 등록된 공고부터 알립니다)
+
+- [로컬 검색]을 체크하면 API를 호출하지 않고, 지금까지 내려받은 공고에서
+  제목·기관명 등을 바로 검색합니다. (API 검색과 같은 'a|b' · '-제외' 문법에 "구문", 접두어* 검색 지원)
+
+- 검색 중에도 새로 검색할 수 있습니다. 진행 중인 검색은 바로 취소되고 새 검색으로 바뀌며,
+  [검색 취소]를 누르면 그때까지 받은 공고만 표에 남기고 멈춥니다.
+
+- [입력하며 좁히기]를 체크하면 검색어를 고치고 2초가 지나면, API를 호출하지 않고
+  이미 받아 둔 공고에서 같은 검색어 문법(AND · a|b · -제외어)으로 다시 걸러 보여줍니다.
+  새로 받아 오려면 Enter 또는 [검색 시작]을 누릅니다.
+
+- 검색할 때마다 검색 기록(검색어 · 유형 · 기간 · 결과 건수 · 걸린 시간)이 남고,
+  [최근 검색]에서 고르면 API를 다시 호출하지 않고 그때 결과를 바로 불러옵니다.
+
+- 검색 결과 표의 제목줄을 누르면 정렬되고(금액·일시는 값 기준),
+  [결과 내 필터]로 다시 검색하지 않고 결과를 좁힐 수 있습니다.
+  ex) 공고기관명 '의왕|서울', 배정예산금액 '>= 3억', 입찰마감일시 '< 2026-11-01'
+
+- 검색 결과는 엑셀(.xlsx) · CSV 파일로 저장 가능합니다. (pyarrow가 설치되어 있으면 Parquet도 가능)
+  저장은 백그라운드에서 진행되어, 큰 결과를 저장하는 동안에도 계속 검색할 수 있습니다.
+
+- 결과 표에서 우클릭하면 첨부파일을 하나씩 열거나, 선택한 공고(또는 결과 전체)의
+  첨부파일을 한꺼번에 받을 수 있습니다. 공고별 폴더에 원래 파일 이름으로 저장되고,
+  끊긴 파일은 이어받으며, 여러 공고에 같은 파일이 있으면 한 번만 받습니다.
 
 
 ■ 검색 Tip ■ ----------------------------------------------------------------------
 
 - 검색어 입력 시, [특징이 되는 단어] + [지역명] 순으로 입력합니다.
   ex) '의왕어린이철도축제' → 검색어 '어린이, 철도, 의왕'
+- 'a|b'로 입력하면 둘 중 하나라도 포함된 공고를, '-단어'는 그 단어가 들어간 공고를 뺍니다.
+  ex) '철도|도로, -유지보수, 의왕'
 
 
 ■ 나라장터 API 인증키 ■ ----------------------------------------------------------------------
@@ -443,9 +928,11 @@ class MainWidget(QWidget):
         # comboBox 초기화
         if hasattr(self, 'comboBox'):
             self.comboBox.clear()
-            self.comboBox.addItems([" 입찰공고", " 사전규격"])
+            self.comboBox.addItems([" 입찰공고", " 사전규격", f" {COMBINED_CATEGORY}"])
         else:
             print("경고: 'comboBox' 객체를 찾을 수 없습니다. UI 파일에 해당 객체가 있는지 확인해주세요.")
+        if hasattr(self, 'watchCategoryComboBox'):
+            self.watchCategoryComboBox.addItems([*CATEGORY_API, COMBINED_CATEGORY])
 
         date_style = """
         QDateTimeEdit {
@@ -475,97 +962,38 @@ class MainWidget(QWidget):
 
     def load_settings_from_db(self):
         try:
-            conn = sqlite3.connect(DB_PATH)
-            cursor = conn.cursor()
-            cursor.execute("SELECT api_key, expired_date, use_3weeks FROM settings WHERE id=1")
-            row = cursor.fetchone()
-            if row:
-                api_key, expired_date, use_3weeks = row
-                self.search_servicekey.blockSignals(True)
-                self.expiredkeydate.blockSignals(True)
-                self.search_servicekey.setText(api_key)
-                self.expiredkeydate.setText(expired_date)
-                self.search_servicekey.blockSignals(False)
-                self.expiredkeydate.blockSignals(False)
-            
-            cursor.execute("SELECT idx, keyword FROM shortcuts")
-            rows = cursor.fetchall()
-            for idx, keyword in rows:
+            settings = self.settings_store.load()
+            self.search_servicekey.blockSignals(True)
+            self.expiredkeydate.blockSignals(True)
+            self.search_servicekey.setText(settings['api_key'] or '')
+            self.expiredkeydate.setText(settings['expired_date'] or '')
+            self.search_servicekey.blockSignals(False)
+            self.expiredkeydate.blockSignals(False)
+
+            for idx, keyword in settings['shortcuts'].items():
                 line_edit = getattr(self, f'Shortcut_{idx}', None)
                 if line_edit:
                     line_edit.blockSignals(True) 
                     line_edit.setText(keyword)
                     line_edit.blockSignals(False)
                     self.update_shortcut_style(line_edit)
-            conn.close()
+
+            if hasattr(self, 'watchCheckBox'):
+                watch_widgets = (self.watchCheckBox, self.watchIntervalSpinBox, self.watchCategoryComboBox)
+                for widget in watch_widgets:
+                    widget.blockSignals(True)
+                self.watchCheckBox.setChecked(bool(settings['watch_enabled']))
+                self.watchIntervalSpinBox.setValue(settings['watch_minutes'] or WATCH_INTERVAL_MINUTES)
+                self.watchCategoryComboBox.setCurrentText(settings['watch_category'] or WATCH_CATEGORY)
+                for widget in watch_widgets:
+                    widget.blockSignals(False)
         except Exception as e:
             print(f"DB 로드 에러: {e}")
 
-    def init_db(self):
-        db_dir = os.path.dirname(DB_PATH)
-        if not os.path.exists(db_dir):
-            try:
-                os.makedirs(db_dir)
-            except Exception as e:
-                print(f"폴더 생성 실패: {e}")
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS settings (
-                id INTEGER PRIMARY KEY,
-                api_key TEXT,
-                expired_date TEXT,
-                use_3weeks INTEGER
-            )
-        ''')
-        cursor.execute("SELECT count(*) FROM settings")
-        if cursor.fetchone()[0] == 0:
-            cursor.execute("INSERT INTO settings (id, api_key, expired_date, use_3weeks) VALUES (1, '', '', 0)")
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS shortcuts (
-                idx INTEGER PRIMARY KEY,
-                keyword TEXT
-            )
-        ''')
-        for i in range(10):
-            cursor.execute("SELECT count(*) FROM shortcuts WHERE idx=?", (i,))
-            if cursor.fetchone()[0] == 0:
-                cursor.execute("INSERT INTO shortcuts (idx, keyword) VALUES (?, '')", (i,))
-        conn.commit()
-        conn.close()
-
     def save_settings_to_db(self):
-        try:
-            api_key = self.search_servicekey.text().strip()
-            expired_date = self.expiredkeydate.text().strip()
-            conn = sqlite3.connect(DB_PATH)
-            cursor = conn.cursor()
-            cursor.execute('''
-                UPDATE settings 
-                SET api_key=?, expired_date=?
-                WHERE id=1
-            ''', (api_key, expired_date))
-            conn.commit()
-            conn.close()
-        except Exception as e:
-            print(f"DB 저장 에러: {e}")
-
-    def save_shortcut_actual(self, idx):
-        line_edit = getattr(self, f'Shortcut_{idx}', None)
-        if not line_edit: return
-        text = line_edit.text() 
-        self.save_shortcut_to_db(idx, text)
-
-    def save_shortcut_to_db(self, idx, text):
-        try:
-            conn = sqlite3.connect(DB_PATH)
-            cursor = conn.cursor()
-            cursor.execute("UPDATE shortcuts SET keyword=? WHERE idx=?", (text, idx))
-            conn.commit()
-            conn.close()
-        except Exception as e:
-            print(f"Shortcut 저장 에러: {e}")
+        # 메모리에 모아 두기만 한다 (쓰기는 SettingsStore의 쓰기 스레드가 한 번에)
+        self.settings_store.set_settings(api_key=self.search_servicekey.text().strip(),
+                                         expired_date=self.expiredkeydate.text().strip())
 
     def set_date_range_3weeks(self):
         now = QDateTime.currentDateTime()
@@ -574,10 +1002,10 @@ class MainWidget(QWidget):
         self.search_startdate.setDateTime(three_weeks_ago)
 
     def open_link(self, index):
-        if self.display_df is None: return
-        row = index.row()
+        if self.result is None: return
+        row = self.result_model.source_row(index.row())
         try:
-            url = self.display_df.iloc[row]['상세링크']
+            url = self.result.links().value(row, DETAIL_LINK_COLUMN)
             if url and str(url).startswith('http'):
                 webbrowser.open(str(url))
             else:
@@ -589,36 +1017,41 @@ class MainWidget(QWidget):
     # [추가] 컨텍스트 메뉴 (우클릭 다운로드) 핸들러
     # =========================================================================
     def show_context_menu(self, pos):
-        if self.display_df is None: return
+        if self.result is None: return
         
         index = self.tableView.indexAt(pos)
         if not index.isValid(): return
 
-        row = index.row()
+        row = self.result_model.source_row(index.row())
         menu = QMenu(self)
         
-        # 1. 파일 URL 컬럼 키 탐색
-        if hasattr(self, 'comboBox'):
-            category = self.comboBox.currentText().strip()
-        else:
-            category = "입찰공고"
+        # 1. 파일 URL 컬럼 키 탐색 (숨은 컬럼은 결과의 links() 보기로 읽는다)
+        category = self.result.category
+        links = self.result.links()
 
         found_files = []
         
-        if category == "입찰공고":
+        if category == COMBINED_CATEGORY:
+            # 통합 검색은 공통 컬럼 첨부파일1 ~ 첨부파일10
+            for i, col_key in enumerate(UNIFIED_FILE_COLUMNS, 1):
+                if col_key in links.columns:
+                    url = links.value(row, col_key)
+                    if url and str(url).strip() != '' and str(url) != 'nan':
+                        found_files.append((f"첨부파일 {i} 다운로드", str(url)))
+        elif category == "입찰공고":
             # [cite_start]입찰공고 파일 컬럼: ntceSpecDocUrl1 ~ ntceSpecDocUrl10 [cite: 1]
             for i in range(1, 11):
                 col_key = f'ntceSpecDocUrl{i}'
-                if col_key in self.display_df.columns:
-                    url = self.display_df.iloc[row][col_key]
+                if col_key in links.columns:
+                    url = links.value(row, col_key)
                     if url and str(url).strip() != '' and str(url) != 'nan':
                         found_files.append((f"첨부파일 {i} 다운로드", str(url)))
         else:
             # [cite_start]사전규격 파일 컬럼: specDocFileUrl1 ~ specDocFileUrl5 [cite: 1]
             for i in range(1, 6):
                 col_key = f'specDocFileUrl{i}'
-                if col_key in self.display_df.columns:
-                    url = self.display_df.iloc[row][col_key]
+                if col_key in links.columns:
+                    url = links.value(row, col_key)
                     if url and str(url).strip() != '' and str(url) != 'nan':
                         found_files.append((f"규격문서 {i} 다운로드", str(url)))
 
@@ -638,8 +1071,69 @@ class MainWidget(QWidget):
             no_action.setEnabled(False)
             menu.addAction(no_action)
 
+        # 3. 여러 공고 첨부파일 한꺼번에 받기 (선택한 행 / 보이는 결과 전체)
+        menu.addSeparator()
+        if self.download_worker is not None and self.download_worker.isRunning():
+            stop_action = QAction("첨부파일 받기 중지", self)
+            stop_action.triggered.connect(self.download_worker.cancel)
+            menu.addAction(stop_action)
+        elif category in ATTACHMENT_COLUMNS:
+            selected_rows = sorted({self.result_model.source_row(i.row())
+                                    for i in self.tableView.selectionModel().selectedIndexes()})
+            if row not in selected_rows:
+                selected_rows = [row]
+            visible_rows = [self.result_model.source_row(r) for r in range(self.result_model.rowCount())]
+            for label, rows in ((f"선택한 공고 {len(selected_rows):,}건 첨부파일 모두 받기", selected_rows),
+                                (f"결과 전체 {len(visible_rows):,}건 첨부파일 모두 받기", visible_rows)):
+                action = QAction(label, self)
+                action.triggered.connect(lambda checked, r=rows, c=category: self.download_attachments(c, r))
+                menu.addAction(action)
+
         menu.exec_(self.tableView.mapToGlobal(pos))
 
+    def download_attachments(self, category, rows):
+        """선택한 공고들의 첨부파일을 공고별 폴더로 한꺼번에 받는다."""
+        jobs = attachment_jobs(self.result.links(), category, rows)
+        if not jobs:
+            QMessageBox.information(self, "알림", "받을 첨부파일이 없습니다.")
+            return
+        root = QFileDialog.getExistingDirectory(self, "첨부파일을 받을 폴더", self.download_dir)
+        if not root:
+            return
+        self.download_dir = root
+
+        self.download_worker = DownloadWorker(jobs, root)
+        self.download_worker.progress_signal.connect(self.handle_download_progress)
+        self.download_worker.done_signal.connect(self.handle_download_done)
+        self.download_worker.error_signal.connect(lambda msg: QMessageBox.warning(self, "알림", msg))
+        self.search_situation.setText(f"첨부파일 받는 중... 공고 {len(set(rows)):,}건, 파일 {len(jobs):,}개")
+        self.download_worker.start()
+
+    def handle_download_progress(self, data):
+        text = (f"첨부파일 받는 중... {data['files_done']:,} / {data['files_total']:,}개, "
+                f"{data['bytes_done'] / 2 ** 20:,.1f} MB ({data['rate'] / 2 ** 20:,.1f} MB/s)")
+        if data['failed']:
+            text += f", 실패 {data['failed']:,}개"
+        self.search_situation.setText(text)
+        if hasattr(self, 'searchProgressBar') and not self.search_running():
+            self.searchProgressBar.setMaximum(max(data['files_total'], 1))
+            self.searchProgressBar.setValue(data['files_done'] + data['failed'])
+
+    def handle_download_done(self, result):
+        summary = (f"첨부파일 {result['files']:,}개 받음 (이미 받은 파일 {result['reused']:,}개), "
+                   f"{result['bytes'] / 2 ** 20:,.1f} MB, {result['elapsed']:.1f}초")
+        if result['cancelled']:
+            summary = "중지됨: " + summary
+        self.search_situation.setText(summary)
+        message = f"{summary}\n저장 위치: {result['root']}"
+        if result['failed']:
+            failed = "\n".join(f"- {url}\n  ({error})" for url, error in result['failed'][:10])
+            more = f"\n... 외 {len(result['failed']) - 10}개" if len(result['failed']) > 10 else ""
+            message += f"\n\n받지 못한 파일 {len(result['failed']):,}개:\n{failed}{more}"
+            QMessageBox.warning(self, "첨부파일 받기", message)
+        else:
+            QMessageBox.information(self, "첨부파일 받기", message)
+
     def search_start_main(self):
         keyword = self.search_keyword.text().strip()
         self.execute_search(keyword)
@@ -650,210 +1144,622 @@ class MainWidget(QWidget):
             keyword = line_edit.text().strip()
             self.execute_search(keyword)
 
-    def execute_search(self, keyword_input):
-        if not self.startButton.isEnabled():
-            return
+    def search_conditions(self, warn=True):
+        """[검색 조건] 칸(공고기관 · 수요기관 · 금액 범위)의 SearchConditions. 금액을 읽을 수 없으면 None."""
+        if not hasattr(self, 'institutionLineEdit'):
+            return SearchConditions()
+        amounts = []
+        for line_edit in (self.minAmountLineEdit, self.maxAmountLineEdit):
+            text = line_edit.text().strip()
+            try:
+                amounts.append(parse_amount_text(text) if text else None)
+            except ValueError as e:
+                if warn:
+                    QMessageBox.warning(self, "오류", f"{e}\n(예: 3억, 5000만, 150000000)")
+                return None
+        if None not in amounts and amounts[0] > amounts[1]:
+            if warn:
+                QMessageBox.warning(self, "오류", "최소 금액이 최대 금액보다 큽니다.")
+            return None
+        return SearchConditions(self.institutionLineEdit.text().strip(), self.demandInstitutionLineEdit.text().strip(),
+                                *amounts)
 
-        if hasattr(self, 'comboBox'):
-            category = self.comboBox.currentText().strip()
-        else:
-            category = "입찰공고"
+    def shortcut_queries(self):
+        """저장단어 10칸의 검색어: [(저장단어 원문, KeywordMatcher)] (빈 칸·중복·제외어만 있는 칸 제외)"""
+        queries = []
+        for i in range(10):
+            line_edit = getattr(self, f'Shortcut_{i}', None)
+            text = line_edit.text().strip() if line_edit else ''
+            if text and text not in [label for label, _ in queries]:
+                matcher = KeywordMatcher(text)
+                if matcher.groups:
+                    queries.append((text, matcher))
+        return queries
+
+    def search_all_shortcuts(self):
+        """저장단어 10칸을 한 번에 검색한다 (1차 검색어가 같으면 API 요청을 같이 쓴다)."""
+        queries = self.shortcut_queries()
+        if not queries:
+            QMessageBox.warning(self, "알림", "저장단어가 없습니다. 저장단어 칸에 검색어를 입력해주세요.")
+            return
 
-        self.search_situation.setText(f"[{category}] '{keyword_input}' 검색 중입니다... (데이터량에 따라 시간이 걸릴 수 있습니다)")
-        
-        keywords_list = [k for k in re.split(r'[, ]+', keyword_input.strip()) if k]
-        if not keywords_list:
-            QMessageBox.warning(self, "알림", "검색어를 입력해주세요.")
-            self.search_situation.setText("검색어를 입력해주세요.")
+        category = self.comboBox.currentText().strip() if hasattr(self, 'comboBox') else "입찰공고"
+        if category not in CATEGORY_API:
+            QMessageBox.warning(self, "오류", "저장단어 전체 검색은 검색 유형(입찰공고/사전규격)을 하나 선택해주세요.")
+            return
+        if hasattr(self, 'localSearchCheckBox') and self.localSearchCheckBox.isChecked():
+            QMessageBox.warning(self, "알림", "저장단어 전체 검색은 로컬 검색에서는 사용할 수 없습니다.")
             return
-        
-        primary_keyword = keywords_list[0]
-        self.startButton.setEnabled(False) 
-        self.tableView.setModel(None)
 
-        start_data_str = self.search_startdate.dateTime().toString('yyyyMMddHHmm')
-        end_date_str = self.search_enddate.dateTime().toString('yyyyMMddHHmm')
+        start_dt = self.search_startdate.dateTime().toPyDateTime().replace(second=0, microsecond=0)
+        end_dt = self.search_enddate.dateTime().toPyDateTime().replace(second=0, microsecond=0)
         service_key = self.search_servicekey.text().strip()
-
+        if start_dt > end_dt:
+            QMessageBox.warning(self, "오류", "검색 시작일이 종료일보다 늦습니다.")
+            return
         if not service_key:
             QMessageBox.warning(self, "오류", "API 인증키를 입력해주세요.")
-            self.startButton.setEnabled(True)
             return
-        
-        # API URL 분기
-        url_base = ""
-        params_base = ""
-        title_field = ""
-
-        if category == "입찰공고":
-            url_base = 'http://apis.data.go.kr/1230000/ad/BidPublicInfoService/getBidPblancListInfoServcPPSSrch?'
-            params_base = f'inqryDiv=1&inqryBgnDt={start_data_str}&inqryEndDt={end_date_str}&bidNtceNm={primary_keyword}&type=json&serviceKey={service_key}'
-            title_field = 'bidNtceNm'
-        
-        elif category == "사전규격":
-            url_base = 'http://apis.data.go.kr/1230000/ao/HrcspSsstndrdInfoService/getPublicPrcureThngInfoServcPPSSrch?'
-            params_base = f'inqryDiv=1&inqryBgnDt={start_data_str}&inqryEndDt={end_date_str}&prdctClsfcNoNm={primary_keyword}&type=json&serviceKey={service_key}'
-            title_field = 'prdctClsfcNoNm'
-        
+        conditions = self.search_conditions()
+        if conditions is None:
+            return
+
+        self.refine_timer.stop()
+        self.cancel_search("새 검색으로 교체")
+        self.clear_results()
+
+        params_base = search_params(service_key)
+        self.init_local_store()
+        timings = self.begin_search_request(category, ", ".join(label for label, _ in queries), start_dt, end_dt, 'batch',
+                                            conditions)
+        self.search_situation.setText(
+            f"[{category}] 저장단어 {len(queries)}개 검색 중입니다... "
+            f"(API 검색어 {len({k for _, m in queries for k in m.primary_keywords})}개)")
+        print(f"저장단어 전체 검색: [{category}] {[label for label, _ in queries]}")
+        self.start_search_worker(BatchSearchWorker(category, params_base, queries, start_dt, end_dt,
+                                                   cache=self.response_cache, store=self.notice_store,
+                                                   timings=timings, conditions=conditions))
+
+    def toggle_watch(self, checked):
+        self.settings_store.set_settings(watch_enabled=int(checked))
+        if checked:
+            self.start_watch()
         else:
-            QMessageBox.warning(self, "오류", "검색 유형(입찰공고/사전규격)을 선택해주세요.")
-            self.startButton.setEnabled(True)
+            self.stop_watch()
+
+    def change_watch_interval(self, minutes):
+        self.settings_store.set_settings(watch_minutes=minutes)
+        if self.watch_timer.isActive():
+            self.watch_timer.start(minutes * 60 * 1000)
+
+    def change_watch_category(self, category):
+        """감시할 검색 유형을 바꾼다. 처음 감시하는 유형은 다음 확인에서 기준만 잡는다."""
+        self.settings_store.set_settings(watch_category=category)
+        if self.watch_timer.isActive():
+            self.run_watch()
+
+    def watch_category(self):
+        """감시할 검색 유형 (검색 유형 선택과 관계없이 설정에 기억한 값)"""
+        category = self.watchCategoryComboBox.currentText() if hasattr(self, 'watchCategoryComboBox') else WATCH_CATEGORY
+        return category if category in CATEGORY_API or category == COMBINED_CATEGORY else WATCH_CATEGORY
+
+    def start_watch(self):
+        """저장단어 감시를 켠다: 바로 한 번 확인하고, 그 뒤로 간격마다 확인한다."""
+        if self.tray_icon is None and QSystemTrayIcon.isSystemTrayAvailable():
+            self.tray_icon = QSystemTrayIcon(self.windowIcon(), self)
+            self.tray_icon.setToolTip('나라장터 통합 검색기 - 저장단어 감시')
+            self.tray_icon.messageClicked.connect(self.show_watch_results)
+        if self.tray_icon is not None:
+            self.tray_icon.show()
+        self.watch_timer.start(self.watchIntervalSpinBox.value() * 60 * 1000)
+        self.run_watch()
+
+    def stop_watch(self, wait=False):
+        self.watch_timer.stop()
+        if self.watch_worker is not None and self.watch_worker.isRunning():
+            self.watch_worker.cancel()
+            if wait:
+                self.watch_worker.wait()
+        if self.tray_icon is not None:
+            self.tray_icon.hide()
+
+    def run_watch(self):
+        """저장단어들을 마지막 확인 이후 기간만 검색한다 (이전 확인이 아직 안 끝났으면 건너뛴다)."""
+        if self.watch_worker is not None and self.watch_worker.isRunning():
             return
+        queries = self.shortcut_queries()
+        service_key = self.search_servicekey.text().strip()
+        if not queries or not service_key:
+            self.show_watch_status("저장단어 감시: 저장단어와 API 인증키가 있어야 확인할 수 있습니다.")
+            return
+        category = self.watch_category()
+        self.init_local_store()
+        self.watch_worker = WatchWorker(self.settings_store, category, search_params(service_key), queries,
+                                        store=self.notice_store)
+        self.watch_worker.result_signal.connect(self.handle_watch_result)
+        self.watch_worker.error_signal.connect(self.handle_watch_error)
+        self.watch_worker.start()
+
+    def show_watch_status(self, text):
+        """감시 결과를 알린다. 검색 중에는 검색 진행 상황을 덮어쓰지 않는다."""
+        print(text)
+        if hasattr(self, 'watchCheckBox'):
+            self.watchCheckBox.setToolTip(text)
+        if not self.search_running():
+            self.search_situation.setText(text)
+
+    def handle_watch_result(self, data):
+        items = data['items']
+        watch = data['watch']
+        category = data['category']
+        status = f"저장단어 감시 {watch['checked_at']:%H:%M} [{category}]: "
+        if not items:
+            status += "새 공고 없음"
+            if watch['started']:
+                status += f" (저장단어 {watch['started']}개는 지금부터 감시합니다)"
+        else:
+            # 검색 기록에도 남겨 [최근 검색]에서 다시 볼 수 있게 한다 (공고는 로컬 저장소에 들어 있다)
+            entry = self.settings_store.add_history(
+                category, ", ".join(watch['labels']), watch['start_dt'], watch['checked_at'], len(items),
+                data['elapsed_ms'], mode='watch', result_keys=history_keys(items, category))
+            self.fill_history_combo([entry] + self.history_entries[:HISTORY_MENU_SIZE - 1])
+            self.watch_result = data
+
+            titles = []
+            for item in items[:WATCH_NOTIFY_TITLES]:
+                api = CATEGORY_API[item.get(CATEGORY_FIELD, category)]
+                titles.append(f"· {item.get(api['title_field'], '')} ({item.get(BATCH_LABEL_FIELD, '')})")
+            if len(items) > WATCH_NOTIFY_TITLES:
+                titles.append(f"외 {len(items) - WATCH_NOTIFY_TITLES}건")
+            if self.tray_icon is not None and self.tray_icon.isVisible():
+                self.tray_icon.showMessage(f"새 공고 {len(items)}건 [{category}]", "\n".join(titles),
+                                           QSystemTrayIcon.Information, WATCH_MESSAGE_MS)
+                status += f"새 공고 {len(items)}건 (알림을 누르거나 [최근 검색]에서 볼 수 있습니다)"
+            else:
+                status += f"새 공고 {len(items)}건 ([최근 검색]에서 볼 수 있습니다) - " + " ".join(titles)
+        if data['failures']:
+            status += f" (실패 {len(data['failures'])}건, 다음 확인에서 다시 받습니다)"
+        self.show_watch_status(status)
 
-        print(f"검색 시작: [{category}] 키워드='{primary_keyword}'")
+    def handle_watch_error(self, msg):
+        self.show_watch_status(f"저장단어 감시 실패: {msg.splitlines()[0]} (다음 확인에서 다시 시도합니다)")
 
-        self.worker = SearchWorker(url_base, params_base, keywords_list, title_field)
-        self.worker.result_signal.connect(self.handle_success)
-        self.worker.error_signal.connect(self.handle_error)
-        self.worker.start()
+    def show_watch_results(self):
+        """트레이 알림을 누르면 마지막으로 알린 새 공고를 표로 보여준다 (API를 다시 부르지 않는다)."""
+        if self.watch_result is None:
+            return
+        self.showNormal()
+        self.activateWindow()
+        self.refine_timer.stop()
+        self.cancel_search("감시 결과 보기로 교체")
+        self.clear_results()
+        self.search_request = None
+        self.handle_success(self.watch_result)
 
-    def handle_success(self, data):
-        bid_data = data['items']
-        df = pd.DataFrame(bid_data)
-        
+    def execute_search(self, keyword_input):
+        """검색어로 검색한다. 검색 중이면 진행 중인 검색을 취소하고 새 검색으로 바꾼다."""
         if hasattr(self, 'comboBox'):
             category = self.comboBox.currentText().strip()
         else:
             category = "입찰공고"
 
-        if 'asignBdgtAmt' in df.columns:
-            def format_money(x):
-                try:
-                    if not x or str(x).strip() == '': return '-'
-                    amt = float(str(x).replace(',', ''))
-                    eok = int(amt // 100000000)
-                    man = int((amt % 100000000) // 10000)
-                    result = ""
-                    if eok > 0: result += f"{eok}억"
-                    if man > 0:
-                        if eok > 0: result += " "
-                        result += f"{man:,}만원"
-                    if result == "": result = f"{int(amt):,}원"
-                    return result
-                except:
-                    return str(x)
-            df['asignBdgtAmt'] = df['asignBdgtAmt'].apply(format_money)
-
-        # ---------------------------------------------------------------------
-        # 카테고리별 컬럼 처리
-        # ---------------------------------------------------------------------
-        # [수정] 파일 다운로드 URL 컬럼 추가 로직
-        file_cols = []
+        matcher = KeywordMatcher(keyword_input)
+        if not matcher.groups:
+            QMessageBox.warning(self, "알림", "검색어를 입력해주세요. (제외어 '-단어'만으로는 검색할 수 없습니다)")
+            self.search_situation.setText("검색어를 입력해주세요.")
+            return
         
-        if category == "입찰공고":
-            # [cite_start]파일 컬럼 후보군 정의 (1~10) [cite: 1]
-            potential_file_cols = [f'ntceSpecDocUrl{i}' for i in range(1, 11)]
-            
-            target_cols = ['bidNtceNo', 'bidNtceDt', 'bidNtceNm', 'ntceInsttNm', 'cntrctCnclsMthdNm', 'bidBeginDt', 'bidClseDt', 'asignBdgtAmt']
-            if 'bidNtceDtlUrl' in df.columns: target_cols.append('bidNtceDtlUrl')
-            
-            # 존재하는 파일 컬럼만 target_cols에 추가 (화면에는 숨길 예정)
-            for c in potential_file_cols:
-                if c in df.columns:
-                    target_cols.append(c)
-                    file_cols.append(c)
-            
-            target_cols = [c for c in target_cols if c in df.columns]
-            df1 = df[target_cols].copy()
-            
-            rename_map = {
-                'bidNtceNo':'입찰공고번호', 'bidNtceDt':'입찰공고일시', 'bidNtceNm':'입찰공고명', 
-                'ntceInsttNm':'공고기관명',  'cntrctCnclsMthdNm':'계약체결방법명', 
-                'bidBeginDt':'입찰개시일시', 'bidClseDt':'입찰마감일시', 'asignBdgtAmt':'배정예산금액',
-                'bidNtceDtlUrl': '상세링크'
-            }
-            df1 = df1.rename(columns=rename_map)
-            
-            save_cols = ['bidNtceNo', 'ntceKindNm', 'bidNtceDt', 'bidNtceNm', 'ntceInsttNm', 'dminsttNm', 'bidMethdNm', 'cntrctCnclsMthdNm', 'bidBeginDt',
-                         'bidClseDt', 'bidPrtcptLmtYn', 'asignBdgtAmt', 'sucsfbidLwltRate', 'sucsfbidMthdNm']
-            save_cols = [c for c in save_cols if c in df.columns]
-            df2 = df[save_cols].copy()
-            df2 = df2.rename(columns={
-                'bidNtceNo':'입찰공고번호', 'ntceKindNm':'공고종류명', 'bidNtceDt':'입찰공고일시', 
-                'bidNtceNm':'입찰공고명', 'ntceInsttNm':'공고기관명', 'dminsttNm':'수요기관명',
-                'bidMethdNm':'입찰방식명', 'cntrctCnclsMthdNm':'계약체결방법명', 
-                'bidBeginDt':'입찰개시일시', 'bidClseDt':'입찰마감일시', 'bidPrtcptLmtYn':'입찰참가제한여부',
-                'asignBdgtAmt':'배정예산금액', 'sucsfbidLwltRate':'낙찰하한율', 'sucsfbidMthdNm':'낙찰방법명'
-            })
-
-        else: # "사전규격"
-            # [cite_start]파일 컬럼 후보군 정의 (1~5) [cite: 1]
-            potential_file_cols = [f'specDocFileUrl{i}' for i in range(1, 6)]
-            
-            target_cols = ['bfSpecRgstNo', 'rcptDt', 'prdctClsfcNoNm', 'orderInsttNm', 'rlDminsttNm', 'opninRgstClseDt', 'asignBdgtAmt']
-            
-            # 존재하는 파일 컬럼만 target_cols에 추가
-            for c in potential_file_cols:
-                if c in df.columns:
-                    target_cols.append(c)
-                    file_cols.append(c)
+        primary_keyword = matcher.primary_label
+        start_dt = self.search_startdate.dateTime().toPyDateTime().replace(second=0, microsecond=0)
+        end_dt = self.search_enddate.dateTime().toPyDateTime().replace(second=0, microsecond=0)
+        service_key = self.search_servicekey.text().strip()
 
-            target_cols = [c for c in target_cols if c in df.columns]
-            
-            df1 = df[target_cols].copy()
-            rename_map = {
-                'bfSpecRgstNo': '사전규격등록번호', 'rcptDt': '접수일시', 'prdctClsfcNoNm': '품명(사업명)',
-                'orderInsttNm': '발주기관명', 'rlDminsttNm': '실수요기관명', 
-                'opninRgstClseDt': '의견등록마감일시', 'asignBdgtAmt': '배정예산금액'
-            }
-            df1 = df1.rename(columns=rename_map)
-
-            save_cols = ['bfSpecRgstNo', 'refNo', 'rcptDt', 'prdctClsfcNoNm', 'orderInsttNm', 'rlDminsttNm', 
-                         'opninRgstClseDt', 'asignBdgtAmt', 'ofclNm', 'ofclTelNo', 'dlvrTmlmtDt']
-            save_cols = [c for c in save_cols if c in df.columns]
-            df2 = df[save_cols].copy()
-            df2 = df2.rename(columns={
-                'bfSpecRgstNo': '사전규격등록번호', 'refNo': '참조번호', 'rcptDt': '접수일시',
-                'prdctClsfcNoNm': '품명(사업명)', 'orderInsttNm': '발주기관명', 'rlDminsttNm': '실수요기관명',
-                'opninRgstClseDt': '의견등록마감일시', 'asignBdgtAmt': '배정예산금액',
-                'ofclNm': '담당자명', 'ofclTelNo': '담당자전화번호', 'dlvrTmlmtDt': '납품기한일시'
-            })
-
-        # 공통: 상세링크 컬럼이 없으면 빈 컬럼 생성 (에러 방지용)
-        if '상세링크' not in df1.columns: df1['상세링크'] = ''
-
-        self.display_df = df1 
-        self.df2 = df2 
-        
-        model = PandasModel(df1)
-        self.tableView.setModel(model)
+        if start_dt > end_dt:
+            QMessageBox.warning(self, "오류", "검색 시작일이 종료일보다 늦습니다.")
+            return
         
-        # 상세링크 숨기기
-        if '상세링크' in df1.columns:
-            link_col_index = df1.columns.get_loc('상세링크')
-            self.tableView.setColumnHidden(link_col_index, True)
+        # API 분기
+        if category not in CATEGORY_API and category != COMBINED_CATEGORY:
+            QMessageBox.warning(self, "오류", "검색 유형(입찰공고/사전규격/통합)을 선택해주세요.")
+            return
+
+        local = hasattr(self, 'localSearchCheckBox') and self.localSearchCheckBox.isChecked()
+        if local:
+            self.init_local_store()
+            if self.notice_store is None:
+                QMessageBox.warning(self, "오류", "로컬 저장소를 열 수 없습니다.")
+                return
+        elif not service_key:
+            QMessageBox.warning(self, "오류", "API 인증키를 입력해주세요.")
+            return
+        conditions = self.search_conditions()
+        if conditions is None:
+            return
+
+        self.refine_timer.stop()
+        self.cancel_search("새 검색으로 교체")
+        self.clear_results()
+        self.search_situation.setText(f"[{category}] '{keyword_input}' 검색 중입니다... (데이터량에 따라 시간이 걸릴 수 있습니다)")
+
+        # 로컬 검색: API를 호출하지 않고 지금까지 내려받은 공고에서 찾는다
+        if local:
+            timings = self.begin_search_request(category, keyword_input, start_dt, end_dt, 'local', conditions)
+            self.start_search_worker(LocalSearchWorker(self.notice_store, category, keyword_input, start_dt, end_dt,
+                                                       timings=timings, conditions=conditions))
+            return
+
+        params_base = search_params(service_key)
+
+        window_count = len(split_date_windows(start_dt, end_dt))
+        if window_count > 1:
+            self.search_situation.setText(
+                f"[{category}] '{keyword_input}' 검색 중입니다... "
+                f"(검색 기간을 {window_count}개 구간으로 나누어 조회합니다)")
+
+        print(f"검색 시작: [{category}] 키워드='{primary_keyword}'"
+              + (f" 조건={conditions.labels}" if conditions else ""))
+
+        self.init_local_store()
+        timings = self.begin_search_request(category, keyword_input, start_dt, end_dt, 'api', conditions)
+        if category == COMBINED_CATEGORY:
+            # 입찰공고·사전규격을 동시에 요청해 한 표로 보여준다
+            worker = CombinedSearchWorker(params_base, matcher, start_dt, end_dt,
+                                          cache=self.response_cache, store=self.notice_store, timings=timings,
+                                          conditions=conditions)
+        else:
+            worker = SearchWorker(category, params_base, matcher, start_dt, end_dt,
+                                  cache=self.response_cache, store=self.notice_store, timings=timings,
+                                  conditions=conditions)
+        self.start_search_worker(worker)
+
+    def search_running(self):
+        return self.worker is not None and self.worker.isRunning()
+
+    def start_search_worker(self, worker):
+        """검색 워커를 연결해 시작한다. 신호는 이 워커가 아직 현재 검색일 때만 처리한다."""
+        self.search_generation += 1
+        generation = self.search_generation
+
+        def current(handler):
+            return lambda data: handler(data) if generation == self.search_generation else None
+
+        worker.result_signal.connect(current(self.handle_success))
+        worker.error_signal.connect(current(self.handle_error))
+        if hasattr(worker, 'page_signal'):
+            worker.page_signal.connect(current(self.handle_page))
+        self.worker = worker
+        if hasattr(self, 'cancelButton'):
+            self.cancelButton.setEnabled(True)
+        worker.start()
+
+    def cancel_search(self, reason):
+        """진행 중인 검색을 멈춘다 (검색 취소 버튼, 또는 검색 중에 새 검색을 시작할 때).
+
+        워커에 취소를 알려 남은 페이지 요청을 버리게 하고, 검색 번호를 바꿔 그 워커가
+        나중에 보내는 신호는 무시한다. 취소한 검색이 있었으면 True.
+        """
+        worker, self.worker = self.worker, None
+        self.search_generation += 1
+        if hasattr(self, 'cancelButton'):
+            self.cancelButton.setEnabled(False)
+        if worker is None or not worker.isRunning():
+            return False
+        if hasattr(worker, 'cancel'):
+            worker.cancel()
+        self.retired_workers.append(worker)
+        worker.finished.connect(lambda: worker in self.retired_workers and self.retired_workers.remove(worker))
+        request, self.search_request = self.search_request or {}, None
+        self.finish_search_timings(request.get('category', ''), request.get('query', ''),
+                                   request.get('mode', ''), error=reason)
+        return True
+
+    def stop_search(self):
+        """검색 취소 버튼: 그때까지 받은 공고는 표에 남겨 둔다 (저장은 끝까지 받은 결과만)."""
+        if not self.cancel_search("취소"):
+            return
+        self.export_view = None
+        status = "검색을 취소했습니다."
+        if self.result_model is not None:
+            status += f" (그때까지 받은 {self.result_model.total_rows():,}건만 표에 남아 있습니다)"
+        self.search_situation.setText(status)
+
+    def clear_results(self):
+        self.tableView.setModel(None)
+        self.result_model = None
+        self.result = None
+        self.export_view = None
+        if hasattr(self, 'searchProgressBar'):
+            self.searchProgressBar.setMaximum(1)
+            self.searchProgressBar.setValue(0)
+
+    def schedule_refine(self):
+        """검색어를 고칠 때마다 타이머를 다시 시작한다 (입력을 멈춘 뒤 한 번만 거른다)."""
+        if self.refineCheckBox.isChecked():
+            self.refine_timer.start(REFINE_DELAY_MS)
+
+    def refine_search(self):
+        """'입력하며 좁히기': 검색어 칸의 조건으로 받아 둔 공고(로컬 저장소)를 다시 거른다. API는 부르지 않는다."""
+        query = self.search_keyword.text().strip()
+        if not KeywordMatcher(query).groups:
+            return
+        if self.search_running() and (self.search_request or {}).get('mode') in ('api', 'batch'):
+            # API 검색이 끝나 받은 공고가 저장소에 들어간 뒤에 거른다
+            self.refine_timer.start(REFINE_DELAY_MS)
+            return
+        category = self.comboBox.currentText().strip() if hasattr(self, 'comboBox') else "입찰공고"
+        start_dt = self.search_startdate.dateTime().toPyDateTime().replace(second=0, microsecond=0)
+        end_dt = self.search_enddate.dateTime().toPyDateTime().replace(second=0, microsecond=0)
+        if start_dt > end_dt or (category not in CATEGORY_API and category != COMBINED_CATEGORY):
+            return
+        conditions = self.search_conditions(warn=False)
+        if conditions is None:
+            return
+        self.init_local_store()
+        if self.notice_store is None:
+            return
+
+        self.cancel_search("검색어 변경")
+        self.clear_results()
+        timings = self.begin_search_request(category, query, start_dt, end_dt, 'refine', conditions)
+        self.search_situation.setText(f"[{category}] '{query}' 받아 둔 공고에서 거르는 중...")
+        self.start_search_worker(LocalSearchWorker(self.notice_store, category, query, start_dt, end_dt,
+                                                   timings=timings, refine=True, conditions=conditions))
+
+    def begin_search_request(self, category, query, start_dt, end_dt, mode, conditions=None):
+        """검색 조건을 기억하고(handle_success에서 검색 기록으로 남김) 단계별 시간 측정을 시작한다."""
+        self.search_request = dict(category=category, query=query, start_dt=start_dt, end_dt=end_dt, mode=mode,
+                                   conditions=conditions.labels if conditions else [])
+        self.search_timings = SearchTimings()
+        return self.search_timings
+
+    def timed(self, stage):
+        """진행 중인 검색의 화면 쪽 단계(표 데이터 · 표 연결 · 크기 조정) 시간을 잰다."""
+        return self.search_timings.measure(stage) if self.search_timings is not None else nullcontext()
+
+    def finish_search_timings(self, category, query, mode, **fields):
+        """단계별 시간을 검색 기록 파일에 남기고, 화면에 보여줄 요약을 돌려준다."""
+        timings, self.search_timings = self.search_timings, None
+        if timings is None:
+            return ''
+        timings.finish()
+        append_search_log(timings.as_record(category=category, query=query, mode=mode, **fields))
+        return timings.summary()
+
+    def record_search_history(self, items, category):
+        request, self.search_request = self.search_request, None
+        if request is None or request['mode'] == 'refine':
+            return
+        duration_ms = self.search_timings.total * 1000 if self.search_timings is not None else 0
+        request = {k: v for k, v in request.items() if k != 'conditions'}
+        entry = self.settings_store.add_history(result_count=len(items), duration_ms=duration_ms,
+                                                result_keys=history_keys(items, category), **request)
+        self.fill_history_combo([entry] + self.history_entries[:HISTORY_MENU_SIZE - 1])
+
+    def fill_history_combo(self, entries):
+        """'최근 검색' 목록을 검색 기록(새것부터)으로 채운다. 첫 칸은 안내 문구."""
+        self.history_entries = entries
+        if not hasattr(self, 'historyComboBox'):
+            return
+        self.historyComboBox.blockSignals(True)
+        self.historyComboBox.clear()
+        self.historyComboBox.addItem("최근 검색")
+        for entry in entries:
+            self.historyComboBox.addItem(
+                f"{entry['searched_at'][5:16]} [{entry['category']}] {entry['query']} "
+                f"({entry['result_count']:,}건)")
+        self.historyComboBox.blockSignals(False)
+
+    def recall_history(self, index):
+        """검색 기록을 골라 API를 다시 부르지 않고 그때 결과를 로컬 저장소에서 되살린다."""
+        if index <= 0 or index > len(self.history_entries):
+            return
+        entry = self.history_entries[index - 1]
+        self.historyComboBox.setCurrentIndex(0)
+        self.init_local_store()
+        if self.notice_store is None:
+            QMessageBox.warning(self, "오류", "로컬 저장소를 열 수 없습니다.")
+            return
+
+        # 검색 조건도 그때대로 되돌린다 (저장단어 전체 검색은 검색어 칸을 건드리지 않음)
+        if hasattr(self, 'comboBox'):
+            labels = [self.comboBox.itemText(i).strip() for i in range(self.comboBox.count())]
+            if entry['category'] in labels:
+                self.comboBox.setCurrentIndex(labels.index(entry['category']))
+        if entry['mode'] not in ('batch', 'watch'):
+            self.search_keyword.setText(entry['query'])
+        for widget, text in ((self.search_startdate, entry['start_dt']), (self.search_enddate, entry['end_dt'])):
+            widget.setDateTime(QDateTime.fromString(text, 'yyyy-MM-dd HH:mm'))
+
+        self.refine_timer.stop()
+        self.cancel_search("검색 기록 불러오기로 교체")
+        self.clear_results()
+        self.search_request = None
+        self.search_timings = SearchTimings()
+        self.search_situation.setText(f"[{entry['category']}] '{entry['query']}' 검색 기록을 불러오는 중입니다...")
+        self.start_search_worker(HistoryRecallWorker(self.settings_store, self.notice_store, entry['id']))
+
+    def install_model(self, view):
+        """결과 모델을 테이블에 연결한다 (링크·파일 URL 컬럼은 view에 없고 self.result.links()로 읽는다)."""
+        self.result_model = PandasModel(view)
+        self.tableView.setModel(self.result_model)
+        self.tableView.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.fill_filter_columns(view.columns)
+        self.apply_result_filter()
+
+    def fill_filter_columns(self, columns):
+        """결과 내 필터 컬럼 목록을 화면에 보이는 컬럼으로 채운다 (같은 이름이 있으면 선택 유지)."""
+        if not hasattr(self, 'filterColumnComboBox'):
+            return
+        current = self.filterColumnComboBox.currentText()
+        self.filterColumnComboBox.blockSignals(True)
+        self.filterColumnComboBox.clear()
+        self.filterColumnComboBox.addItems(columns)
+        if current in columns:
+            self.filterColumnComboBox.setCurrentText(current)
+        self.filterColumnComboBox.blockSignals(False)
+
+    def apply_result_filter(self):
+        """결과 내 필터 입력을 현재 결과 모델에 적용한다 (다시 검색하지 않음)."""
+        self.filter_timer.stop()
+        if self.result_model is None or not hasattr(self, 'filterLineEdit'):
+            return
+        text = self.filterLineEdit.text()
+        column_name = self.filterColumnComboBox.currentText()
+        columns = self.result_model.column_names()
+        column = columns.index(column_name) if column_name in columns else -1
+        try:
+            self.tableView.scrollToTop()
+            self.result_model.set_filter(column, text)
+        except ValueError as e:
+            self.search_situation.setText(f"필터 오류: {e}")
+            return
+        if text.strip() and column >= 0:
+            self.search_situation.setText(
+                f"결과 내 필터 [{column_name}] '{text.strip()}': "
+                f"{self.result_model.rowCount():,} / {self.result_model.total_rows():,}건")
 
-        # [추가] 파일 URL 컬럼들도 화면에서 숨기기 (데이터는 가지고 있음)
-        for col in file_cols:
-            if col in df1.columns:
-                col_idx = df1.columns.get_loc(col)
-                self.tableView.setColumnHidden(col_idx, True)
+    def fit_table_sections(self):
+        """컬럼 폭은 앞쪽 RESIZE_SAMPLE_ROWS행만 재서 맞추고, 행 높이는 첫 행 기준으로 통일한다.
 
-        self.tableView.resizeColumnsToContents()
-        self.tableView.resizeRowsToContents()
+        resizeRowsToContents()는 모든 행을 재므로 수만 건에서 화면이 멈춘다.
+        결과 행은 모두 한 줄짜리라 첫 행 높이를 기본 높이로 쓰면 된다.
+        """
+        with self.timed('resize'):
+            self.tableView.horizontalHeader().setResizeContentsPrecision(RESIZE_SAMPLE_ROWS)
+            self.tableView.resizeColumnsToContents()
+            if self.result_model is not None and self.result_model.rowCount() > 0:
+                self.tableView.resizeRowToContents(0)
+                self.tableView.verticalHeader().setDefaultSectionSize(self.tableView.rowHeight(0))
+
+    def handle_page(self, data):
+        """검색 중 페이지가 도착할 때마다 걸러진 공고를 표에 이어 붙인다."""
+        if data['items']:
+            with self.timed('frame'):
+                page = build_result(data['items'], data['category'])
+            if self.result_model is None:
+                self.result = page
+                with self.timed('model'):
+                    self.install_model(page.display())
+                self.fit_table_sections()
+            else:
+                with self.timed('model'):
+                    self.result.extend(page)
+                    self.result_model.append_frame(page.display())
+
+        expected = max(data['expected'], data['received'])
+        if hasattr(self, 'searchProgressBar'):
+            self.searchProgressBar.setMaximum(max(expected, 1))
+            self.searchProgressBar.setValue(data['received'])
+        self.search_situation.setText(
+            f"[{data['category']}] 검색 중... {data['received']:,} / {expected:,}건 수신, "
+            f"{data['matched']:,}건 일치")
 
-        self.search_situation.setText(f"[{category}] 검색 완료: {len(df)}건이 검색되었습니다.")
-        self.startButton.setEnabled(True)
+    def handle_success(self, data):
+        bid_data = data['items']
+        
+        category = data.get('category')
+        if not category:
+            if hasattr(self, 'comboBox'):
+                category = self.comboBox.currentText().strip()
+            else:
+                category = "입찰공고"
+
+        if not (data.get('streamed') and self.result is not None):
+            with self.timed('frame'):
+                self.result = build_result(bid_data, category)
+            with self.timed('model'):
+                self.install_model(self.result.display())
+        # 페이지별로 받은 결과는 이미 self.result에 모두 들어 있다 (저장용 표를 따로 만들지 않는다)
+        self.export_view = self.result.export()
+
+        self.fit_table_sections()
+
+        if hasattr(self, 'searchProgressBar') and not data.get('streamed'):
+            self.searchProgressBar.setMaximum(max(data['total_count'], 1))
+            self.searchProgressBar.setValue(data['total_count'])
+
+        status = f"[{category}] 검색 완료: {len(bid_data)}건이 검색되었습니다."
+        if data.get('category_counts'):
+            counts = ", ".join(f"{c} {n:,}건" for c, n in data['category_counts'].items())
+            status = f"[{category}] 검색 완료: {len(bid_data)}건이 검색되었습니다. ({counts})"
+        if data.get('batch'):
+            status = f"[{category}] 저장단어 {data['batch']}개 검색 완료: 중복을 뺀 {len(bid_data)}건이 검색되었습니다."
+        if data.get('failures'):
+            status += f" (실패 {len(data['failures'])}건: {'; '.join(data['failures'])})"
+        if data.get('truncated'):
+            status += (f" (전체 {data['total_count']}건 중 최대 {data.get('max_pages', MAX_PAGES)}페이지, "
+                       f"{data['fetched_count']}건까지만 조회했습니다. 검색어나 기간을 좁혀주세요.)")
+        if data.get('local'):
+            status += f" (로컬 저장소, {data['elapsed_ms']:.0f}ms)"
+        if data.get('refined'):
+            status = (f"[{category}] 받아 둔 공고에서 {len(bid_data):,}건을 찾았습니다. "
+                      f"(API 호출 없음, {data['elapsed_ms']:.0f}ms · Enter를 누르면 API로 새로 검색)")
+        if data.get('cached_days'):
+            status += f" (저장된 {data['cached_days']}일치 결과 사용)"
+        if data.get('watch'):
+            status = (f"[{category}] 저장단어 감시 {data['watch']['checked_at']:%m-%d %H:%M}: "
+                      f"새 공고 {len(bid_data)}건")
+        if data.get('recalled'):
+            status = (f"[{category}] {data['history']['searched_at'][:16]} 검색 기록: "
+                      f"{len(bid_data)}건을 다시 받지 않고 불러왔습니다. ({data['elapsed_ms']:.0f}ms)")
+            if data['missing']:
+                status += f" (로컬 저장소에 없는 {data['missing']}건 제외)"
+            timing_fields = dict(query=data['history']['query'], mode='recall')
+        else:
+            request = self.search_request or {}
+            if request.get('conditions') and not data.get('watch'):
+                status += f" (검색 조건: {', '.join(request['conditions'])})"
+            timing_fields = dict(query=request.get('query', ''), mode=request.get('mode', ''))
+            if request:
+                timing_fields.update(start_dt=f"{request['start_dt']:%Y-%m-%d %H:%M}",
+                                     end_dt=f"{request['end_dt']:%Y-%m-%d %H:%M}")
+            if request.get('conditions'):
+                timing_fields['conditions'] = request['conditions']
+            self.record_search_history(bid_data, category)
+        timing_summary = self.finish_search_timings(category, result_count=len(bid_data), **timing_fields)
+        if timing_summary:
+            status += f"\n{timing_summary}"
+        self.search_situation.setText(status)
+        if hasattr(self, 'cancelButton'):
+            self.cancelButton.setEnabled(False)
 
     def handle_error(self, msg):
-        if "검색 결과가 없습니다" in msg:
-            self.search_situation.setText("검색 결과가 없습니다.")
+        request, self.search_request = self.search_request or {}, None
+        self.finish_search_timings(request.get('category', ''), request.get('query', ''),
+                                   request.get('mode', ''), error=msg)
+        if hasattr(self, 'cancelButton'):
+            self.cancelButton.setEnabled(False)
+        if request.get('mode') == 'refine':
+            # 입력 중에는 창을 띄우지 않는다
+            self.search_situation.setText(msg)
+        elif "검색 결과가 없습니다" in msg:
+            self.search_situation.setText(msg)
         else:
             self.search_situation.setText("검색 결과가 없습니다.")
             QMessageBox.warning(self, "알림", msg)
-        self.startButton.setEnabled(True)
 
     def search_reset(self):
+        self.refine_timer.stop()
+        self.cancel_search("리셋")
         self.tableView.setModel(None)
+        self.result_model = None
         self.search_keyword.setText("")
+        if hasattr(self, 'filterLineEdit'):
+            self.filterLineEdit.blockSignals(True)
+            self.filterLineEdit.clear()
+            self.filterLineEdit.blockSignals(False)
+            self.filterColumnComboBox.clear()
         self.search_situation.setText("리셋 되었습니다.")
-        self.df2 = None
-        self.display_df = None
+        self.result = None
+        self.export_view = None
 
     def search_save(self):
-        if self.df2 is None or self.df2.empty:
+        if self.export_view is None or self.export_view.empty:
             QMessageBox.information(self, "알림", "저장할 데이터가 없습니다.")
             return
+        if self.export_worker is not None and self.export_worker.isRunning():
+            QMessageBox.information(self, "알림", "이전 결과를 저장하는 중입니다. 잠시 후 다시 시도해 주세요.")
+            return
         
         keyword_part = self.search_keyword.text().strip()
         if not keyword_part: keyword_part = "통합"
@@ -863,25 +1769,83 @@ class MainWidget(QWidget):
         else:
             category = "결과"
 
+        filters = {"Excel Files (*.xlsx)": 'xlsx', "CSV Files (*.csv)": 'csv'}
+        if parquet_supported():
+            filters["Parquet Files (*.parquet)"] = 'parquet'
         default_name = f"{category}_{keyword_part}_검색결과_{datetime.now().strftime('%Y%m%d')}.xlsx"
-        save_path, _ = QFileDialog.getSaveFileName(self, "엑셀 파일 저장", default_name, "Excel Files (*.xlsx)")
+        save_path, selected_filter = QFileDialog.getSaveFileName(self, "검색 결과 저장", default_name, ";;".join(filters))
 
         if save_path:
-            try:
-                self.df2.to_excel(save_path, index=False)
-                self.search_situation.setText(f"저장 완료: {os.path.basename(save_path)}")
-                QMessageBox.information(self, "성공", "파일이 성공적으로 저장되었습니다.\n확인을 누르면 엑셀 파일이 열립니다.")
-                os.startfile(save_path)
-            except Exception as e:
-                self.search_situation.setText("저장 실패")
-                QMessageBox.critical(self, "실패", f"파일 저장 중 오류가 발생했습니다.\n{str(e)}")
+            # 확장자를 바꿔 쓰면 그 형식으로, 아니면 고른 파일 형식으로 저장한다
+            fmt = export_format_for(save_path, default=filters.get(selected_filter, 'xlsx'))
+            if fmt not in filters.values():
+                fmt = filters.get(selected_filter, 'xlsx')
+            if not save_path.lower().endswith('.' + fmt):
+                save_path = os.path.splitext(save_path)[0] + '.' + fmt
+
+            self.export_worker = ExportWorker(self.export_view, save_path, fmt)
+            self.export_worker.progress_signal.connect(self.handle_export_progress)
+            self.export_worker.done_signal.connect(self.handle_export_done)
+            self.export_worker.error_signal.connect(self.handle_export_error)
+            self.saveButton.setEnabled(False)
+            self.search_situation.setText(f"저장 중: {os.path.basename(save_path)} ({len(self.export_view):,}행)")
+            self.export_worker.start()
+
+    def handle_export_progress(self, data):
+        percent = data['written'] * 100 // max(data['total'], 1)
+        self.saveButton.setText(f"저장 중 {percent}%")
+
+    def finish_export(self):
+        self.saveButton.setText(self.save_button_text)
+        self.saveButton.setEnabled(True)
+
+    def handle_export_done(self, data):
+        self.finish_export()
+        name = os.path.basename(data['path'])
+        self.search_situation.setText(f"저장 완료: {name} ({data['rows']:,}행, {data['elapsed']:.1f}초)")
+        if data['fmt'] == 'parquet' or not hasattr(os, 'startfile'):
+            QMessageBox.information(self, "성공", f"파일이 성공적으로 저장되었습니다.\n{data['path']}")
+            return
+        QMessageBox.information(self, "성공", "파일이 성공적으로 저장되었습니다.\n확인을 누르면 엑셀 파일이 열립니다.")
+        try:
+            os.startfile(data['path'])
+        except OSError as e:
+            print(f"파일 열기 실패: {e}")
+
+    def handle_export_error(self, msg):
+        self.finish_export()
+        self.search_situation.setText("저장 실패")
+        QMessageBox.critical(self, "실패", f"파일 저장 중 오류가 발생했습니다.\n{msg}")
+
+    def closeEvent(self, event):
+        self.cancel_search("프로그램 종료")
+        self.stop_watch(wait=True)
+        self.settings_store.close()
+        super().closeEvent(event)
 
     def search_end(self):
+        self.cancel_search("프로그램 종료")
+        self.stop_watch(wait=True)
+        self.settings_store.close()
         sys.exit()
 
 if __name__ == '__main__':
+    if '--harvest' in sys.argv[1:]:
+        sys.exit(harvest_main(sys.argv[1:]))
+
+    startup_timer.mark('import')
     QApplication.setStyle("fusion")
     app = QApplication(sys.argv)
+    startup_timer.mark('QApplication')
     main_Widget = MainWidget()
     main_Widget.showMaximized()
+    app.processEvents()
+    startup_timer.mark('창 표시')
+
+    # 창이 뜬 뒤에 무거운 모듈을 미리 불러 둔다
+    preload_worker = PreloadWorker()
+    report_mode = next((arg for arg in sys.argv[1:] if arg.startswith('--startup-report')), None)
+    if report_mode:
+        preload_worker.finished.connect(lambda: print_startup_report(report_mode, preload_worker.elapsed, app))
+    preload_worker.start()
     sys.exit(app.exec_())
\ No newline at end of file
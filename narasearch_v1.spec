@@ -1,38 +1,56 @@
 # -*- mode: python ; coding: utf-8 -*-
 
+# 화면(.ui)을 파이썬 코드로 미리 변환한다: 실행할 때 XML을 읽지 않아 창이 빨리 뜬다
+from PyQt5.uic import compileUi
+
+with open('narasearchv1_ui.py', 'w', encoding='utf-8') as ui_module:
+    compileUi('ui/narasearchv1.ui', ui_module)
+
 
 a = Analysis(
     ['narasearch_v1.py'],
     pathex=[],
     binaries=[],
     datas=[('ui', 'ui')],
-    hiddenimports=[],
+    # narasearch_engine이 처음 쓸 때 불러오는 모듈 (LazyModule이라 자동으로 찾지 못함)
+    hiddenimports=['numpy', 'pandas', 'requests', 'openpyxl'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    # 쓰지 않는데 pandas 등을 따라 들어오는 패키지 (압축 해제·로딩 시간만 늘린다)
+    excludes=['tkinter', 'matplotlib', 'scipy', 'IPython', 'sqlalchemy', 'setuptools', 'PIL',
+              'jinja2', 'google', 'pyasn1', 'pyasn1_modules', 'rsa', 'pytest'],
     noarchive=False,
     optimize=0,
 )
 pyz = PYZ(a.pure)
 
+# 한 파일(onefile) 대신 폴더로 배포한다: onefile은 실행할 때마다 전체를 임시 폴더에
+# 푼 뒤에야 창이 뜬다. contents_directory='.'이면 ui 폴더가 exe 옆에 바로 놓인다.
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='narasearch_v1',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
+    upx=False,
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
     target_arch=None,
     codesign_identity=None,
     entitlements_file=None,
+    contents_directory='.',
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='narasearch_v1',
 )
@@ -0,0 +1,828 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'ui/narasearchv1.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Form(object):
+    def setupUi(self, Form):
+        Form.setObjectName("Form")
+        Form.setWindowModality(QtCore.Qt.NonModal)
+        Form.setEnabled(True)
+        Form.resize(1200, 800)
+        Form.setMinimumSize(QtCore.QSize(1080, 720))
+        self.gridLayout = QtWidgets.QGridLayout(Form)
+        self.gridLayout.setObjectName("gridLayout")
+        self.gridLayout_2 = QtWidgets.QGridLayout()
+        self.gridLayout_2.setObjectName("gridLayout_2")
+        self.horizontalLayout_15 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_15.setObjectName("horizontalLayout_15")
+        self.horizontalLayout_8 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_8.setSpacing(6)
+        self.horizontalLayout_8.setObjectName("horizontalLayout_8")
+        self.label_7 = QtWidgets.QLabel(Form)
+        self.label_7.setMinimumSize(QtCore.QSize(100, 0))
+        self.label_7.setMaximumSize(QtCore.QSize(100, 16777215))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoB00")
+        font.setPointSize(12)
+        self.label_7.setFont(font)
+        self.label_7.setObjectName("label_7")
+        self.horizontalLayout_8.addWidget(self.label_7)
+        self.search_servicekey = QtWidgets.QLineEdit(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoR00")
+        font.setPointSize(10)
+        self.search_servicekey.setFont(font)
+        self.search_servicekey.setObjectName("search_servicekey")
+        self.horizontalLayout_8.addWidget(self.search_servicekey)
+        self.horizontalLayout_15.addLayout(self.horizontalLayout_8)
+        self.horizontalLayout_16 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_16.setObjectName("horizontalLayout_16")
+        self.label_4 = QtWidgets.QLabel(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoB00")
+        font.setPointSize(12)
+        self.label_4.setFont(font)
+        self.label_4.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_4.setObjectName("label_4")
+        self.horizontalLayout_16.addWidget(self.label_4)
+        self.expiredkeydate = QtWidgets.QLineEdit(Form)
+        self.expiredkeydate.setMaximumSize(QtCore.QSize(300, 16777215))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoR00")
+        font.setPointSize(10)
+        self.expiredkeydate.setFont(font)
+        self.expiredkeydate.setObjectName("expiredkeydate")
+        self.horizontalLayout_16.addWidget(self.expiredkeydate)
+        self.horizontalLayout_15.addLayout(self.horizontalLayout_16)
+        self.gridLayout_2.addLayout(self.horizontalLayout_15, 17, 0, 1, 1)
+        self.line_7 = QtWidgets.QFrame(Form)
+        self.line_7.setMinimumSize(QtCore.QSize(0, 10))
+        self.line_7.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_7.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_7.setObjectName("line_7")
+        self.gridLayout_2.addWidget(self.line_7, 5, 0, 1, 1)
+        spacerItem = QtWidgets.QSpacerItem(40, 10, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout_2.addItem(spacerItem, 11, 0, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(40, 10, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout_2.addItem(spacerItem1, 14, 0, 1, 1)
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setContentsMargins(-1, 2, -1, 2)
+        self.horizontalLayout_2.setSpacing(6)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.label_2 = QtWidgets.QLabel(Form)
+        self.label_2.setMinimumSize(QtCore.QSize(105, 0))
+        self.label_2.setMaximumSize(QtCore.QSize(100, 16777215))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoB00")
+        font.setPointSize(14)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_2.setFont(font)
+        self.label_2.setObjectName("label_2")
+        self.horizontalLayout_2.addWidget(self.label_2)
+        self.line_4 = QtWidgets.QFrame(Form)
+        self.line_4.setMinimumSize(QtCore.QSize(20, 0))
+        self.line_4.setFrameShape(QtWidgets.QFrame.VLine)
+        self.line_4.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_4.setObjectName("line_4")
+        self.horizontalLayout_2.addWidget(self.line_4)
+        self.label_3 = QtWidgets.QLabel(Form)
+        self.label_3.setMaximumSize(QtCore.QSize(50, 16777215))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoM00")
+        font.setPointSize(14)
+        self.label_3.setFont(font)
+        self.label_3.setObjectName("label_3")
+        self.horizontalLayout_2.addWidget(self.label_3)
+        self.search_startdate = QtWidgets.QDateTimeEdit(Form)
+        self.search_startdate.setMinimumSize(QtCore.QSize(220, 36))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoEB00")
+        font.setPointSize(14)
+        self.search_startdate.setFont(font)
+        self.search_startdate.setStyleSheet("QPushButton{background-color:rgb(208, 247, 255)}")
+        self.search_startdate.setDate(QtCore.QDate(2025, 1, 1))
+        self.search_startdate.setObjectName("search_startdate")
+        self.horizontalLayout_2.addWidget(self.search_startdate)
+        self.label_6 = QtWidgets.QLabel(Form)
+        self.label_6.setMaximumSize(QtCore.QSize(70, 16777215))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoM00")
+        font.setPointSize(14)
+        self.label_6.setFont(font)
+        self.label_6.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_6.setObjectName("label_6")
+        self.horizontalLayout_2.addWidget(self.label_6)
+        self.search_enddate = QtWidgets.QDateTimeEdit(Form)
+        self.search_enddate.setMinimumSize(QtCore.QSize(220, 36))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoEB00")
+        font.setPointSize(14)
+        self.search_enddate.setFont(font)
+        self.search_enddate.setDate(QtCore.QDate(2025, 1, 1))
+        self.search_enddate.setObjectName("search_enddate")
+        self.horizontalLayout_2.addWidget(self.search_enddate)
+        self.threeweeksButton = QtWidgets.QPushButton(Form)
+        self.threeweeksButton.setMinimumSize(QtCore.QSize(0, 36))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoSB00")
+        font.setPointSize(14)
+        self.threeweeksButton.setFont(font)
+        self.threeweeksButton.setStyleSheet("QPushButton{background-color:rgb(208, 247, 255)}")
+        self.threeweeksButton.setObjectName("threeweeksButton")
+        self.horizontalLayout_2.addWidget(self.threeweeksButton)
+        self.label_11 = QtWidgets.QLabel(Form)
+        self.label_11.setMinimumSize(QtCore.QSize(0, 0))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoM00")
+        font.setPointSize(13)
+        self.label_11.setFont(font)
+        self.label_11.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_11.setObjectName("label_11")
+        self.horizontalLayout_2.addWidget(self.label_11)
+        self.gridLayout_2.addLayout(self.horizontalLayout_2, 4, 0, 1, 1)
+        self.horizontalLayout_7 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_7.setObjectName("horizontalLayout_7")
+        self.verticalLayout_10 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_10.setObjectName("verticalLayout_10")
+        self.filterLayout = QtWidgets.QHBoxLayout()
+        self.filterLayout.setObjectName("filterLayout")
+        self.filterLabel = QtWidgets.QLabel(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoB00")
+        font.setPointSize(12)
+        self.filterLabel.setFont(font)
+        self.filterLabel.setObjectName("filterLabel")
+        self.filterLayout.addWidget(self.filterLabel)
+        self.filterColumnComboBox = QtWidgets.QComboBox(Form)
+        self.filterColumnComboBox.setMinimumSize(QtCore.QSize(180, 32))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoM00")
+        font.setPointSize(12)
+        self.filterColumnComboBox.setFont(font)
+        self.filterColumnComboBox.setObjectName("filterColumnComboBox")
+        self.filterLayout.addWidget(self.filterColumnComboBox)
+        self.filterLineEdit = QtWidgets.QLineEdit(Form)
+        self.filterLineEdit.setMinimumSize(QtCore.QSize(0, 32))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoM00")
+        font.setPointSize(12)
+        self.filterLineEdit.setFont(font)
+        self.filterLineEdit.setClearButtonEnabled(True)
+        self.filterLineEdit.setObjectName("filterLineEdit")
+        self.filterLayout.addWidget(self.filterLineEdit)
+        self.verticalLayout_10.addLayout(self.filterLayout)
+        self.tableView = QtWidgets.QTableView(Form)
+        self.tableView.setAutoScrollMargin(0)
+        self.tableView.setObjectName("tableView")
+        self.verticalLayout_10.addWidget(self.tableView)
+        self.horizontalLayout_7.addLayout(self.verticalLayout_10)
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.startButton = QtWidgets.QPushButton(Form)
+        self.startButton.setMinimumSize(QtCore.QSize(0, 40))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoB00")
+        font.setPointSize(12)
+        self.startButton.setFont(font)
+        self.startButton.setStyleSheet("QPushButton{background-color:rgb(252, 235, 255)}")
+        self.startButton.setObjectName("startButton")
+        self.verticalLayout_2.addWidget(self.startButton)
+        self.cancelButton = QtWidgets.QPushButton(Form)
+        self.cancelButton.setEnabled(False)
+        self.cancelButton.setMinimumSize(QtCore.QSize(0, 40))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoB00")
+        font.setPointSize(12)
+        self.cancelButton.setFont(font)
+        self.cancelButton.setObjectName("cancelButton")
+        self.verticalLayout_2.addWidget(self.cancelButton)
+        self.resetButton = QtWidgets.QPushButton(Form)
+        self.resetButton.setMinimumSize(QtCore.QSize(0, 40))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoB00")
+        font.setPointSize(12)
+        self.resetButton.setFont(font)
+        self.resetButton.setObjectName("resetButton")
+        self.verticalLayout_2.addWidget(self.resetButton)
+        self.saveButton = QtWidgets.QPushButton(Form)
+        self.saveButton.setMinimumSize(QtCore.QSize(0, 40))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoB00")
+        font.setPointSize(12)
+        self.saveButton.setFont(font)
+        self.saveButton.setObjectName("saveButton")
+        self.verticalLayout_2.addWidget(self.saveButton)
+        self.noticeButton = QtWidgets.QPushButton(Form)
+        self.noticeButton.setMinimumSize(QtCore.QSize(0, 40))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoB00")
+        font.setPointSize(10)
+        self.noticeButton.setFont(font)
+        self.noticeButton.setAutoFillBackground(False)
+        self.noticeButton.setStyleSheet("QPushButton{background-color:rgb(208, 247, 255)}")
+        self.noticeButton.setObjectName("noticeButton")
+        self.verticalLayout_2.addWidget(self.noticeButton)
+        spacerItem2 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_2.addItem(spacerItem2)
+        self.endButton = QtWidgets.QPushButton(Form)
+        self.endButton.setMinimumSize(QtCore.QSize(0, 40))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoB00")
+        font.setPointSize(12)
+        self.endButton.setFont(font)
+        self.endButton.setObjectName("endButton")
+        self.verticalLayout_2.addWidget(self.endButton)
+        self.horizontalLayout_7.addLayout(self.verticalLayout_2)
+        self.gridLayout_2.addLayout(self.horizontalLayout_7, 15, 0, 1, 1)
+        spacerItem3 = QtWidgets.QSpacerItem(1103, 13, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout_2.addItem(spacerItem3, 16, 0, 1, 1)
+        self.line_2 = QtWidgets.QFrame(Form)
+        self.line_2.setMinimumSize(QtCore.QSize(0, 10))
+        self.line_2.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_2.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_2.setObjectName("line_2")
+        self.gridLayout_2.addWidget(self.line_2, 8, 0, 1, 1)
+        self.horizontalLayout_6 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_6.setObjectName("horizontalLayout_6")
+        self.search_situation = QtWidgets.QLabel(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoSB00")
+        font.setPointSize(14)
+        self.search_situation.setFont(font)
+        self.search_situation.setObjectName("search_situation")
+        self.horizontalLayout_6.addWidget(self.search_situation)
+        self.searchProgressBar = QtWidgets.QProgressBar(Form)
+        self.searchProgressBar.setMaximumSize(QtCore.QSize(260, 16777215))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoM00")
+        font.setPointSize(11)
+        self.searchProgressBar.setFont(font)
+        self.searchProgressBar.setProperty("value", 0)
+        self.searchProgressBar.setObjectName("searchProgressBar")
+        self.horizontalLayout_6.addWidget(self.searchProgressBar)
+        self.label_13 = QtWidgets.QLabel(Form)
+        self.label_13.setMinimumSize(QtCore.QSize(0, 0))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoM00")
+        font.setPointSize(13)
+        self.label_13.setFont(font)
+        self.label_13.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_13.setObjectName("label_13")
+        self.horizontalLayout_6.addWidget(self.label_13)
+        self.gridLayout_2.addLayout(self.horizontalLayout_6, 13, 0, 1, 1)
+        self.line_3 = QtWidgets.QFrame(Form)
+        self.line_3.setMinimumSize(QtCore.QSize(0, 10))
+        self.line_3.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_3.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_3.setObjectName("line_3")
+        self.gridLayout_2.addWidget(self.line_3, 10, 0, 1, 1)
+        self.line = QtWidgets.QFrame(Form)
+        self.line.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line.setObjectName("line")
+        self.gridLayout_2.addWidget(self.line, 2, 0, 1, 1)
+        spacerItem4 = QtWidgets.QSpacerItem(40, 10, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout_2.addItem(spacerItem4, 3, 0, 1, 1)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.label_8 = QtWidgets.QLabel(Form)
+        self.label_8.setMaximumSize(QtCore.QSize(200, 16777215))
+        self.label_8.setText("")
+        self.label_8.setObjectName("label_8")
+        self.horizontalLayout.addWidget(self.label_8)
+        self.label = QtWidgets.QLabel(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoEB00")
+        font.setPointSize(32)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label.setFont(font)
+        self.label.setObjectName("label")
+        self.horizontalLayout.addWidget(self.label)
+        self.label_9 = QtWidgets.QLabel(Form)
+        self.label_9.setMaximumSize(QtCore.QSize(200, 16777215))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoM00")
+        self.label_9.setFont(font)
+        self.label_9.setLayoutDirection(QtCore.Qt.LeftToRight)
+        self.label_9.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_9.setObjectName("label_9")
+        self.horizontalLayout.addWidget(self.label_9)
+        self.gridLayout_2.addLayout(self.horizontalLayout, 0, 0, 1, 1)
+        self.horizontalLayout_9 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_9.setContentsMargins(-1, 2, -1, 2)
+        self.horizontalLayout_9.setObjectName("horizontalLayout_9")
+        self.label_12 = QtWidgets.QLabel(Form)
+        self.label_12.setMinimumSize(QtCore.QSize(105, 0))
+        self.label_12.setMaximumSize(QtCore.QSize(100, 16777215))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoB00")
+        font.setPointSize(14)
+        self.label_12.setFont(font)
+        self.label_12.setObjectName("label_12")
+        self.horizontalLayout_9.addWidget(self.label_12)
+        self.line_6 = QtWidgets.QFrame(Form)
+        self.line_6.setMinimumSize(QtCore.QSize(20, 0))
+        self.line_6.setFrameShape(QtWidgets.QFrame.VLine)
+        self.line_6.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_6.setObjectName("line_6")
+        self.horizontalLayout_9.addWidget(self.line_6)
+        self.horizontalLayout_11 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_11.setContentsMargins(-1, -1, 80, -1)
+        self.horizontalLayout_11.setObjectName("horizontalLayout_11")
+        self.verticalLayout_14 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_14.setContentsMargins(2, -1, 2, -1)
+        self.verticalLayout_14.setObjectName("verticalLayout_14")
+        self.horizontalLayout_36 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_36.setObjectName("horizontalLayout_36")
+        self.Shortcut_0 = QtWidgets.QLineEdit(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoSB00")
+        font.setPointSize(12)
+        self.Shortcut_0.setFont(font)
+        self.Shortcut_0.setInputMethodHints(QtCore.Qt.ImhEmailCharactersOnly)
+        self.Shortcut_0.setObjectName("Shortcut_0")
+        self.horizontalLayout_36.addWidget(self.Shortcut_0)
+        self.verticalLayout_14.addLayout(self.horizontalLayout_36)
+        self.horizontalLayout_37 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_37.setObjectName("horizontalLayout_37")
+        self.startShortcutButton_0 = QtWidgets.QPushButton(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoB00")
+        font.setPointSize(11)
+        self.startShortcutButton_0.setFont(font)
+        self.startShortcutButton_0.setObjectName("startShortcutButton_0")
+        self.horizontalLayout_37.addWidget(self.startShortcutButton_0)
+        self.verticalLayout_14.addLayout(self.horizontalLayout_37)
+        self.horizontalLayout_11.addLayout(self.verticalLayout_14)
+        self.verticalLayout_17 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_17.setContentsMargins(2, -1, 2, -1)
+        self.verticalLayout_17.setObjectName("verticalLayout_17")
+        self.horizontalLayout_42 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_42.setObjectName("horizontalLayout_42")
+        self.Shortcut_1 = QtWidgets.QLineEdit(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoSB00")
+        font.setPointSize(12)
+        self.Shortcut_1.setFont(font)
+        self.Shortcut_1.setObjectName("Shortcut_1")
+        self.horizontalLayout_42.addWidget(self.Shortcut_1)
+        self.verticalLayout_17.addLayout(self.horizontalLayout_42)
+        self.horizontalLayout_43 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_43.setObjectName("horizontalLayout_43")
+        self.startShortcutButton_1 = QtWidgets.QPushButton(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoB00")
+        font.setPointSize(11)
+        self.startShortcutButton_1.setFont(font)
+        self.startShortcutButton_1.setObjectName("startShortcutButton_1")
+        self.horizontalLayout_43.addWidget(self.startShortcutButton_1)
+        self.verticalLayout_17.addLayout(self.horizontalLayout_43)
+        self.horizontalLayout_11.addLayout(self.verticalLayout_17)
+        self.verticalLayout_18 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_18.setContentsMargins(2, -1, 2, -1)
+        self.verticalLayout_18.setObjectName("verticalLayout_18")
+        self.horizontalLayout_44 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_44.setObjectName("horizontalLayout_44")
+        self.Shortcut_2 = QtWidgets.QLineEdit(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoSB00")
+        font.setPointSize(12)
+        self.Shortcut_2.setFont(font)
+        self.Shortcut_2.setObjectName("Shortcut_2")
+        self.horizontalLayout_44.addWidget(self.Shortcut_2)
+        self.verticalLayout_18.addLayout(self.horizontalLayout_44)
+        self.horizontalLayout_45 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_45.setObjectName("horizontalLayout_45")
+        self.startShortcutButton_2 = QtWidgets.QPushButton(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoB00")
+        font.setPointSize(11)
+        self.startShortcutButton_2.setFont(font)
+        self.startShortcutButton_2.setObjectName("startShortcutButton_2")
+        self.horizontalLayout_45.addWidget(self.startShortcutButton_2)
+        self.verticalLayout_18.addLayout(self.horizontalLayout_45)
+        self.horizontalLayout_11.addLayout(self.verticalLayout_18)
+        self.verticalLayout_21 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_21.setContentsMargins(2, -1, 2, -1)
+        self.verticalLayout_21.setObjectName("verticalLayout_21")
+        self.horizontalLayout_50 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_50.setObjectName("horizontalLayout_50")
+        self.Shortcut_3 = QtWidgets.QLineEdit(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoSB00")
+        font.setPointSize(12)
+        self.Shortcut_3.setFont(font)
+        self.Shortcut_3.setObjectName("Shortcut_3")
+        self.horizontalLayout_50.addWidget(self.Shortcut_3)
+        self.verticalLayout_21.addLayout(self.horizontalLayout_50)
+        self.horizontalLayout_51 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_51.setObjectName("horizontalLayout_51")
+        self.startShortcutButton_3 = QtWidgets.QPushButton(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoB00")
+        font.setPointSize(11)
+        self.startShortcutButton_3.setFont(font)
+        self.startShortcutButton_3.setObjectName("startShortcutButton_3")
+        self.horizontalLayout_51.addWidget(self.startShortcutButton_3)
+        self.verticalLayout_21.addLayout(self.horizontalLayout_51)
+        self.horizontalLayout_11.addLayout(self.verticalLayout_21)
+        self.verticalLayout_15 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_15.setContentsMargins(2, -1, 2, -1)
+        self.verticalLayout_15.setObjectName("verticalLayout_15")
+        self.horizontalLayout_38 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_38.setObjectName("horizontalLayout_38")
+        self.Shortcut_4 = QtWidgets.QLineEdit(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoSB00")
+        font.setPointSize(12)
+        self.Shortcut_4.setFont(font)
+        self.Shortcut_4.setObjectName("Shortcut_4")
+        self.horizontalLayout_38.addWidget(self.Shortcut_4)
+        self.verticalLayout_15.addLayout(self.horizontalLayout_38)
+        self.horizontalLayout_39 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_39.setObjectName("horizontalLayout_39")
+        self.startShortcutButton_4 = QtWidgets.QPushButton(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoB00")
+        font.setPointSize(11)
+        self.startShortcutButton_4.setFont(font)
+        self.startShortcutButton_4.setObjectName("startShortcutButton_4")
+        self.horizontalLayout_39.addWidget(self.startShortcutButton_4)
+        self.verticalLayout_15.addLayout(self.horizontalLayout_39)
+        self.horizontalLayout_11.addLayout(self.verticalLayout_15)
+        self.verticalLayout_20 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_20.setContentsMargins(2, -1, 2, -1)
+        self.verticalLayout_20.setObjectName("verticalLayout_20")
+        self.horizontalLayout_48 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_48.setObjectName("horizontalLayout_48")
+        self.Shortcut_5 = QtWidgets.QLineEdit(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoSB00")
+        font.setPointSize(12)
+        self.Shortcut_5.setFont(font)
+        self.Shortcut_5.setObjectName("Shortcut_5")
+        self.horizontalLayout_48.addWidget(self.Shortcut_5)
+        self.verticalLayout_20.addLayout(self.horizontalLayout_48)
+        self.horizontalLayout_49 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_49.setObjectName("horizontalLayout_49")
+        self.startShortcutButton_5 = QtWidgets.QPushButton(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoB00")
+        font.setPointSize(11)
+        self.startShortcutButton_5.setFont(font)
+        self.startShortcutButton_5.setObjectName("startShortcutButton_5")
+        self.horizontalLayout_49.addWidget(self.startShortcutButton_5)
+        self.verticalLayout_20.addLayout(self.horizontalLayout_49)
+        self.horizontalLayout_11.addLayout(self.verticalLayout_20)
+        self.verticalLayout_16 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_16.setContentsMargins(2, -1, 2, -1)
+        self.verticalLayout_16.setObjectName("verticalLayout_16")
+        self.horizontalLayout_40 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_40.setObjectName("horizontalLayout_40")
+        self.Shortcut_6 = QtWidgets.QLineEdit(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoSB00")
+        font.setPointSize(12)
+        self.Shortcut_6.setFont(font)
+        self.Shortcut_6.setObjectName("Shortcut_6")
+        self.horizontalLayout_40.addWidget(self.Shortcut_6)
+        self.verticalLayout_16.addLayout(self.horizontalLayout_40)
+        self.horizontalLayout_41 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_41.setObjectName("horizontalLayout_41")
+        self.startShortcutButton_6 = QtWidgets.QPushButton(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoB00")
+        font.setPointSize(11)
+        self.startShortcutButton_6.setFont(font)
+        self.startShortcutButton_6.setObjectName("startShortcutButton_6")
+        self.horizontalLayout_41.addWidget(self.startShortcutButton_6)
+        self.verticalLayout_16.addLayout(self.horizontalLayout_41)
+        self.horizontalLayout_11.addLayout(self.verticalLayout_16)
+        self.verticalLayout_19 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_19.setContentsMargins(2, -1, 2, -1)
+        self.verticalLayout_19.setObjectName("verticalLayout_19")
+        self.horizontalLayout_46 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_46.setObjectName("horizontalLayout_46")
+        self.Shortcut_7 = QtWidgets.QLineEdit(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoSB00")
+        font.setPointSize(12)
+        self.Shortcut_7.setFont(font)
+        self.Shortcut_7.setObjectName("Shortcut_7")
+        self.horizontalLayout_46.addWidget(self.Shortcut_7)
+        self.verticalLayout_19.addLayout(self.horizontalLayout_46)
+        self.horizontalLayout_47 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_47.setObjectName("horizontalLayout_47")
+        self.startShortcutButton_7 = QtWidgets.QPushButton(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoB00")
+        font.setPointSize(11)
+        self.startShortcutButton_7.setFont(font)
+        self.startShortcutButton_7.setObjectName("startShortcutButton_7")
+        self.horizontalLayout_47.addWidget(self.startShortcutButton_7)
+        self.verticalLayout_19.addLayout(self.horizontalLayout_47)
+        self.horizontalLayout_11.addLayout(self.verticalLayout_19)
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_3.setContentsMargins(2, -1, 2, -1)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.horizontalLayout_12 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_12.setObjectName("horizontalLayout_12")
+        self.Shortcut_8 = QtWidgets.QLineEdit(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoSB00")
+        font.setPointSize(12)
+        self.Shortcut_8.setFont(font)
+        self.Shortcut_8.setObjectName("Shortcut_8")
+        self.horizontalLayout_12.addWidget(self.Shortcut_8)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_12)
+        self.horizontalLayout_13 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_13.setObjectName("horizontalLayout_13")
+        self.startShortcutButton_8 = QtWidgets.QPushButton(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoB00")
+        font.setPointSize(11)
+        self.startShortcutButton_8.setFont(font)
+        self.startShortcutButton_8.setObjectName("startShortcutButton_8")
+        self.horizontalLayout_13.addWidget(self.startShortcutButton_8)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_13)
+        self.horizontalLayout_11.addLayout(self.verticalLayout_3)
+        self.verticalLayout = QtWidgets.QVBoxLayout()
+        self.verticalLayout.setContentsMargins(2, -1, 2, -1)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.Shortcut_9 = QtWidgets.QLineEdit(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoSB00")
+        font.setPointSize(12)
+        self.Shortcut_9.setFont(font)
+        self.Shortcut_9.setObjectName("Shortcut_9")
+        self.horizontalLayout_3.addWidget(self.Shortcut_9)
+        self.verticalLayout.addLayout(self.horizontalLayout_3)
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.startShortcutButton_9 = QtWidgets.QPushButton(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoB00")
+        font.setPointSize(11)
+        self.startShortcutButton_9.setFont(font)
+        self.startShortcutButton_9.setObjectName("startShortcutButton_9")
+        self.horizontalLayout_4.addWidget(self.startShortcutButton_9)
+        self.verticalLayout.addLayout(self.horizontalLayout_4)
+        self.horizontalLayout_11.addLayout(self.verticalLayout)
+        self.horizontalLayout_9.addLayout(self.horizontalLayout_11)
+        self.watchLayout = QtWidgets.QVBoxLayout()
+        self.watchLayout.setObjectName("watchLayout")
+        self.runAllShortcutsButton = QtWidgets.QPushButton(Form)
+        self.runAllShortcutsButton.setMinimumSize(QtCore.QSize(130, 60))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoB00")
+        font.setPointSize(12)
+        self.runAllShortcutsButton.setFont(font)
+        self.runAllShortcutsButton.setStyleSheet("QPushButton{background-color:rgb(208, 247, 255)}")
+        self.runAllShortcutsButton.setObjectName("runAllShortcutsButton")
+        self.watchLayout.addWidget(self.runAllShortcutsButton)
+        self.watchCheckBox = QtWidgets.QCheckBox(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoB00")
+        font.setPointSize(11)
+        self.watchCheckBox.setFont(font)
+        self.watchCheckBox.setObjectName("watchCheckBox")
+        self.watchLayout.addWidget(self.watchCheckBox)
+        self.watchIntervalSpinBox = QtWidgets.QSpinBox(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoR00")
+        font.setPointSize(11)
+        self.watchIntervalSpinBox.setFont(font)
+        self.watchIntervalSpinBox.setMinimum(5)
+        self.watchIntervalSpinBox.setMaximum(720)
+        self.watchIntervalSpinBox.setSingleStep(5)
+        self.watchIntervalSpinBox.setProperty("value", 30)
+        self.watchIntervalSpinBox.setObjectName("watchIntervalSpinBox")
+        self.watchLayout.addWidget(self.watchIntervalSpinBox)
+        self.watchCategoryComboBox = QtWidgets.QComboBox(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoR00")
+        font.setPointSize(11)
+        self.watchCategoryComboBox.setFont(font)
+        self.watchCategoryComboBox.setObjectName("watchCategoryComboBox")
+        self.watchLayout.addWidget(self.watchCategoryComboBox)
+        self.horizontalLayout_9.addLayout(self.watchLayout)
+        self.gridLayout_2.addLayout(self.horizontalLayout_9, 9, 0, 1, 1)
+        self.conditionLayout = QtWidgets.QHBoxLayout()
+        self.conditionLayout.setContentsMargins(-1, 2, -1, 2)
+        self.conditionLayout.setObjectName("conditionLayout")
+        self.conditionLabel = QtWidgets.QLabel(Form)
+        self.conditionLabel.setMinimumSize(QtCore.QSize(105, 0))
+        self.conditionLabel.setMaximumSize(QtCore.QSize(100, 16777215))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoB00")
+        font.setPointSize(14)
+        self.conditionLabel.setFont(font)
+        self.conditionLabel.setObjectName("conditionLabel")
+        self.conditionLayout.addWidget(self.conditionLabel)
+        self.line_8 = QtWidgets.QFrame(Form)
+        self.line_8.setMinimumSize(QtCore.QSize(20, 0))
+        self.line_8.setFrameShape(QtWidgets.QFrame.VLine)
+        self.line_8.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_8.setObjectName("line_8")
+        self.conditionLayout.addWidget(self.line_8)
+        self.institutionLineEdit = QtWidgets.QLineEdit(Form)
+        self.institutionLineEdit.setMinimumSize(QtCore.QSize(200, 32))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoR00")
+        font.setPointSize(11)
+        self.institutionLineEdit.setFont(font)
+        self.institutionLineEdit.setObjectName("institutionLineEdit")
+        self.conditionLayout.addWidget(self.institutionLineEdit)
+        self.demandInstitutionLineEdit = QtWidgets.QLineEdit(Form)
+        self.demandInstitutionLineEdit.setMinimumSize(QtCore.QSize(200, 32))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoR00")
+        font.setPointSize(11)
+        self.demandInstitutionLineEdit.setFont(font)
+        self.demandInstitutionLineEdit.setObjectName("demandInstitutionLineEdit")
+        self.conditionLayout.addWidget(self.demandInstitutionLineEdit)
+        self.minAmountLineEdit = QtWidgets.QLineEdit(Form)
+        self.minAmountLineEdit.setMinimumSize(QtCore.QSize(150, 32))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoR00")
+        font.setPointSize(11)
+        self.minAmountLineEdit.setFont(font)
+        self.minAmountLineEdit.setObjectName("minAmountLineEdit")
+        self.conditionLayout.addWidget(self.minAmountLineEdit)
+        self.amountRangeLabel = QtWidgets.QLabel(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoM00")
+        font.setPointSize(12)
+        self.amountRangeLabel.setFont(font)
+        self.amountRangeLabel.setObjectName("amountRangeLabel")
+        self.conditionLayout.addWidget(self.amountRangeLabel)
+        self.maxAmountLineEdit = QtWidgets.QLineEdit(Form)
+        self.maxAmountLineEdit.setMinimumSize(QtCore.QSize(150, 32))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoR00")
+        font.setPointSize(11)
+        self.maxAmountLineEdit.setFont(font)
+        self.maxAmountLineEdit.setObjectName("maxAmountLineEdit")
+        self.conditionLayout.addWidget(self.maxAmountLineEdit)
+        self.gridLayout_2.addLayout(self.conditionLayout, 7, 0, 1, 1)
+        self.horizontalLayout_5 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_5.setContentsMargins(-1, 2, -1, 2)
+        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
+        self.label_5 = QtWidgets.QLabel(Form)
+        self.label_5.setMinimumSize(QtCore.QSize(105, 0))
+        self.label_5.setMaximumSize(QtCore.QSize(100, 16777215))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoB00")
+        font.setPointSize(14)
+        self.label_5.setFont(font)
+        self.label_5.setObjectName("label_5")
+        self.horizontalLayout_5.addWidget(self.label_5)
+        self.line_5 = QtWidgets.QFrame(Form)
+        self.line_5.setMinimumSize(QtCore.QSize(20, 0))
+        self.line_5.setFrameShape(QtWidgets.QFrame.VLine)
+        self.line_5.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_5.setObjectName("line_5")
+        self.horizontalLayout_5.addWidget(self.line_5)
+        self.search_keyword = QtWidgets.QLineEdit(Form)
+        self.search_keyword.setMinimumSize(QtCore.QSize(0, 40))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoR00")
+        font.setPointSize(12)
+        self.search_keyword.setFont(font)
+        self.search_keyword.setObjectName("search_keyword")
+        self.horizontalLayout_5.addWidget(self.search_keyword)
+        self.comboBox = QtWidgets.QComboBox(Form)
+        self.comboBox.setMinimumSize(QtCore.QSize(120, 40))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoB00")
+        font.setPointSize(14)
+        self.comboBox.setFont(font)
+        self.comboBox.setStyleSheet("QComboBox{color: #000;background-color:rgb(255, 255, 0)}")
+        self.comboBox.setObjectName("comboBox")
+        self.horizontalLayout_5.addWidget(self.comboBox)
+        self.localSearchCheckBox = QtWidgets.QCheckBox(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoB00")
+        font.setPointSize(12)
+        self.localSearchCheckBox.setFont(font)
+        self.localSearchCheckBox.setObjectName("localSearchCheckBox")
+        self.horizontalLayout_5.addWidget(self.localSearchCheckBox)
+        self.refineCheckBox = QtWidgets.QCheckBox(Form)
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoB00")
+        font.setPointSize(12)
+        self.refineCheckBox.setFont(font)
+        self.refineCheckBox.setObjectName("refineCheckBox")
+        self.horizontalLayout_5.addWidget(self.refineCheckBox)
+        self.historyComboBox = QtWidgets.QComboBox(Form)
+        self.historyComboBox.setMinimumSize(QtCore.QSize(220, 40))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoR00")
+        font.setPointSize(11)
+        self.historyComboBox.setFont(font)
+        self.historyComboBox.setSizeAdjustPolicy(QtWidgets.QComboBox.AdjustToMinimumContentsLengthWithIcon)
+        self.historyComboBox.setMinimumContentsLength(18)
+        self.historyComboBox.setObjectName("historyComboBox")
+        self.horizontalLayout_5.addWidget(self.historyComboBox)
+        self.label_10 = QtWidgets.QLabel(Form)
+        self.label_10.setMinimumSize(QtCore.QSize(76, 0))
+        font = QtGui.QFont()
+        font.setFamily("AppleSDGothicNeoSB00")
+        font.setPointSize(12)
+        font.setItalic(False)
+        font.setUnderline(False)
+        font.setStrikeOut(False)
+        self.label_10.setFont(font)
+        self.label_10.setText("")
+        self.label_10.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_10.setObjectName("label_10")
+        self.horizontalLayout_5.addWidget(self.label_10)
+        self.gridLayout_2.addLayout(self.horizontalLayout_5, 6, 0, 1, 1)
+        self.gridLayout.addLayout(self.gridLayout_2, 0, 0, 1, 1)
+
+        self.retranslateUi(Form)
+        QtCore.QMetaObject.connectSlotsByName(Form)
+
+    def retranslateUi(self, Form):
+        _translate = QtCore.QCoreApplication.translate
+        Form.setWindowTitle(_translate("Form", "Form"))
+        self.label_7.setText(_translate("Form", "API 인증키"))
+        self.label_4.setText(_translate("Form", "API 인증키 완료 예정일    "))
+        self.label_2.setText(_translate("Form", "입찰공고 조회"))
+        self.label_3.setText(_translate("Form", "시작일"))
+        self.search_startdate.setDisplayFormat(_translate("Form", "yyyy-MM-dd  AP h:mm"))
+        self.label_6.setText(_translate("Form", "~  종료일"))
+        self.search_enddate.setDisplayFormat(_translate("Form", "yyyy-MM-dd  AP h:mm"))
+        self.threeweeksButton.setText(_translate("Form", "오늘로부터 3주 전까지"))
+        self.label_11.setText(_translate("Form", "※ 31일이 넘는 기간은 나누어 검색합니다.     "))
+        self.filterLabel.setText(_translate("Form", "결과 내 필터"))
+        self.filterLineEdit.setPlaceholderText(_translate("Form", "예) 의왕|서울 -유지보수,  >= 3억,  < 2026-11-01  (헤더를 누르면 정렬)"))
+        self.startButton.setText(_translate("Form", "검색 시작"))
+        self.cancelButton.setToolTip(_translate("Form", "진행 중인 검색을 멈춥니다. (검색 중에 새로 검색하면 이전 검색은 자동으로 취소됩니다)"))
+        self.cancelButton.setText(_translate("Form", "검색 취소"))
+        self.resetButton.setText(_translate("Form", "리셋"))
+        self.saveButton.setText(_translate("Form", "엑셀 저장"))
+        self.noticeButton.setText(_translate("Form", "프로그램 정보"))
+        self.endButton.setText(_translate("Form", "종료"))
+        self.search_situation.setText(_translate("Form", "검색결과 표시"))
+        self.searchProgressBar.setFormat(_translate("Form", "%v / %m건"))
+        self.label_13.setText(_translate("Form", "※ 아래 검색 결과에서 마우스 오른쪽 키를 누르면 [ 규격 문서 ] 다운로드가 가능합니다.     "))
+        self.label.setText(_translate("Form", "<html><head/><body><p align=\"center\"><span style=\" font-size:18pt;\">나라장터 용역 입찰공고 검색기</span></p></body></html>"))
+        self.label_9.setText(_translate("Form", "[ LJH Ver.1 ]"))
+        self.label_12.setText(_translate("Form", "저장단어 검색"))
+        self.startShortcutButton_0.setText(_translate("Form", "검색 시작"))
+        self.startShortcutButton_1.setText(_translate("Form", "검색 시작"))
+        self.startShortcutButton_2.setText(_translate("Form", "검색 시작"))
+        self.startShortcutButton_3.setText(_translate("Form", "검색 시작"))
+        self.startShortcutButton_4.setText(_translate("Form", "검색 시작"))
+        self.startShortcutButton_5.setText(_translate("Form", "검색 시작"))
+        self.startShortcutButton_6.setText(_translate("Form", "검색 시작"))
+        self.startShortcutButton_7.setText(_translate("Form", "검색 시작"))
+        self.startShortcutButton_8.setText(_translate("Form", "검색 시작"))
+        self.startShortcutButton_9.setText(_translate("Form", "검색 시작"))
+        self.runAllShortcutsButton.setText(_translate("Form", "저장단어\n"
+"전체 검색"))
+        self.watchCheckBox.setToolTip(_translate("Form", "저장단어를 정해진 간격마다 확인해, 마지막 확인 이후에 새로 등록된 공고만 알려줍니다.\n"
+"(검색 유형 칸에서 고른 유형, 통합이면 입찰공고·사전규격 모두)"))
+        self.watchCheckBox.setText(_translate("Form", "저장단어 감시"))
+        self.watchIntervalSpinBox.setToolTip(_translate("Form", "저장단어 감시 간격"))
+        self.watchIntervalSpinBox.setSuffix(_translate("Form", "분마다"))
+        self.watchCategoryComboBox.setToolTip(_translate("Form", "감시할 검색 유형 (위의 검색 유형 선택과 따로 기억합니다)"))
+        self.conditionLabel.setText(_translate("Form", "검색 조건"))
+        self.institutionLineEdit.setToolTip(_translate("Form", "공고기관명 조건입니다. 검색어와 같은 문법(\'a|b\', \'-제외\')을 씁니다.\n"
+"입찰공고는 단어 하나이면 API 요청에 넣어 받는 양을 줄이고, 사전규격은 받은 뒤 거릅니다."))
+        self.institutionLineEdit.setPlaceholderText(_translate("Form", "공고기관명"))
+        self.demandInstitutionLineEdit.setToolTip(_translate("Form", "수요기관명 조건입니다. 검색어와 같은 문법(\'a|b\', \'-제외\')을 씁니다.\n"
+"단어 하나이면 API 요청에 넣어 받는 양을 줄입니다."))
+        self.demandInstitutionLineEdit.setPlaceholderText(_translate("Form", "수요기관명"))
+        self.minAmountLineEdit.setToolTip(_translate("Form", "금액 범위입니다. (예: 3억, 5000만, 150000000)\n"
+"입찰공고는 추정가격 기준으로 API 요청에 넣고, 사전규격은 배정예산금액 기준으로 받은 뒤 거릅니다.\n"
+"금액이 없는 공고는 빠집니다."))
+        self.minAmountLineEdit.setPlaceholderText(_translate("Form", "최소 금액 (예: 1억)"))
+        self.amountRangeLabel.setText(_translate("Form", "~"))
+        self.maxAmountLineEdit.setToolTip(_translate("Form", "금액 범위입니다. (예: 3억, 5000만, 150000000)\n"
+"입찰공고는 추정가격 기준으로 API 요청에 넣고, 사전규격은 배정예산금액 기준으로 받은 뒤 거릅니다.\n"
+"금액이 없는 공고는 빠집니다."))
+        self.maxAmountLineEdit.setPlaceholderText(_translate("Form", "최대 금액 (예: 10억)"))
+        self.label_5.setText(_translate("Form", "검색어"))
+        self.localSearchCheckBox.setToolTip(_translate("Form", "API를 호출하지 않고, 지금까지 내려받은 공고에서 검색합니다.\n"
+"여러 단어는 모두 포함, \'a|b\'는 둘 중 하나, \'-단어\'는 제외(제목 기준),\n"
+"\"큰따옴표\"는 구문, 단어*는 접두어 검색입니다."))
+        self.localSearchCheckBox.setText(_translate("Form", "로컬 검색"))
+        self.refineCheckBox.setToolTip(_translate("Form", "검색어를 고치면 입력을 멈춘 뒤 2초 후, API를 호출하지 않고\n"
+"이미 받아 둔 공고에서 다시 걸러 보여줍니다. (새로 받으려면 Enter)"))
+        self.refineCheckBox.setText(_translate("Form", "입력하며 좁히기"))
+        self.historyComboBox.setToolTip(_translate("Form", "최근 검색을 고르면 API를 다시 호출하지 않고, 그때 결과를 로컬 저장소에서 불러옵니다."))